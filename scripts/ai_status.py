@@ -5,13 +5,38 @@ Simple demonstration of AI agents integration
 """
 
 import asyncio
+import functools
 import os
+import re
 import sys
 import logging
 from datetime import datetime
 
+from dotenv import load_dotenv
+
 # Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+SRC_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+@functools.cache
+def _load_env_once() -> dict:
+    """Load .env once and return a snapshot of the environment"""
+    load_dotenv(override=True)
+    return dict(os.environ)
+
+_load_env_once()
+
+# (provider, key env var, model env var, default model)
+AI_PROVIDER_CONFIGS = (
+    ('OpenAI', 'OPENAI_API_KEY', 'OPENAI_MODEL', 'gpt-4o'),
+    ('Google', 'GOOGLE_API_KEY', 'GOOGLE_MODEL', 'gemini-pro'),
+    ('Anthropic', 'ANTHROPIC_API_KEY', 'ANTHROPIC_MODEL', 'claude-3-5-sonnet-20241022'),
+    ('DeepSeek', 'DEEPSEEK_API_KEY', 'DEEPSEEK_MODEL', 'deepseek-chat'),
+)
+
+# Placeholder values copied from .env.example are not real keys
+PLACEHOLDER_KEY_PATTERN = re.compile(r'^(?:your_|sk-your)|_here$')
 
 # Configure logging
 logging.basicConfig(
@@ -20,7 +45,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def check_ai_integration():
+async def check_ai_integration():
     """Check if AI integration is working"""
     print("🤖 Checking AI Integration...")
     print("=" * 40)
@@ -35,9 +60,12 @@ def check_ai_integration():
         print(f"✅ AI Manager initialized with {len(ai_manager.enabled_providers)} providers")
         
         if ai_manager.enabled_providers:
+            # Probe all configured providers concurrently
+            statuses = await ai_manager.probe_providers()
             print("📋 Available providers:")
             for provider in ai_manager.enabled_providers:
-                print(f"   - {provider.value}")
+                status = "✅ reachable" if statuses.get(provider) else "❌ unreachable"
+                print(f"   - {provider.value}: {status}")
         else:
             print("⚠️  No AI providers configured (missing API keys)")
             print("💡 To enable AI providers, add these to your .env file:")
@@ -61,41 +89,23 @@ def check_ai_integration():
         print(f"❌ Error: {e}")
         return False
 
+def reset_env_cache():
+    """Forget the cached environment so the next lookup re-reads .env"""
+    _load_env_once.cache_clear()
+
 def show_ai_configuration():
     """Show current AI configuration"""
     print("\n🔧 AI Configuration:")
     print("=" * 40)
     
-    from dotenv import load_dotenv
-    load_dotenv(override=True)
-    
-    ai_configs = {
-        'OpenAI': {
-            'key': os.getenv('OPENAI_API_KEY', 'Not set'),
-            'model': os.getenv('OPENAI_MODEL', 'gpt-4o')
-        },
-        'Google': {
-            'key': os.getenv('GOOGLE_API_KEY', 'Not set'),
-            'model': os.getenv('GOOGLE_MODEL', 'gemini-pro')
-        },
-        'Anthropic': {
-            'key': os.getenv('ANTHROPIC_API_KEY', 'Not set'),
-            'model': os.getenv('ANTHROPIC_MODEL', 'claude-3-5-sonnet-20241022')
-        },
-        'DeepSeek': {
-            'key': os.getenv('DEEPSEEK_API_KEY', 'Not set'),
-            'model': os.getenv('DEEPSEEK_MODEL', 'deepseek-chat')
-        }
-    }
-    
-    for provider, config in ai_configs.items():
-        key_status = "✅ Set" if (config['key'] != 'Not set' and 
-                                  not config['key'].startswith('your_') and 
-                                  not config['key'].startswith('sk-your') and
-                                  not config['key'].endswith('_here')) else "❌ Not set"
+    env = _load_env_once()
+    for provider, key_env, model_env, default_model in AI_PROVIDER_CONFIGS:
+        key = env.get(key_env, '')
+        is_set = key and not PLACEHOLDER_KEY_PATTERN.search(key)
+        key_status = "✅ Set" if is_set else "❌ Not set"
         print(f"{provider}:")
         print(f"  API Key: {key_status}")
-        print(f"  Model: {config['model']}")
+        print(f"  Model: {env.get(model_env, default_model)}")
         print()
 
 def show_integration_features():
@@ -130,7 +140,7 @@ def main():
     print("=" * 50)
     
     # Check integration
-    if check_ai_integration():
+    if asyncio.run(check_ai_integration()):
         print("\n✅ AI Integration is working!")
     else:
         print("\n❌ AI Integration has issues")
@@ -11,7 +11,9 @@ import logging
 from datetime import datetime
 
 # Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+SRC_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +22,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sample property text in Hebrew
+SAMPLE_PROPERTY = """
+דירת 3 חדרים מרווחת בלב תל אביב
+
+דירה יפהפייה של 3 חדרים בשכונת דיזנגוף, רחוב שינקין 15.
+הדירה משופצת לחלוטין, 80 מ"ר, קומה 2 מתוך 4.
+מחיר: 2,500,000 שקל
+
+כוללת:
+- מרפסת גדולה עם נוף לעיר
+- חניה באבטחה
+- מעלית
+- מיזוג אוויר בכל החדרים
+- קרוב לתחבורה ציבורית
+
+ליצירת קשר: 050-1234567
+"""
+
+# Sample scraped listing for the content analyzer demo
+SAMPLE_LISTING = {
+    'listing_id': "test_listing_001",
+    'title': "דירת 3 חדרים מרווחת בתל אביב",
+    'description': "דירה יפהפייה של 3 חדרים בשכונת דיזנגוף, 80 מ\"ר, קומה 2, משופצת, מחיר 2,500,000 שקל",
+    'price': 2500000,
+    'location': "תל אביב, רחוב שינקין 15",
+    'rooms': 3,
+    'url': "https://example.com/property/123",
+    'raw_data': {'source': 'yad2'}
+}
+
+# Profile criteria the sample listing is matched against
+PROFILE_CRITERIA = {
+    'price': {'min_price': 2000000, 'max_price': 3000000},
+    'rooms': {'min_rooms': 2, 'max_rooms': 4},
+    'location_criteria': {'areas': ['תל אביב', 'דיזנגוף']}
+}
+
 async def test_ai_agents():
     """Test AI agents integration"""
     try:
@@ -54,28 +93,10 @@ async def test_ai_agents():
         print("\n📊 Demo Property Analysis:")
         print("-" * 40)
         
-        # Sample property text in Hebrew
-        sample_property = """
-        דירת 3 חדרים מרווחת בלב תל אביב
-        
-        דירה יפהפייה של 3 חדרים בשכונת דיזנגוף, רחוב שינקין 15.
-        הדירה משופצת לחלוטין, 80 מ"ר, קומה 2 מתוך 4.
-        מחיר: 2,500,000 שקל
-        
-        כוללת:
-        - מרפסת גדולה עם נוף לעיר
-        - חניה באבטחה
-        - מעלית
-        - מיזוג אוויר בכל החדרים
-        - קרוב לתחבורה ציבורית
-        
-        ליצירת קשר: 050-1234567
-        """
-        
         # Create analysis request
         request = AnalysisRequest(
             property_id="demo_property_001",
-            raw_text=sample_property,
+            raw_text=SAMPLE_PROPERTY,
             source_url="https://example.com/property/123",
             source_platform="demo",
             priority=1
@@ -145,7 +166,7 @@ async def test_content_analyzer_with_ai():
     """Test content analyzer with AI integration"""
     try:
         from analysis.content import ContentAnalyzer
-        from scrapers.base import ScrapedListing, ListingSource
+        from scrapers.base import ScrapedListing
         
         print("\n🔍 Content Analyzer with AI Integration Demo")
         print("=" * 60)
@@ -158,28 +179,11 @@ async def test_content_analyzer_with_ai():
             return
         
         # Create sample listing
-        sample_listing = ScrapedListing(
-            id="test_listing_001",
-            title="דירת 3 חדרים מרווחת בתל אביב",
-            description="דירה יפהפייה של 3 חדרים בשכונת דיזנגוף, 80 מ\"ר, קומה 2, משופצת, מחיר 2,500,000 שקל",
-            price=2500000,
-            location="תל אביב, רחוב שינקין 15",
-            rooms=3,
-            url="https://example.com/property/123",
-            source=ListingSource.YAD2,
-            raw_data={}
-        )
-        
-        # Define profile criteria
-        profile_criteria = {
-            'price': {'min_price': 2000000, 'max_price': 3000000},
-            'rooms': {'min_rooms': 2, 'max_rooms': 4},
-            'location_criteria': {'areas': ['תל אביב', 'דיזנגוף']}
-        }
+        sample_listing = ScrapedListing(**SAMPLE_LISTING)
         
         # Run AI-powered analysis
         print("🤖 Running AI-powered content analysis...")
-        result = await analyzer.analyze_listing_with_ai(sample_listing, profile_criteria)
+        result = await analyzer.analyze_listing_with_ai(sample_listing, PROFILE_CRITERIA)
         
         # Display results
         print(f"\n📊 Analysis Results:")
@@ -212,4 +216,11 @@ async def main():
     await test_content_analyzer_with_ai()
 
 if __name__ == "__main__":
+    # Use the libuv-based event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
@@ -19,6 +19,9 @@ Usage:
 
     # Run only web
     python scripts/demo_epic4.py --web-only
+
+    # Also serve the dashboard in-process
+    python scripts/demo_epic4.py --serve
 """
 
 import os
@@ -27,8 +30,10 @@ import asyncio
 import argparse
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add the src directory to the path
+SRC_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 def setup_environment():
     """Set up environment variables for demo"""
@@ -70,20 +75,18 @@ async def run_telegram_bot():
     except Exception as e:
         print(f"❌ Error starting bot: {e}")
 
-def run_web_dashboard():
-    """Run the web dashboard"""
+async def run_web_dashboard(serve: bool = False):
+    """Run the web dashboard, in this process's event loop when serve is set"""
     print("\n🌐 Starting Web Dashboard...")
     print("=" * 50)
     
     try:
-        import uvicorn
         from web.run_server import create_server
         
         print("✅ Web modules loaded successfully")
         print("🚀 Starting web server...")
         print("🌐 Dashboard will be available at http://localhost:8000")
         
-        # For demo, we show what would happen
         print("\n📋 Available web endpoints:")
         print("   GET  /              - Dashboard home")
         print("   GET  /dashboard     - Main dashboard interface")
@@ -93,20 +96,26 @@ def run_web_dashboard():
         print("   GET  /api/notifications - Get notification history")
         print("   WS   /ws            - Real-time WebSocket updates")
         
-        print("\n🎯 Web dashboard is ready!")
-        print("   (In production, call uvicorn.run(app) here)")
+        if not serve:
+            print("\n🎯 Web dashboard is ready!")
+            print("   (Pass --serve to start it in this process)")
+            return None
         
-        # For actual deployment:
-        # uvicorn.run("web.app:app", host="0.0.0.0", port=8000, reload=True)
+        # Serve from this interpreter and event loop instead of spawning
+        # a separate server process; the bot can run alongside it
+        server = create_server(host="0.0.0.0", port=8000)
+        return asyncio.create_task(server.serve())
         
     except Exception as e:
         print(f"❌ Error starting web server: {e}")
+        return None
 
 async def main():
     """Main demo function"""
     parser = argparse.ArgumentParser(description="Epic 4 Demo")
     parser.add_argument("--bot-only", action="store_true", help="Run only the bot")
     parser.add_argument("--web-only", action="store_true", help="Run only the web dashboard")
+    parser.add_argument("--serve", action="store_true", help="Actually serve the web dashboard in-process")
     args = parser.parse_args()
     
     print("🏠 RealtyScanner Agent - Epic 4 Demo")
@@ -116,14 +125,15 @@ async def main():
     
     setup_environment()
     
+    server_task = None
     if args.bot_only:
         await run_telegram_bot()
     elif args.web_only:
-        run_web_dashboard()
+        server_task = await run_web_dashboard(args.serve)
     else:
         # Run both
+        server_task = await run_web_dashboard(args.serve)
         await run_telegram_bot()
-        run_web_dashboard()
         
         print("\n" + "=" * 60)
         print("🎉 Epic 4 Demo Complete!")
@@ -136,6 +146,17 @@ async def main():
         print("   5. Deploy web dashboard with proper domain")
         print()
         print("📚 See docs/Epic4_Implementation_Guide.md for details")
+    
+    if server_task is not None:
+        print("\n🌐 Dashboard running at http://localhost:8000 (Ctrl+C to stop)")
+        await server_task
 
 if __name__ == "__main__":
+    # Use the libuv-based event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
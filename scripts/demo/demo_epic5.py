@@ -6,13 +6,16 @@ and Telegram is used purely for notifications.
 """
 
 import asyncio
+import importlib.util
 import os
 import sys
 import logging
 from datetime import datetime
 
 # Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+SRC_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 # Configure logging
 logging.basicConfig(
@@ -21,17 +24,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Management API endpoints shown by the demo: (method, path, description)
+API_ENDPOINTS = (
+    ("GET", "/api/v1/profiles", "List all search profiles"),
+    ("POST", "/api/v1/profiles", "Create new search profile"),
+    ("PUT", "/api/v1/profiles/{id}", "Update search profile"),
+    ("DELETE", "/api/v1/profiles/{id}", "Delete search profile"),
+    ("GET", "/api/v1/telegram/status", "Check Telegram bot status"),
+    ("POST", "/api/v1/telegram/setup", "Configure Telegram chat ID"),
+    ("POST", "/api/v1/telegram/test", "Send test notification"),
+    ("GET", "/api/v1/facebook/status", "Check Facebook integration"),
+    ("POST", "/api/v1/facebook/login", "Facebook authentication"),
+    ("GET", "/api/v1/yad2/config", "Get Yad2 configuration"),
+    ("POST", "/api/v1/yad2/config", "Update Yad2 settings"),
+    ("GET", "/api/v1/notifications", "Get notification history"),
+    ("GET", "/api/v1/analytics/summary", "Get analytics data"),
+    ("GET", "/api/v1/system/status", "System status overview"),
+)
+
+ENDPOINTS_TABLE = "\n".join(
+    f"   {method:6} {endpoint:30} - {description}"
+    for method, endpoint, description in API_ENDPOINTS
+)
+
+HEADER = f"""{"=" * 80}
+🏠 RealtyScanner Epic 5 - Web-Only Management Demo
+{"=" * 80}
+Architecture Changes:
+✅ Telegram Bot: NOTIFICATION-ONLY (no interactive commands)
+✅ Web Dashboard: COMPLETE MANAGEMENT (all settings & configuration)
+✅ Unified Control: Everything managed through web interface
+{"=" * 80}
+"""
+
 def print_header():
     """Print demo header"""
-    print("=" * 80)
-    print("🏠 RealtyScanner Epic 5 - Web-Only Management Demo")
-    print("=" * 80)
-    print("Architecture Changes:")
-    print("✅ Telegram Bot: NOTIFICATION-ONLY (no interactive commands)")
-    print("✅ Web Dashboard: COMPLETE MANAGEMENT (all settings & configuration)")
-    print("✅ Unified Control: Everything managed through web interface")
-    print("=" * 80)
-    print()
+    print(HEADER)
 
 async def demo_notification_bot():
     """Demo the new notification-only Telegram bot"""
@@ -79,10 +107,11 @@ def demo_web_interface():
     print("-" * 50)
     
     try:
-        from web.app import create_app
-        
-        app = create_app()
-        print("✅ FastAPI web application created")
+        # Only check that the app module is importable - building the
+        # FastAPI app here would set up middleware and routes for nothing
+        if importlib.util.find_spec('web.app') is None:
+            raise ImportError("web.app module not found")
+        print("✅ FastAPI web application available")
         print("📋 Available management features:")
         print("   • Profile Management (create, edit, delete search profiles)")
         print("   • Telegram Configuration (chat ID setup and testing)")
@@ -109,25 +138,7 @@ def demo_api_endpoints():
     print("🔧 API Endpoints for Complete Management")
     print("-" * 50)
     
-    endpoints = [
-        ("GET", "/api/v1/profiles", "List all search profiles"),
-        ("POST", "/api/v1/profiles", "Create new search profile"),
-        ("PUT", "/api/v1/profiles/{id}", "Update search profile"),
-        ("DELETE", "/api/v1/profiles/{id}", "Delete search profile"),
-        ("GET", "/api/v1/telegram/status", "Check Telegram bot status"),
-        ("POST", "/api/v1/telegram/setup", "Configure Telegram chat ID"),
-        ("POST", "/api/v1/telegram/test", "Send test notification"),
-        ("GET", "/api/v1/facebook/status", "Check Facebook integration"),
-        ("POST", "/api/v1/facebook/login", "Facebook authentication"),
-        ("GET", "/api/v1/yad2/config", "Get Yad2 configuration"),
-        ("POST", "/api/v1/yad2/config", "Update Yad2 settings"),
-        ("GET", "/api/v1/notifications", "Get notification history"),
-        ("GET", "/api/v1/analytics/summary", "Get analytics data"),
-        ("GET", "/api/v1/system/status", "System status overview")
-    ]
-    
-    for method, endpoint, description in endpoints:
-        print(f"   {method:6} {endpoint:30} - {description}")
+    print(ENDPOINTS_TABLE)
     
     print("✅ All API endpoints available for web interface")
     print()
@@ -148,8 +159,7 @@ def demo_architecture_benefits():
         "🔄 Maintenance: Easier to update and maintain separate concerns"
     ]
     
-    for benefit in benefits:
-        print(f"   {benefit}")
+    print("\n".join(f"   {benefit}" for benefit in benefits))
     
     print()
 
@@ -171,8 +181,7 @@ def demo_user_workflow():
         "10. 🔄 Manage everything through web interface only"
     ]
     
-    for step in workflow:
-        print(f"   {step}")
+    print("\n".join(f"   {step}" for step in workflow))
     
     print("\n💡 Key Point: Users NEVER interact with Telegram bot directly!")
     print("   All configuration and management happens through the web interface.")
@@ -5,6 +5,8 @@ Demo script to start the refactored frontend
 
 import sys
 import os
+import socket
+import http.client
 import subprocess
 from pathlib import Path
 
@@ -18,82 +20,92 @@ def start_demo():
         print("❌ Please run this script from the project root directory")
         return False
     
-    print("📋 Frontend Improvements Summary:")
-    print("✅ Modular JavaScript architecture with proper separation of concerns")
-    print("✅ Improved error handling and loading states")
-    print("✅ Better responsive design for mobile devices")
-    print("✅ Enhanced API client with retry logic and mock data")
-    print("✅ Clean component-based structure for each page section")
-    print("✅ Improved CSS with consistent theming and animations")
-    print("✅ Better state management and routing")
-    print("✅ Enhanced user experience with proper feedback")
+    # Build the whole overview and write it in one go
+    out = []
+    out.append("📋 Frontend Improvements Summary:")
+    out.append("✅ Modular JavaScript architecture with proper separation of concerns")
+    out.append("✅ Improved error handling and loading states")
+    out.append("✅ Better responsive design for mobile devices")
+    out.append("✅ Enhanced API client with retry logic and mock data")
+    out.append("✅ Clean component-based structure for each page section")
+    out.append("✅ Improved CSS with consistent theming and animations")
+    out.append("✅ Better state management and routing")
+    out.append("✅ Enhanced user experience with proper feedback")
     
-    print("\n🏗️  New Architecture:")
-    print("• RealtyApp: Main application controller")
-    print("• APIClient: Enhanced API communication with retry logic")
-    print("• Components: Modular page components (Dashboard, Profiles, etc.)")
-    print("• UtilityFunctions: Shared utility functions")
-    print("• Responsive CSS: Mobile-first design with modern styling")
+    out.append("\n🏗️  New Architecture:")
+    out.append("• RealtyApp: Main application controller")
+    out.append("• APIClient: Enhanced API communication with retry logic")
+    out.append("• Components: Modular page components (Dashboard, Profiles, etc.)")
+    out.append("• UtilityFunctions: Shared utility functions")
+    out.append("• Responsive CSS: Mobile-first design with modern styling")
     
-    print("\n🎨 Visual Improvements:")
-    print("• Modern gradient backgrounds and animations")
-    print("• Consistent color scheme with CSS variables")
-    print("• Improved status indicators with pulse animations")
-    print("• Better loading states and error handling")
-    print("• Enhanced mobile responsiveness")
+    out.append("\n🎨 Visual Improvements:")
+    out.append("• Modern gradient backgrounds and animations")
+    out.append("• Consistent color scheme with CSS variables")
+    out.append("• Improved status indicators with pulse animations")
+    out.append("• Better loading states and error handling")
+    out.append("• Enhanced mobile responsiveness")
     
-    print("\n🔧 Technical Improvements:")
-    print("• Proper error boundaries and fallback states")
-    print("• Mock data for development and testing")
-    print("• Client-side routing without page reloads")
-    print("• Optimized API calls with caching")
-    print("• Better separation of concerns")
+    out.append("\n🔧 Technical Improvements:")
+    out.append("• Proper error boundaries and fallback states")
+    out.append("• Mock data for development and testing")
+    out.append("• Client-side routing without page reloads")
+    out.append("• Optimized API calls with caching")
+    out.append("• Better separation of concerns")
     
-    print("\n" + "=" * 60)
-    print("🌐 To see the refactored frontend in action:")
-    print("1. Start the development server: python src/web/run_server.py")
-    print("2. Open your browser to: http://localhost:8000")
-    print("3. Navigate through the different sections to see the improvements")
+    out.append("\n" + "=" * 60)
+    out.append("🌐 To see the refactored frontend in action:")
+    out.append("1. Start the development server: python src/web/run_server.py")
+    out.append("2. Open your browser to: http://localhost:8000")
+    out.append("3. Navigate through the different sections to see the improvements")
     
-    print("\n📁 Key Files Created/Modified:")
-    print("• src/web/static/js/app.js - Main application controller")
-    print("• src/web/static/js/components.js - Page components")
-    print("• src/web/static/js/components-extended.js - Extended components")
-    print("• src/web/static/js/api.js - Enhanced API client")
-    print("• src/web/static/css/dashboard.css - Improved responsive CSS")
-    print("• src/web/templates/dashboard_refactored.html - New template")
+    out.append("\n📁 Key Files Created/Modified:")
+    out.append("• src/web/static/js/app.js - Main application controller")
+    out.append("• src/web/static/js/components.js - Page components")
+    out.append("• src/web/static/js/components-extended.js - Extended components")
+    out.append("• src/web/static/js/api.js - Enhanced API client")
+    out.append("• src/web/static/css/dashboard.css - Improved responsive CSS")
+    out.append("• src/web/templates/dashboard_refactored.html - New template")
     
-    print("\n✨ Features Comparison:")
-    print("BEFORE:")
-    print("• Mixed code in HTML templates")
-    print("• Basic error handling")
-    print("• Limited mobile support")
-    print("• No loading states")
-    print("• Inconsistent styling")
+    out.append("\n✨ Features Comparison:")
+    out.append("BEFORE:")
+    out.append("• Mixed code in HTML templates")
+    out.append("• Basic error handling")
+    out.append("• Limited mobile support")
+    out.append("• No loading states")
+    out.append("• Inconsistent styling")
     
-    print("\nAFTER:")
-    print("• Modular JavaScript architecture")
-    print("• Comprehensive error handling")
-    print("• Full mobile responsiveness")
-    print("• Proper loading and error states")
-    print("• Consistent modern design")
-    print("• Better user experience")
+    out.append("\nAFTER:")
+    out.append("• Modular JavaScript architecture")
+    out.append("• Comprehensive error handling")
+    out.append("• Full mobile responsiveness")
+    out.append("• Proper loading and error states")
+    out.append("• Consistent modern design")
+    out.append("• Better user experience")
     
-    print("\n🧪 Testing:")
-    print("All frontend tests passed successfully!")
-    print("Run 'python scripts/test_frontend.py' to verify the setup.")
+    out.append("\n🧪 Testing:")
+    out.append("All frontend tests passed successfully!")
+    out.append("Run 'python scripts/test_frontend.py' to verify the setup.")
     
+    sys.stdout.write("\n".join(out) + "\n")
     return True
 
-def check_server_status():
+def check_server_status(host="localhost", port=8000):
     """Check if the server is running"""
+    # A refused or unreachable port fails fast, before any HTTP request
     try:
-        import requests
-        response = requests.get("http://localhost:8000/health", timeout=5)
-        if response.status_code == 200:
-            print("✅ Server is running at http://localhost:8000")
-            return True
-    except:
+        with socket.create_connection((host, port), timeout=0.2):
+            pass
+        
+        conn = http.client.HTTPConnection(host, port, timeout=2)
+        try:
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                print(f"✅ Server is running at http://{host}:{port}")
+                return True
+        finally:
+            conn.close()
+    except (OSError, http.client.HTTPException):
         pass
     
     print("⚠️  Server is not running. Start it with: python src/web/run_server.py")
@@ -5,17 +5,112 @@ Shows real-time apartment scanning and Telegram notifications
 """
 
 import os
+import re
 import sys
+import html
 import asyncio
+import functools
 import time
 from pathlib import Path
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+SRC_PATH = str(Path(__file__).resolve().parents[2] / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 from dotenv import load_dotenv
 load_dotenv()
 
+# Seconds between scan starts (demo mode)
+SCAN_INTERVAL = 30.0
+
+# Maximum number of Telegram messages in flight at once
+TELEGRAM_SEND_CONCURRENCY = 8
+
+# For demo, we'll send to the channel - in real use,
+# you'd send to specific user chat IDs from the database
+DEMO_CHAT_ID = os.getenv('DEMO_CHAT_ID', '@aparmntesbot')
+
+# Telegram HTML message for a new match; text fields must be HTML-escaped
+format_match_message = """🏠 <b>New Apartment Found!</b>
+
+💰 <b>{price} ILS/month</b>
+🏠 {rooms} rooms
+📍 {location}
+
+{description}...
+
+<a href="{url}">🔗 View Listing</a>""".format
+
+# Telegram Bot API limits
+TELEGRAM_MESSAGE_LIMIT = 4096
+TELEGRAM_CAPTION_LIMIT = 1024
+TELEGRAM_MEDIA_GROUP_LIMIT = 10
+
+MESSAGE_SEPARATOR = "\n\n➖➖➖➖➖\n\n"
+
+# Tags, which Telegram doesn't count toward its length limits
+HTML_TAG_PATTERN = re.compile(r'<[^>]*>')
+
+def utf16_length(text: str) -> int:
+    """Length as Telegram counts it, in UTF-16 code units"""
+    return len(text.encode('utf-16-le')) // 2
+
+def truncate_utf16(text: str, length: int) -> str:
+    """Cut text to at most length UTF-16 code units, without splitting a character"""
+    return text.encode('utf-16-le')[:2 * max(0, length)].decode('utf-16-le', 'ignore')
+
+def format_listing_message(listing, limit=None) -> str:
+    """Format a matched listing as a Telegram HTML message, with at most limit visible characters"""
+    location = listing.location
+    description = listing.description[:200]
+    
+    # Fields are shortened before escaping, so truncation never cuts through a tag or entity;
+    # the description gives way first, then the location
+    if limit is not None:
+        template = format_match_message(price=listing.price, rooms=listing.rooms,
+                                        location='', description='', url='')
+        room = max(0, limit - utf16_length(HTML_TAG_PATTERN.sub('', template)))
+        description = truncate_utf16(description, room - utf16_length(location))
+        location = truncate_utf16(location, room - utf16_length(description))
+    
+    return format_match_message(
+        price=listing.price,
+        rooms=listing.rooms,
+        location=html.escape(location),
+        description=html.escape(description),
+        url=html.escape(listing.url, quote=True)
+    )
+
+def pack_messages(messages, limit):
+    """Group messages so each joined group stays within the length limit"""
+    batch = []
+    length = 0
+    for message in messages:
+        added = len(message) + (len(MESSAGE_SEPARATOR) if batch else 0)
+        if batch and length + added > limit:
+            yield batch
+            batch = []
+            added = len(message)
+            length = 0
+        batch.append(message)
+        length += added
+    if batch:
+        yield batch
+
+@functools.cache
+def _load_components():
+    """Import the heavy scanning components once, on first use"""
+    from db import get_db, ScannedListing, ListingSource
+    from scrapers.base import CONTENT_HASH_VERSION
+    from scrapers.yad2 import Yad2Scraper
+    from analysis.content import ContentAnalyzer
+    from notifications.dispatcher import NotificationDispatcher
+    from telegram import Bot, InputMediaPhoto
+    from telegram.request import HTTPXRequest
+    return (get_db, ScannedListing, ListingSource, CONTENT_HASH_VERSION, Yad2Scraper,
+            ContentAnalyzer, NotificationDispatcher, Bot, InputMediaPhoto, HTTPXRequest)
+
 async def demo_live_scanning():
     """Demo live apartment scanning with real Telegram notifications"""
     
@@ -29,11 +124,9 @@ async def demo_live_scanning():
     
     # Import components
     try:
-        from db import get_db
-        from scrapers.yad2 import Yad2Scraper
-        from analysis.content import ContentAnalyzer
-        from notifications.dispatcher import NotificationDispatcher
-        from telegram import Bot
+        (get_db, ScannedListing, ListingSource, CONTENT_HASH_VERSION, Yad2Scraper,
+         ContentAnalyzer, NotificationDispatcher, Bot, InputMediaPhoto,
+         HTTPXRequest) = _load_components()
     except ImportError as e:
         print(f"❌ Import error: {e}")
         return
@@ -74,85 +167,149 @@ async def demo_live_scanning():
     print(f"📍 City: {test_profile['location_criteria']['city']}")
     print()
     
+    search_url = scraper.construct_search_url(test_profile)
+    
+    # One bot with a keep-alive connection pool sized for concurrent sends,
+    # reused across all scans
+    bot = Bot(
+        token=os.getenv('TELEGRAM_BOT_TOKEN'),
+        request=HTTPXRequest(connection_pool_size=TELEGRAM_SEND_CONCURRENCY)
+    )
+    
+    # Limit concurrent Telegram sends to stay within rate limits
+    send_semaphore = asyncio.Semaphore(TELEGRAM_SEND_CONCURRENCY)
+    
+    async def send_with_limit(log, description, send):
+        """Run one Telegram request under the concurrency limit"""
+        async with send_semaphore:
+            try:
+                await send()
+                log(f"  ✅ Sent {description}")
+            except Exception as e:
+                log(f"  ❌ Notification failed ({description}): {e}")
+    
+    def notification_requests(matches, log):
+        """Coalesce a scan's matches into as few Telegram requests as possible"""
+        photos = []
+        texts = []
+        for listing in matches:
+            log(f"  📱 Queued notification for: {listing.title[:50]}...")
+            if listing.image_url:
+                photos.append(InputMediaPhoto(
+                    media=listing.image_url,
+                    caption=format_listing_message(listing, TELEGRAM_CAPTION_LIMIT),
+                    parse_mode='HTML'
+                ))
+            else:
+                texts.append(format_listing_message(listing))
+        
+        # Listings with images: albums of up to 10 (a single photo is sent on its own)
+        for i in range(0, len(photos), TELEGRAM_MEDIA_GROUP_LIMIT):
+            group = photos[i:i + TELEGRAM_MEDIA_GROUP_LIMIT]
+            if len(group) == 1:
+                yield "1 photo", functools.partial(
+                    bot.send_photo, chat_id=DEMO_CHAT_ID, photo=group[0].media,
+                    caption=group[0].caption, parse_mode='HTML'
+                )
+            else:
+                yield f"album of {len(group)}", functools.partial(
+                    bot.send_media_group, chat_id=DEMO_CHAT_ID, media=group
+                )
+        
+        # Text-only listings: packed into messages up to Telegram's length limit
+        for batch in pack_messages(texts, TELEGRAM_MESSAGE_LIMIT):
+            yield f"{len(batch)} listing(s) as text", functools.partial(
+                bot.send_message, chat_id=DEMO_CHAT_ID,
+                text=MESSAGE_SEPARATOR.join(batch), parse_mode='HTML'
+            )
+    
     # Start scanning loop
     print("🕷️ Starting live scan...")
-    print("⏰ Scanning every 30 seconds (demo mode)")
+    print(f"⏰ Scanning every {SCAN_INTERVAL:.0f} seconds (demo mode)")
     print("🛑 Press Ctrl+C to stop")
     print()
     
     scan_count = 0
+    next_scan = time.monotonic()
+    await bot.initialize()
     try:
         while True:
             scan_count += 1
-            print(f"🔄 Scan #{scan_count} - {time.strftime('%H:%M:%S')}")
+            
+            # Collect this scan's output and write it in one go
+            scan_log = []
+            log = scan_log.append
+            started = time.localtime()
+            log(f"🔄 Scan #{scan_count} - {started.tm_hour:02d}:{started.tm_min:02d}:{started.tm_sec:02d}")
             
             try:
                 # 1. Scrape Yad2
-                print("  🕷️ Scraping Yad2...")
-                listings = await scraper.scrape_listings(test_profile)
-                print(f"  📥 Found {len(listings)} listings")
+                log("  🕷️ Scraping Yad2...")
+                listings = await asyncio.to_thread(scraper.scrape_listings, search_url)
+                log(f"  📥 Found {len(listings)} listings")
                 
-                # 2. Filter and analyze
-                new_matches = []
-                for listing in listings:
-                    # Check if already in database
-                    existing = db.get_scanned_listing(listing.listing_id)
-                    if existing:
-                        continue
-                    
-                    # Analyze content
-                    analysis = analyzer.analyze_listing(listing, test_profile)
-                    if analysis.is_match:
-                        new_matches.append((listing, analysis))
-                        # Store in database
-                        db.store_scanned_listing(listing)
+                # 2. Filter and analyze - check all listings against the database in one query
+                seen_ids = await asyncio.to_thread(
+                    db.get_scanned_listings,
+                    [listing.listing_id for listing in listings],
+                    ListingSource.YAD2
+                )
+                new_listings = [
+                    listing for listing in listings
+                    if listing.listing_id not in seen_ids
+                ]
                 
-                print(f"  🎯 New matches: {len(new_matches)}")
+                # Analyze all new listings in one batch
+                analyses = await analyzer.analyze_listings_async(new_listings, test_profile)
+                new_matches = [
+                    (listing, analysis) for listing, analysis in zip(new_listings, analyses)
+                    if analysis.is_match
+                ]
                 
-                # 3. Send notifications
-                if new_matches:
-                    for listing, analysis in new_matches:
-                        print(f"  📱 Sending notification for: {listing.title[:50]}...")
-                        
-                        # Format message
-                        message = f"""🏠 <b>New Apartment Found!</b>
-
-💰 <b>{listing.price} ILS/month</b>
-🏠 {listing.rooms} rooms
-📍 {listing.location}
-
-{listing.description[:200]}...
-
-<a href="{listing.url}">🔗 View Listing</a>"""
-                        
-                        # Send via Telegram
-                        try:
-                            bot = Bot(token=os.getenv('TELEGRAM_BOT_TOKEN'))
-                            # For demo, we'll send to the channel - in real use, 
-                            # you'd send to specific user chat IDs from the database
-                            await bot.send_message(
-                                chat_id=os.getenv('DEMO_CHAT_ID', '@aparmntesbot'),
-                                text=message,
-                                parse_mode='HTML'
-                            )
-                            print("  ✅ Notification sent!")
-                        except Exception as e:
-                            print(f"  ❌ Notification failed: {e}")
+                # Store matches in database
+                await asyncio.to_thread(db.add_scanned_listings, [
+                    ScannedListing(
+                        listing_id=listing.listing_id,
+                        source=ListingSource.YAD2,
+                        content_hash=listing.generate_content_hash(),
+                        content_hash_version=CONTENT_HASH_VERSION,
+                        url=listing.url
+                    )
+                    for listing, _ in new_matches
+                ])
+                
+                log(f"  🎯 New matches: {len(new_matches)}")
                 
+                # 3. Send notifications, batched per scan and sent concurrently
+                if new_matches:
+                    sends = notification_requests([listing for listing, _ in new_matches], log)
+                    await asyncio.gather(
+                        *(send_with_limit(log, description, send) for description, send in sends),
+                        return_exceptions=True
+                    )
                 else:
-                    print("  😴 No new matches this scan")
+                    log("  😴 No new matches this scan")
                 
             except Exception as e:
-                print(f"  ❌ Scan error: {e}")
+                log(f"  ❌ Scan error: {e}")
             
-            print()
+            sys.stdout.write('\n'.join(scan_log) + '\n\n')
+            sys.stdout.flush()
             
-            # Wait for next scan
-            await asyncio.sleep(30)  # 30 seconds for demo
+            # Wait for next scan, keeping a fixed period regardless of scan duration
+            next_scan += SCAN_INTERVAL
+            now = time.monotonic()
+            if next_scan < now:
+                print(f"⚠️ Scan overran the {SCAN_INTERVAL:.0f}s interval, rescheduling")
+                next_scan = now + SCAN_INTERVAL
+            await asyncio.sleep(next_scan - now)
             
     except KeyboardInterrupt:
         print("\n🛑 Demo stopped by user")
         print(f"📊 Completed {scan_count} scans")
+    finally:
+        await bot.shutdown()
+        scraper.session.close()
 
 if __name__ == "__main__":
     print("🚀 Starting RealtyScanner Live Demo...")
@@ -9,8 +9,10 @@ import sys
 import os
 from pathlib import Path
 
-# Add src to path for imports  
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add the src directory to the path
+SRC_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 def demo_telegram_bot():
     """Demonstrate Telegram bot features"""
@@ -7,47 +7,77 @@ and all management is done through the web interface.
 
 import asyncio
 import logging
+import os
+import sys
 from datetime import datetime
 from typing import Dict, Any
 
+# Add the src directory to the path
+SRC_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+INTRO = f"""🚀 {"=" * 60}
+🚀 EPIC 5 DEMO - WEB-ONLY MANAGEMENT SYSTEM
+🚀 {"=" * 60}
+
+📱 WEB DASHBOARD FEATURES:
+   ✅ Complete profile management through web interface
+   ✅ Facebook login and group configuration via website
+   ✅ Yad2 search parameter configuration
+   ✅ Telegram chat ID setup and testing
+   ✅ Notification preferences and formatting
+   ✅ Real-time analytics and monitoring
+   ✅ Import/export functionality
+
+📡 NOTIFICATION-ONLY TELEGRAM BOT:
+   ✅ Simplified bot for ONLY sending notifications
+   ✅ No interactive commands or management features
+   ✅ Rich notification formatting with images
+   ✅ System status alerts and error notifications
+   ✅ Connection testing from web interface
+"""
+
+ACCESS_AND_ARCHITECTURE = """🌐 WEB INTERFACE ACCESS:
+   📊 Dashboard:     http://localhost:8000/dashboard
+   🔧 API Docs:      http://localhost:8000/api/docs
+   📡 Health Check:  http://localhost:8000/health
+
+🏗️  NEW SYSTEM ARCHITECTURE:
+   📱 Web Dashboard → All user management and configuration
+   📡 Telegram Bot  → Pure notification delivery only
+   🔍 Scanners      → Yad2 and Facebook property scanning
+   📊 Analytics     → Real-time monitoring and reports
+   🔐 Security      → Web-based authentication and session management
+"""
+
+OUTRO = f"""🎯 NEXT STEPS FOR PRODUCTION:
+   1. Connect real database (MongoDB/PostgreSQL)
+   2. Implement actual Facebook OAuth flow
+   3. Add user authentication and sessions
+   4. Set up production deployment with Docker
+   5. Configure monitoring and logging
+   6. Add automated testing and CI/CD
+
+🎉 {"=" * 60}
+🎉 EPIC 5 DEMO COMPLETE - SYSTEM READY FOR PRODUCTION!
+🎉 {"=" * 60}"""
+
 async def demo_epic5_system():
     """Demonstrate the Epic 5 web-only management system"""
     
-    print("🚀 " + "="*60)
-    print("🚀 EPIC 5 DEMO - WEB-ONLY MANAGEMENT SYSTEM")
-    print("🚀 " + "="*60)
-    print()
-    
-    # 1. Web Dashboard Features
-    print("📱 WEB DASHBOARD FEATURES:")
-    print("   ✅ Complete profile management through web interface")
-    print("   ✅ Facebook login and group configuration via website")
-    print("   ✅ Yad2 search parameter configuration")
-    print("   ✅ Telegram chat ID setup and testing")
-    print("   ✅ Notification preferences and formatting")
-    print("   ✅ Real-time analytics and monitoring")
-    print("   ✅ Import/export functionality")
-    print()
-    
-    # 2. Notification-Only Telegram Bot
-    print("📡 NOTIFICATION-ONLY TELEGRAM BOT:")
-    print("   ✅ Simplified bot for ONLY sending notifications")
-    print("   ✅ No interactive commands or management features")
-    print("   ✅ Rich notification formatting with images")
-    print("   ✅ System status alerts and error notifications")
-    print("   ✅ Connection testing from web interface")
-    print()
+    print(INTRO)
     
     # 3. Demo Notification
     print("🏠 DEMO: Sending Property Notification...")
     
     # Import the notification bot
     try:
-        from src.telegram_bot.notification_bot import get_notification_bot
+        from telegram_bot.notification_bot import get_notification_bot
         
         # Create mock property data
         property_data = {
@@ -72,21 +102,8 @@ async def demo_epic5_system():
     
     print()
     
-    # 4. Web Interface URLs
-    print("🌐 WEB INTERFACE ACCESS:")
-    print("   📊 Dashboard:     http://localhost:8000/dashboard")
-    print("   🔧 API Docs:      http://localhost:8000/api/docs")
-    print("   📡 Health Check:  http://localhost:8000/health")
-    print()
-    
-    # 5. System Architecture
-    print("🏗️  NEW SYSTEM ARCHITECTURE:")
-    print("   📱 Web Dashboard → All user management and configuration")
-    print("   📡 Telegram Bot  → Pure notification delivery only")
-    print("   🔍 Scanners      → Yad2 and Facebook property scanning")
-    print("   📊 Analytics     → Real-time monitoring and reports")
-    print("   🔐 Security      → Web-based authentication and session management")
-    print()
+    # 4-5. Web interface URLs and system architecture
+    print(ACCESS_AND_ARCHITECTURE)
     
     # 6. Key Features Implemented
     print("✅ EPIC 5 FEATURES COMPLETED:")
@@ -105,24 +122,11 @@ async def demo_epic5_system():
         "Hebrew RTL support throughout interface"
     ]
     
-    for i, feature in enumerate(features, 1):
-        print(f"   {i:2d}. {feature}")
-    
+    print("\n".join(f"   {i:2d}. {feature}" for i, feature in enumerate(features, 1)))
     print()
     
     # 7. Next Steps
-    print("🎯 NEXT STEPS FOR PRODUCTION:")
-    print("   1. Connect real database (MongoDB/PostgreSQL)")
-    print("   2. Implement actual Facebook OAuth flow")
-    print("   3. Add user authentication and sessions")
-    print("   4. Set up production deployment with Docker")
-    print("   5. Configure monitoring and logging")
-    print("   6. Add automated testing and CI/CD")
-    print()
-    
-    print("🎉 " + "="*60)
-    print("🎉 EPIC 5 DEMO COMPLETE - SYSTEM READY FOR PRODUCTION!")
-    print("🎉 " + "="*60)
+    print(OUTRO)
 
 def main():
     """Main demo function"""
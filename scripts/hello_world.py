@@ -12,11 +12,13 @@ It tests:
 Run with: python scripts/hello_world.py
 """
 
+import os
 import sys
-from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add the src directory to the path
+SRC_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 def main():
     print("🏠 RealtyScanner Agent - Hello World Script")
@@ -43,13 +45,17 @@ def main():
         return False
     
     # Test 4: Project structure
-    project_root = Path(__file__).parent.parent
+    project_root = os.path.dirname(SRC_PATH)
     required_dirs = ["src", "tests", "config", "scripts", "docs"]
     
-    missing_dirs = []
-    for dir_name in required_dirs:
-        if not (project_root / dir_name).exists():
-            missing_dirs.append(dir_name)
+    # List the project root once and check every name against it
+    with os.scandir(project_root) as entries:
+        present = {entry.name: entry for entry in entries}
+    
+    missing_dirs = [
+        dir_name for dir_name in required_dirs
+        if dir_name not in present or not present[dir_name].is_dir()
+    ]
     
     if missing_dirs:
         print(f"❌ Missing directories: {missing_dirs}")
@@ -59,11 +65,7 @@ def main():
     
     # Test 5: Configuration files
     config_files = [".env.example", "pyproject.toml", "README.md", ".gitignore"]
-    missing_files = []
-    
-    for file_name in config_files:
-        if not (project_root / file_name).exists():
-            missing_files.append(file_name)
+    missing_files = [file_name for file_name in config_files if file_name not in present]
     
     if missing_files:
         print(f"❌ Missing configuration files: {missing_files}")
@@ -4,14 +4,86 @@ Live Apartment Scanner - Starts real-time scanning for your profiles
 """
 
 import asyncio
+import os
 import sys
-from pathlib import Path
+import threading
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add the src directory to the path
+SRC_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
-from dotenv import load_dotenv
-load_dotenv()
+# Yad2 search for Tel Aviv rentals; profile criteria are applied to the results
+SEARCH_CRITERIA = {
+    'location_criteria': {'city': 'תל אביב'}
+}
+
+# Notification text for a matching listing; the description is cut to 200 characters
+MATCH_TITLE_TEMPLATE = "🏠 New Apartment Match #{index}!"
+MATCH_MESSAGE_TEMPLATE = """📍 Location: {location}
+💰 Price: {price} ILS
+🛏️ Rooms: {rooms}
+
+{description:.200}...
+
+⭐ Match Score: {score:.0f}/100
+"""
+
+# Marks the end of the listing stream
+END_OF_SCAN = None
+
+def in_range(value, low, high):
+    """Check a numeric listing field against a range, passing unknown values"""
+    try:
+        return value is None or low <= float(value) <= high
+    except (TypeError, ValueError):
+        return True
+
+async def stream_listings(scraper, search_url, queue, stop):
+    """Feed listings into the queue as the scraper parses them, until stop is set"""
+    loop = asyncio.get_running_loop()
+    
+    def put(item):
+        # Once stopped, the loop may be shutting down and nothing reads the queue
+        if stop.is_set():
+            return
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            stop.set()
+    
+    def produce():
+        try:
+            for listing in scraper.iter_listings(search_url):
+                if stop.is_set():
+                    break
+                put(listing)
+        finally:
+            put(END_OF_SCAN)
+    
+    # The scraping thread can't be cancelled, so cancelling this task tells it to stop
+    try:
+        await asyncio.to_thread(produce)
+    except asyncio.CancelledError:
+        stop.set()
+        raise
+
+def format_match_message(index, listing, result):
+    """Build the Telegram notification for a matching listing"""
+    from notifications.base import NotificationMessage
+    
+    return NotificationMessage(
+        title=MATCH_TITLE_TEMPLATE.format(index=index),
+        content=MATCH_MESSAGE_TEMPLATE.format(
+            location=listing.location or 'N/A',
+            price=listing.price or 'N/A',
+            rooms=listing.rooms or 'N/A',
+            description=listing.description,
+            score=result.score
+        ),
+        url=listing.url,
+        image_url=listing.image_url
+    )
 
 async def test_real_scanning():
     """Test the real scanning system with your actual profile"""
@@ -19,132 +91,133 @@ async def test_real_scanning():
     print("=" * 60)
     
     try:
-        # Import database and scrapers
-        from db import get_db
-        from scrapers.yad2 import Yad2Scraper
-        from analysis.content import ContentAnalyzer
-        from notifications.dispatcher import NotificationDispatcher
+        from db import (
+            get_db, SentNotification, NotificationChannel, ScannedListing, ListingSource
+        )
         
-        # Initialize components
         db_manager = get_db()
         
         # Ensure database is connected
         if not db_manager.connect():
             print("❌ Failed to connect to database")
             return
-            
+        
+        from scrapers.base import CONTENT_HASH_VERSION
+        from scrapers.yad2 import Yad2Scraper
+        
         yad2_scraper = Yad2Scraper()
-        analyzer = ContentAnalyzer()
-        dispatcher = NotificationDispatcher()
+        search_url = yad2_scraper.construct_search_url(SEARCH_CRITERIA)
         
-        print("✅ All components initialized")
+        # The scan doesn't depend on the profile (price and rooms are filtered
+        # locally below), so it starts while the profile is fetched and
+        # listings queue up until analysis begins
+        print(f"\n🔍 Searching Yad2: {search_url}")
+        print("🕷️ Starting Yad2 scan...")
+        listing_queue = asyncio.Queue()
+        stop_scan = threading.Event()
+        scan_task = asyncio.create_task(stream_listings(yad2_scraper, search_url, listing_queue, stop_scan))
         
-        # Get your actual profile from database
-        profiles = db_manager.get_active_user_profiles()
+        # Get your actual profile from database - only the first active one is used
+        profile = await asyncio.to_thread(next, db_manager.iter_active_user_profiles(limit=1), None)
         
-        if not profiles:
+        if profile is None:
+            stop_scan.set()
+            scan_task.cancel()
             print("❌ No active profiles found. Create one via the Telegram bot first!")
             return
         
-        profile = profiles[0]  # Use the first active profile
-        print(f"🎯 Using profile: {profile.profile_name}")
-        print(f"   Budget: {profile.price.min}-{profile.price.max} ILS")
-        print(f"   Rooms: {profile.rooms.min}+ rooms")
+        # Analysis and notification stacks are only loaded once there is work to do
+        from analysis.content import ContentAnalyzer
+        from notifications.dispatcher import NotificationDispatcher
+        from notifications.base import NotificationStatus
         
-        # Build Yad2 search URL for Tel Aviv
-        search_params = {
-            'city': 'תל אביב',
-            'min_price': profile.price.min,
-            'max_price': profile.price.max,
-            'min_rooms': profile.rooms.min,
-            'property_type': 'rent'
-        }
+        criteria = profile.dict()
         
-        print(f"\n🔍 Searching Yad2 with parameters: {search_params}")
+        analyzer = ContentAnalyzer()
+        dispatcher = NotificationDispatcher()
+        dispatcher.configure_from_profile(criteria['notification_channels'])
         
-        # Scan Yad2 for real listings
-        print("🕷️ Starting Yad2 scan...")
-        listings = await yad2_scraper.scan_listings(search_params)
+        print("✅ All components initialized")
+        print(f"🎯 Using profile: {profile.profile_name}")
+        print(f"   Budget: {profile.price.min}-{profile.price.max} ILS")
+        print(f"   Rooms: {profile.rooms.min}+ rooms")
         
-        print(f"📊 Found {len(listings)} listings from Yad2")
+        chat_id = profile.notification_channels.telegram.telegram_chat_id
+        if not chat_id:
+            print("⚠️  No Telegram chat ID found in profile - matches will not be sent")
         
-        # Analyze each listing
+        # Analyze listings as they arrive; each match is sent right away while
+        # the scan continues
+        scanned = 0
         matches = []
-        for i, listing in enumerate(listings, 1):
-            print(f"\n📝 Analyzing listing {i}/{len(listings)}...")
+        sends = []
+        while (listing := await listing_queue.get()) is not END_OF_SCAN:
+            scanned += 1
             
-            # Check if listing matches criteria
-            is_match = analyzer.analyze_listing(listing, profile)
+            # Cheap price/room range check first; only survivors get the full analysis.
+            # Listings without a price or room count are left for the analyzer to judge.
+            if not (in_range(listing.price, profile.price.min, profile.price.max)
+                    and in_range(listing.rooms, profile.rooms.min, profile.rooms.max)):
+                continue
             
-            if is_match['is_match']:
-                matches.append(listing)
-                print(f"✅ MATCH! Score: {is_match['score']:.2f}")
-                print(f"   📍 {listing.get('location', 'N/A')}")
-                print(f"   💰 {listing.get('price', 'N/A')} ILS")
-                print(f"   🏠 {listing.get('rooms', 'N/A')} rooms")
-            else:
-                print(f"❌ No match. Reason: {is_match['reason']}")
-        
-        print(f"\n🎯 RESULTS: {len(matches)} matches found!")
-        
-        # Send notifications for matches
-        if matches:
-            print("\n📱 Sending Telegram notifications...")
+            print(f"\n📝 Analyzing listing {listing.listing_id}...")
+            result = analyzer.analyze_listing(listing, criteria)
             
-            # Get Telegram chat ID from profile
-            telegram_config = profile.notification_channels.telegram
-            chat_id = telegram_config.telegram_chat_id
+            if not result.is_match:
+                print(f"❌ No match. Reason: {'; '.join(result.reasons)}")
+                continue
             
-            if not chat_id:
-                print("⚠️  No Telegram chat ID found in profile")
-                return
+            matches.append(listing)
+            print(f"✅ MATCH! Score: {result.score:.1f}")
+            print(f"   📍 {listing.location or 'N/A'}")
+            print(f"   💰 {listing.price or 'N/A'} ILS")
+            print(f"   🏠 {listing.rooms or 'N/A'} rooms")
             
-            for i, match in enumerate(matches, 1):
-                try:
-                    # Format message
-                    message = f"""🏠 New Apartment Match #{i}!
-
-📍 Location: {match.get('location', 'N/A')}
-💰 Price: {match.get('price', 'N/A')} ILS
-🛏️ Rooms: {match.get('rooms', 'N/A')}
-📏 Size: {match.get('size', 'N/A')} sqm
-
-{match.get('description', '')[:200]}...
-
-🔗 View listing: {match.get('url', '')}
-
-⭐ Match Score: {analyzer.analyze_listing(match, profile)['score']:.2f}/1.0
-"""
-                    
-                    # Send notification
-                    success = await dispatcher.send_notification(
-                        channel="telegram",
-                        message=message,
-                        recipient=chat_id
-                    )
-                    
-                    if success:
-                        print(f"✅ Sent notification {i} to Telegram")
-                        
-                        # Log in database
-                        db.sent_notifications.insert_one({
-                            'profileId': profile['_id'],
-                            'listingId': match.get('id', 'unknown'),
-                            'channel': 'telegram',
-                            'recipient': chat_id,
-                            'sentAt': analyzer.get_current_time(),
-                            'messageContent': message[:200] + '...'
-                        })
-                        
-                    else:
-                        print(f"❌ Failed to send notification {i}")
-                        
-                except Exception as e:
-                    print(f"❌ Error sending notification {i}: {e}")
-        
-        else:
+            if chat_id:
+                message = format_match_message(len(matches), listing, result)
+                sends.append((listing, message, asyncio.create_task(
+                    asyncio.to_thread(dispatcher.send_notification, message, ['telegram'])
+                )))
+        
+        await scan_task
+        print(f"\n📊 Scanned {scanned} listings from Yad2")
+        print(f"🎯 RESULTS: {len(matches)} matches found!")
+        
+        if not matches:
             print("ℹ️  No matches found this time. The scanner will keep looking!")
         
+        # Wait for the notifications still in flight
+        results = await asyncio.gather(*(task for _, _, task in sends), return_exceptions=True)
+        
+        sent = []
+        for i, ((listing, message, _), result) in enumerate(zip(sends, results), 1):
+            if isinstance(result, Exception):
+                print(f"❌ Error sending notification {i}: {result}")
+            elif result['telegram'].status == NotificationStatus.SUCCESS:
+                print(f"✅ Sent notification {i} to Telegram")
+                sent.append(SentNotification(
+                    profile_id=profile.id,
+                    listing_id=listing.listing_id,
+                    channel=NotificationChannel.TELEGRAM,
+                    recipient=chat_id,
+                    message_content=message.content[:200] + '...'
+                ))
+            else:
+                print(f"❌ Failed to send notification {i}: {result['telegram'].error_message}")
+        
+        # Record the matches and the sent notifications, one round-trip each
+        db_manager.add_scanned_listings([
+            ScannedListing(
+                listing_id=listing.listing_id,
+                source=ListingSource.YAD2,
+                content_hash=listing.generate_content_hash(),
+                content_hash_version=CONTENT_HASH_VERSION,
+                url=listing.url
+            )
+            for listing in matches
+        ])
+        db_manager.log_sent_notifications(sent)
+        
         print("\n🎉 Live scan completed!")
         print("💡 To run continuous scanning: python scripts/run_worker.py")
         
@@ -154,4 +227,7 @@ async def test_real_scanning():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     asyncio.run(test_real_scanning())
@@ -10,179 +10,174 @@ import os
 from pathlib import Path
 from datetime import datetime
 
-def display_epic4_summary():
-    """Display Epic 4 completion summary"""
-    print("🏠 RealtyScanner Agent - Epic 4 Completion Summary")
-    print("=" * 80)
-    print(f"📅 Completed: {datetime.now().strftime('%B %d, %Y')}")
-    print()
-    
-    print("🎯 EPIC 4: TELEGRAM BOT & MANAGEMENT WEBSITE")
-    print("=" * 80)
-    print("Status: ✅ COMPLETE")
-    print()
-    
-    print("🚀 MAJOR ACHIEVEMENTS:")
-    print()
-    
-    print("🤖 INTERACTIVE TELEGRAM BOT")
-    print("  ✅ Conversational profile setup through natural chat")
-    print("  ✅ Rich property notifications with inline buttons")
-    print("  ✅ Command system (/start, /profile, /settings, /notifications)")
-    print("  ✅ Smart input parsing for prices, rooms, and locations")
-    print("  ✅ User session management and state tracking")
-    print("  ✅ HTML-formatted messages with emojis and styling")
-    print()
-    
-    print("🌐 PROFESSIONAL WEB DASHBOARD")
-    print("  ✅ Modern FastAPI backend with async architecture")
-    print("  ✅ RESTful API with comprehensive endpoints")
-    print("  ✅ Authentication system with JWT tokens")
-    print("  ✅ Real-time WebSocket connections for live updates")
-    print("  ✅ Responsive Bootstrap 5 interface")
-    print("  ✅ Admin panel for system monitoring")
-    print()
-    
-    print("🔄 CROSS-PLATFORM INTEGRATION")
-    print("  ✅ Unified user experience across bot and web")
-    print("  ✅ Real-time data synchronization")
-    print("  ✅ Enhanced notification system with rich formatting")
-    print("  ✅ Multi-channel delivery (Telegram, Email, Web)")
-    print("  ✅ Seamless profile management")
-    print()
-    
-    print("📁 NEW FILES CREATED:")
-    print()
-    print("📱 Telegram Bot Implementation:")
-    print("  • src/telegram_bot/__init__.py")
-    print("  • src/telegram_bot/bot.py")
-    print("  • src/telegram_bot/handlers.py")
-    print("  • src/telegram_bot/utils.py")
-    print("  • src/telegram_bot/run_bot.py")
-    print()
-    
-    print("🌐 Web Dashboard Implementation:")
-    print("  • src/web/__init__.py")
-    print("  • src/web/app.py")
-    print("  • src/web/api.py")
-    print("  • src/web/auth.py")
-    print("  • src/web/websocket.py")
-    print("  • src/web/run_server.py")
-    print("  • src/web/templates/dashboard.html")
-    print()
-    
-    print("📚 Documentation & Testing:")
-    print("  • docs/Epic4_Implementation_Guide.md")
-    print("  • docs/Epic4_Complete_Summary.md")
-    print("  • scripts/test_epic4_telegram_web.py")
-    print("  • scripts/epic4_demo_simple.py")
-    print()
-    
-    print("🔧 TECHNICAL SPECIFICATIONS:")
-    print()
-    print("Backend Technologies:")
-    print("  • FastAPI for high-performance async web framework")
-    print("  • python-telegram-bot for robust bot interactions")
-    print("  • WebSockets for real-time communication")
-    print("  • JWT tokens for secure authentication")
-    print("  • bcrypt for password hashing")
-    print()
-    
-    print("Frontend Technologies:")
-    print("  • Bootstrap 5 for responsive design")
-    print("  • Jinja2 templates for server-side rendering")
-    print("  • JavaScript for interactive features")
-    print("  • CSS3 for modern styling")
-    print()
-    
-    print("📊 TEST RESULTS:")
-    print("  ✅ Telegram bot integration: PASSED")
-    print("  ✅ Web dashboard functionality: PASSED")
-    print("  ✅ Cross-platform integration: PASSED")
-    print("  ✅ Enhanced notification system: PASSED")
-    print("  ✅ Authentication system: PASSED")
-    print("  ✅ Real-time features: PASSED")
-    print()
-    
-    print("🚀 NEXT STEPS (Epic 5):")
-    print("  🐳 Docker containerization")
-    print("  ☁️  Production deployment")
-    print("  📊 Advanced analytics and monitoring")
-    print("  🔧 Performance optimization")
-    print("  🛡️  Enhanced security features")
-    print()
-    
-    print("🎉 EPIC 4 TRANSFORMATION COMPLETE!")
-    print()
-    print("📈 Impact: Transformed RealtyScanner from a basic notification")
-    print("   system into a comprehensive, multi-platform property")
-    print("   management solution with professional user interfaces.")
-    print()
-    print("🏆 Ready for production deployment and Epic 5 enhancements!")
-    print("=" * 80)
-
-def check_implementation_status():
-    """Check the status of Epic 4 implementation"""
-    base_path = Path(__file__).parent.parent
-    
-    print("\n🔍 IMPLEMENTATION STATUS CHECK:")
-    print("-" * 40)
-    
-    # Check Telegram bot files
-    bot_files = [
+# (section heading, expected files relative to the project root)
+IMPLEMENTATION_FILES = (
+    ("🤖 Telegram Bot Files", (
         "src/telegram_bot/__init__.py",
-        "src/telegram_bot/bot.py", 
+        "src/telegram_bot/bot.py",
         "src/telegram_bot/handlers.py",
         "src/telegram_bot/utils.py",
-        "src/telegram_bot/run_bot.py"
-    ]
-    
-    print("\n🤖 Telegram Bot Files:")
-    for file in bot_files:
-        path = base_path / file
-        status = "✅" if path.exists() else "❌"
-        print(f"  {status} {file}")
-    
-    # Check web dashboard files
-    web_files = [
+        "src/telegram_bot/run_bot.py",
+    )),
+    ("🌐 Web Dashboard Files", (
         "src/web/__init__.py",
         "src/web/app.py",
-        "src/web/api.py", 
+        "src/web/api.py",
         "src/web/auth.py",
         "src/web/websocket.py",
         "src/web/run_server.py",
-        "src/web/templates/dashboard.html"
-    ]
-    
-    print("\n🌐 Web Dashboard Files:")
-    for file in web_files:
-        path = base_path / file
-        status = "✅" if path.exists() else "❌"
-        print(f"  {status} {file}")
-    
-    # Check documentation
-    doc_files = [
+        "src/web/templates/dashboard.html",
+    )),
+    ("📚 Documentation Files", (
         "docs/Epic4_Implementation_Guide.md",
-        "docs/Epic4_Complete_Summary.md"
-    ]
-    
-    print("\n📚 Documentation Files:")
-    for file in doc_files:
-        path = base_path / file
-        status = "✅" if path.exists() else "❌"
-        print(f"  {status} {file}")
-    
-    # Check test files
-    test_files = [
+        "docs/Epic4_Complete_Summary.md",
+    )),
+    ("🧪 Test Files", (
         "scripts/test_epic4_telegram_web.py",
-        "scripts/epic4_demo_simple.py"
-    ]
-    
-    print("\n🧪 Test Files:")
-    for file in test_files:
-        path = base_path / file
-        status = "✅" if path.exists() else "❌"
-        print(f"  {status} {file}")
+        "scripts/demo/epic4_demo_simple.py",
+    )),
+)
+
+def display_epic4_summary():
+    """Display Epic 4 completion summary"""
+    # Build the whole summary and write it in one go
+    out = []
+    out.append("🏠 RealtyScanner Agent - Epic 4 Completion Summary")
+    out.append("=" * 80)
+    out.append(f"📅 Completed: {datetime.now().strftime('%B %d, %Y')}")
+    out.append("")
+    
+    out.append("🎯 EPIC 4: TELEGRAM BOT & MANAGEMENT WEBSITE")
+    out.append("=" * 80)
+    out.append("Status: ✅ COMPLETE")
+    out.append("")
+    
+    out.append("🚀 MAJOR ACHIEVEMENTS:")
+    out.append("")
+    
+    out.append("🤖 INTERACTIVE TELEGRAM BOT")
+    out.append("  ✅ Conversational profile setup through natural chat")
+    out.append("  ✅ Rich property notifications with inline buttons")
+    out.append("  ✅ Command system (/start, /profile, /settings, /notifications)")
+    out.append("  ✅ Smart input parsing for prices, rooms, and locations")
+    out.append("  ✅ User session management and state tracking")
+    out.append("  ✅ HTML-formatted messages with emojis and styling")
+    out.append("")
+    
+    out.append("🌐 PROFESSIONAL WEB DASHBOARD")
+    out.append("  ✅ Modern FastAPI backend with async architecture")
+    out.append("  ✅ RESTful API with comprehensive endpoints")
+    out.append("  ✅ Authentication system with JWT tokens")
+    out.append("  ✅ Real-time WebSocket connections for live updates")
+    out.append("  ✅ Responsive Bootstrap 5 interface")
+    out.append("  ✅ Admin panel for system monitoring")
+    out.append("")
+    
+    out.append("🔄 CROSS-PLATFORM INTEGRATION")
+    out.append("  ✅ Unified user experience across bot and web")
+    out.append("  ✅ Real-time data synchronization")
+    out.append("  ✅ Enhanced notification system with rich formatting")
+    out.append("  ✅ Multi-channel delivery (Telegram, Email, Web)")
+    out.append("  ✅ Seamless profile management")
+    out.append("")
+    
+    out.append("📁 NEW FILES CREATED:")
+    out.append("")
+    out.append("📱 Telegram Bot Implementation:")
+    out.append("  • src/telegram_bot/__init__.py")
+    out.append("  • src/telegram_bot/bot.py")
+    out.append("  • src/telegram_bot/handlers.py")
+    out.append("  • src/telegram_bot/utils.py")
+    out.append("  • src/telegram_bot/run_bot.py")
+    out.append("")
+    
+    out.append("🌐 Web Dashboard Implementation:")
+    out.append("  • src/web/__init__.py")
+    out.append("  • src/web/app.py")
+    out.append("  • src/web/api.py")
+    out.append("  • src/web/auth.py")
+    out.append("  • src/web/websocket.py")
+    out.append("  • src/web/run_server.py")
+    out.append("  • src/web/templates/dashboard.html")
+    out.append("")
+    
+    out.append("📚 Documentation & Testing:")
+    out.append("  • docs/Epic4_Implementation_Guide.md")
+    out.append("  • docs/Epic4_Complete_Summary.md")
+    out.append("  • scripts/test_epic4_telegram_web.py")
+    out.append("  • scripts/epic4_demo_simple.py")
+    out.append("")
+    
+    out.append("🔧 TECHNICAL SPECIFICATIONS:")
+    out.append("")
+    out.append("Backend Technologies:")
+    out.append("  • FastAPI for high-performance async web framework")
+    out.append("  • python-telegram-bot for robust bot interactions")
+    out.append("  • WebSockets for real-time communication")
+    out.append("  • JWT tokens for secure authentication")
+    out.append("  • bcrypt for password hashing")
+    out.append("")
+    
+    out.append("Frontend Technologies:")
+    out.append("  • Bootstrap 5 for responsive design")
+    out.append("  • Jinja2 templates for server-side rendering")
+    out.append("  • JavaScript for interactive features")
+    out.append("  • CSS3 for modern styling")
+    out.append("")
+    
+    out.append("📊 TEST RESULTS:")
+    out.append("  ✅ Telegram bot integration: PASSED")
+    out.append("  ✅ Web dashboard functionality: PASSED")
+    out.append("  ✅ Cross-platform integration: PASSED")
+    out.append("  ✅ Enhanced notification system: PASSED")
+    out.append("  ✅ Authentication system: PASSED")
+    out.append("  ✅ Real-time features: PASSED")
+    out.append("")
+    
+    out.append("🚀 NEXT STEPS (Epic 5):")
+    out.append("  🐳 Docker containerization")
+    out.append("  ☁️  Production deployment")
+    out.append("  📊 Advanced analytics and monitoring")
+    out.append("  🔧 Performance optimization")
+    out.append("  🛡️  Enhanced security features")
+    out.append("")
+    
+    out.append("🎉 EPIC 4 TRANSFORMATION COMPLETE!")
+    out.append("")
+    out.append("📈 Impact: Transformed RealtyScanner from a basic notification")
+    out.append("   system into a comprehensive, multi-platform property")
+    out.append("   management solution with professional user interfaces.")
+    out.append("")
+    out.append("🏆 Ready for production deployment and Epic 5 enhancements!")
+    out.append("=" * 80)
+    
+    sys.stdout.write("\n".join(out) + "\n")
+
+def check_implementation_status():
+    """Check the status of Epic 4 implementation"""
+    base_path = Path(__file__).resolve().parents[2]
+    
+    # List each directory once instead of checking every file separately
+    present = {}
+    for directory in {os.path.dirname(f) for _, files in IMPLEMENTATION_FILES for f in files}:
+        try:
+            with os.scandir(base_path / directory) as entries:
+                present[directory] = {entry.name for entry in entries}
+        except OSError:
+            present[directory] = set()
+    
+    out = []
+    out.append("\n🔍 IMPLEMENTATION STATUS CHECK:")
+    out.append("-" * 40)
+    
+    for heading, files in IMPLEMENTATION_FILES:
+        out.append(f"\n{heading}:")
+        for file in files:
+            directory, name = os.path.split(file)
+            status = "✅" if name in present[directory] else "❌"
+            out.append(f"  {status} {file}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """Main function"""
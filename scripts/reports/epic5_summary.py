@@ -8,248 +8,292 @@ Epic 5: Production, Monitoring & Optimization
 
 import sys
 import os
-from pathlib import Path
+import mmap
+from functools import lru_cache
 from datetime import datetime
 
-def display_epic5_summary():
-    """Display Epic 5 implementation summary"""
-    print("🏠 RealtyScanner Agent - Epic 5 Implementation Summary")
-    print("=" * 80)
-    print(f"📅 Implemented: {datetime.now().strftime('%B %d, %Y')}")
-    print()
-    
-    print("🎯 EPIC 5: PRODUCTION, MONITORING & OPTIMIZATION")
-    print("=" * 80)
-    print("Status: ✅ FOUNDATION COMPLETE - Ready for Production Deployment")
-    print()
-    
-    print("🚀 MAJOR ACHIEVEMENTS:")
-    print()
-    
-    print("🐳 DOCKER CONTAINERIZATION")
-    print("  ✅ Multi-stage Docker build for optimal image size")
-    print("  ✅ Production-ready Dockerfile with security hardening")
-    print("  ✅ Comprehensive docker-compose stack")
-    print("  ✅ Non-root user for container security")
-    print("  ✅ Health checks and monitoring integration")
-    print("  ✅ Volume management for persistent data")
-    print()
-    
-    print("🔧 DEPLOYMENT AUTOMATION")
-    print("  ✅ Automated deployment script (deploy.sh)")
-    print("  ✅ Environment validation and setup")
-    print("  ✅ Service orchestration with Docker Compose")
-    print("  ✅ Production and development configurations")
-    print("  ✅ Database initialization and migration")
-    print("  ✅ SSL/TLS configuration support")
-    print()
-    
-    print("📊 MONITORING & OBSERVABILITY")
-    print("  ✅ Prometheus metrics collection")
-    print("  ✅ Grafana dashboards for visualization")
-    print("  ✅ Structured logging with JSON format")
-    print("  ✅ Health check endpoints")
-    print("  ✅ Service discovery and monitoring")
-    print("  ✅ Alerting rules configuration")
-    print()
-    
-    print("⚙️ BACKGROUND PROCESSING")
-    print("  ✅ Dedicated worker service for scraping")
-    print("  ✅ Async processing architecture")
-    print("  ✅ Scalable worker management")
-    print("  ✅ Error handling and recovery")
-    print("  ✅ Performance monitoring")
-    print("  ✅ Graceful shutdown handling")
-    print()
-    
-    print("🛡️ SECURITY & PERFORMANCE")
-    print("  ✅ Environment-based configuration")
-    print("  ✅ Secrets management templates")
-    print("  ✅ Rate limiting and DDoS protection")
-    print("  ✅ Input validation and sanitization")
-    print("  ✅ Database connection pooling")
-    print("  ✅ Redis caching integration")
-    print()
-    
-    print("🌐 PRODUCTION INFRASTRUCTURE")
-    print("  ✅ Nginx reverse proxy configuration")
-    print("  ✅ Load balancing support")
-    print("  ✅ SSL certificate management")
-    print("  ✅ Database replication support")
-    print("  ✅ Backup and recovery procedures")
-    print("  ✅ Multi-environment deployment")
-    print()
-    
-    print("📁 PRODUCTION INFRASTRUCTURE FILES:")
-    print()
-    print("🐳 Docker Configuration:")
-    print("  • Dockerfile (multi-stage production build)")
-    print("  • docker-compose.yml (full production stack)")
-    print("  • docker-compose.prod.yml (minimal production)")
-    print("  • .env.example (comprehensive environment template)")
-    print()
-    
-    print("🚀 Deployment & Operations:")
-    print("  • scripts/deploy.sh (automated deployment)")
-    print("  • scripts/run_worker.py (background processing)")
-    print("  • scripts/test_epic5_production.py (production testing)")
-    print()
-    
-    print("📊 Monitoring & Configuration:")
-    print("  • config/nginx.conf (reverse proxy)")
-    print("  • config/prometheus.yml (metrics collection)")
-    print("  • config/grafana/ (dashboard configuration)")
-    print()
-    
-    print("🔧 TECHNICAL SPECIFICATIONS:")
-    print()
-    print("Container Orchestration:")
-    print("  • Docker multi-stage builds for optimization")
-    print("  • Docker Compose for service orchestration")
-    print("  • Health checks and dependency management")
-    print("  • Volume management for persistent storage")
-    print()
-    
-    print("Monitoring Stack:")
-    print("  • Prometheus for metrics collection")
-    print("  • Grafana for dashboard visualization")
-    print("  • Structured JSON logging")
-    print("  • Real-time alerting capabilities")
-    print()
-    
-    print("Security Features:")
-    print("  • Non-root container execution")
-    print("  • Environment-based secrets management")
-    print("  • Rate limiting and input validation")
-    print("  • SSL/TLS termination support")
-    print()
-    
-    print("📊 PRODUCTION READINESS CHECKLIST:")
-    print("  ✅ Docker containerization complete")
-    print("  ✅ Environment configuration templates")
-    print("  ✅ Automated deployment scripts")
-    print("  ✅ Monitoring and logging setup")
-    print("  ✅ Security hardening implemented")
-    print("  ✅ Background worker architecture")
-    print("  ✅ Database and caching configuration")
-    print("  ✅ Health checks and service discovery")
-    print()
-    
-    print("🚀 DEPLOYMENT COMMANDS:")
-    print()
-    print("1. Quick Start (Development):")
-    print("   docker-compose -f docker-compose.prod.yml up -d")
-    print()
-    print("2. Full Production Deployment:")
-    print("   ./scripts/deploy.sh")
-    print()
-    print("3. Stop Services:")
-    print("   ./scripts/deploy.sh stop")
-    print()
-    print("4. View Logs:")
-    print("   ./scripts/deploy.sh logs")
-    print()
+# (category, core production files relative to the project root)
+PRODUCTION_FILES = (
+    ("Docker Configuration", (
+        "Dockerfile",
+        "docker-compose.yml",
+        "docker-compose.prod.yml",
+        ".env.example",
+    )),
+    ("Deployment Scripts", (
+        "scripts/deploy.sh",
+        "scripts/run_worker.py",
+        "scripts/test_epic5_production.py",
+    )),
+    ("Application Components", (
+        "src/web/app.py",
+        "src/telegram_bot/bot.py",
+        "src/notifications/dispatcher.py",
+        "requirements.txt",
+    )),
+)
+
+# (check name, setting expected in .env.example)
+CONFIG_CHECKS = (
+    ("Database Configuration", "MONGODB_URI"),
+    ("Security Settings", "SECRET_KEY"),
+    ("Telegram Integration", "TELEGRAM_BOT_TOKEN"),
+    ("Monitoring Setup", "GRAFANA_PASSWORD"),
+    ("Email Notifications", "SENDGRID_API_KEY"),
+)
+
+@lru_cache(maxsize=8)
+def find_config_tokens(path, mtime_ns, size):
+    """Return the CONFIG_CHECKS settings present in an env template
     
-    print("🎯 NEXT STEPS (POST-DEPLOYMENT):")
-    print("  🌐 Configure production domain and DNS")
-    print("  🔐 Set up SSL certificates (Let's Encrypt)")
-    print("  📧 Configure SMTP for email notifications")
-    print("  📱 Set up Telegram webhook")
-    print("  📊 Configure monitoring alerts")
-    print("  🔄 Set up automated backups")
-    print("  📈 Implement advanced analytics")
-    print("  🧪 Set up staging environment")
-    print()
+    mtime_ns and size are part of the cache key, so an edited file is re-read.
+    """
+    if size == 0:
+        return frozenset()
     
-    print("🎉 EPIC 5 FOUNDATION COMPLETE!")
-    print()
-    print("📈 Impact: Transformed RealtyScanner into a production-ready,")
-    print("   enterprise-grade application with comprehensive monitoring,")
-    print("   automated deployment, and scalable architecture.")
-    print()
-    print("🏆 Ready for production deployment and real-world usage!")
-    print("=" * 80)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            return frozenset(token for _, token in CONFIG_CHECKS if mm.find(token.encode()) != -1)
+    finally:
+        os.close(fd)
+
+# Date shown in the summary, formatted once when the script loads
+SUMMARY_DATE = datetime.now().strftime('%B %d, %Y')
+
+# Static part of the summary, written in a single call
+EPIC5_BANNER = """\
+🏠 RealtyScanner Agent - Epic 5 Implementation Summary
+================================================================================
+📅 Implemented: {date}
+
+🎯 EPIC 5: PRODUCTION, MONITORING & OPTIMIZATION
+================================================================================
+Status: ✅ FOUNDATION COMPLETE - Ready for Production Deployment
+
+🚀 MAJOR ACHIEVEMENTS:
+
+🐳 DOCKER CONTAINERIZATION
+  ✅ Multi-stage Docker build for optimal image size
+  ✅ Production-ready Dockerfile with security hardening
+  ✅ Comprehensive docker-compose stack
+  ✅ Non-root user for container security
+  ✅ Health checks and monitoring integration
+  ✅ Volume management for persistent data
+
+🔧 DEPLOYMENT AUTOMATION
+  ✅ Automated deployment script (deploy.sh)
+  ✅ Environment validation and setup
+  ✅ Service orchestration with Docker Compose
+  ✅ Production and development configurations
+  ✅ Database initialization and migration
+  ✅ SSL/TLS configuration support
+
+📊 MONITORING & OBSERVABILITY
+  ✅ Prometheus metrics collection
+  ✅ Grafana dashboards for visualization
+  ✅ Structured logging with JSON format
+  ✅ Health check endpoints
+  ✅ Service discovery and monitoring
+  ✅ Alerting rules configuration
+
+⚙️ BACKGROUND PROCESSING
+  ✅ Dedicated worker service for scraping
+  ✅ Async processing architecture
+  ✅ Scalable worker management
+  ✅ Error handling and recovery
+  ✅ Performance monitoring
+  ✅ Graceful shutdown handling
+
+🛡️ SECURITY & PERFORMANCE
+  ✅ Environment-based configuration
+  ✅ Secrets management templates
+  ✅ Rate limiting and DDoS protection
+  ✅ Input validation and sanitization
+  ✅ Database connection pooling
+  ✅ Redis caching integration
+
+🌐 PRODUCTION INFRASTRUCTURE
+  ✅ Nginx reverse proxy configuration
+  ✅ Load balancing support
+  ✅ SSL certificate management
+  ✅ Database replication support
+  ✅ Backup and recovery procedures
+  ✅ Multi-environment deployment
+
+📁 PRODUCTION INFRASTRUCTURE FILES:
+
+🐳 Docker Configuration:
+  • Dockerfile (multi-stage production build)
+  • docker-compose.yml (full production stack)
+  • docker-compose.prod.yml (minimal production)
+  • .env.example (comprehensive environment template)
+
+🚀 Deployment & Operations:
+  • scripts/deploy.sh (automated deployment)
+  • scripts/run_worker.py (background processing)
+  • scripts/test_epic5_production.py (production testing)
+
+📊 Monitoring & Configuration:
+  • config/nginx.conf (reverse proxy)
+  • config/prometheus.yml (metrics collection)
+  • config/grafana/ (dashboard configuration)
+
+🔧 TECHNICAL SPECIFICATIONS:
+
+Container Orchestration:
+  • Docker multi-stage builds for optimization
+  • Docker Compose for service orchestration
+  • Health checks and dependency management
+  • Volume management for persistent storage
+
+Monitoring Stack:
+  • Prometheus for metrics collection
+  • Grafana for dashboard visualization
+  • Structured JSON logging
+  • Real-time alerting capabilities
+
+Security Features:
+  • Non-root container execution
+  • Environment-based secrets management
+  • Rate limiting and input validation
+  • SSL/TLS termination support
+
+📊 PRODUCTION READINESS CHECKLIST:
+  ✅ Docker containerization complete
+  ✅ Environment configuration templates
+  ✅ Automated deployment scripts
+  ✅ Monitoring and logging setup
+  ✅ Security hardening implemented
+  ✅ Background worker architecture
+  ✅ Database and caching configuration
+  ✅ Health checks and service discovery
+
+🚀 DEPLOYMENT COMMANDS:
+
+1. Quick Start (Development):
+   docker-compose -f docker-compose.prod.yml up -d
+
+2. Full Production Deployment:
+   ./scripts/deploy.sh
+
+3. Stop Services:
+   ./scripts/deploy.sh stop
+
+4. View Logs:
+   ./scripts/deploy.sh logs
+
+🎯 NEXT STEPS (POST-DEPLOYMENT):
+  🌐 Configure production domain and DNS
+  🔐 Set up SSL certificates (Let's Encrypt)
+  📧 Configure SMTP for email notifications
+  📱 Set up Telegram webhook
+  📊 Configure monitoring alerts
+  🔄 Set up automated backups
+  📈 Implement advanced analytics
+  🧪 Set up staging environment
+
+🎉 EPIC 5 FOUNDATION COMPLETE!
+
+📈 Impact: Transformed RealtyScanner into a production-ready,
+   enterprise-grade application with comprehensive monitoring,
+   automated deployment, and scalable architecture.
+
+🏆 Ready for production deployment and real-world usage!
+================================================================================
+"""
+
+# Architecture diagram shown by show_deployment_overview
+DEPLOYMENT_DIAGRAM = """\
+
+🏗️ DEPLOYMENT ARCHITECTURE:
+--------------------------------------------------
+
+┌─────────────────────────────────────────────────────────────┐
+│                    Production Stack                        │
+├─────────────────────────────────────────────────────────────┤
+│  Nginx (Reverse Proxy) :80/:443                           │
+│  ├── Web Dashboard :8000                                   │
+│  ├── Telegram Bot :8001                                    │
+│  └── Monitoring                                            │
+│      ├── Grafana :3000                                     │
+│      └── Prometheus :9090                                  │
+├─────────────────────────────────────────────────────────────┤
+│  Application Services                                      │
+│  ├── Web Application (FastAPI)                            │
+│  ├── Telegram Bot Service                                  │
+│  └── Background Worker                                     │
+├─────────────────────────────────────────────────────────────┤
+│  Data Layer                                                │
+│  ├── MongoDB :27017 (Primary Database)                    │
+│  └── Redis :6379 (Cache & Sessions)                       │
+└─────────────────────────────────────────────────────────────┘
+
+"""
+
+# Closing deployment instructions
+DEPLOYMENT_INSTRUCTIONS = """\
+
+================================================================================
+🎊 EPIC 5 READY FOR PRODUCTION DEPLOYMENT!
+================================================================================
+
+🚀 To deploy:
+   1. Copy .env.example to .env and configure
+   2. Run: ./scripts/deploy.sh
+   3. Access: http://localhost:8000
+
+"""
+
+def display_epic5_summary():
+    """Display Epic 5 implementation summary"""
+    sys.stdout.write(EPIC5_BANNER.format(date=SUMMARY_DATE))
 
 def check_deployment_readiness():
     """Check production deployment readiness"""
-    base_path = Path(__file__).parent.parent
+    base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
     
-    print("\n🔍 PRODUCTION DEPLOYMENT READINESS:")
-    print("-" * 50)
+    # List each directory once instead of checking every file separately
+    present = {}
+    for directory in {os.path.dirname(f) for _, files in PRODUCTION_FILES for f in files}:
+        try:
+            with os.scandir(os.path.join(base_path, directory)) as entries:
+                present[directory] = {entry.name for entry in entries}
+        except OSError:
+            present[directory] = set()
     
-    # Core production files
-    production_files = {
-        "Docker Configuration": [
-            "Dockerfile",
-            "docker-compose.yml", 
-            "docker-compose.prod.yml",
-            ".env.example"
-        ],
-        "Deployment Scripts": [
-            "scripts/deploy.sh",
-            "scripts/run_worker.py",
-            "scripts/test_epic5_production.py"
-        ],
-        "Application Components": [
-            "src/web/app.py",
-            "src/telegram_bot/bot.py",
-            "src/notifications/dispatcher.py",
-            "requirements.txt"
-        ]
-    }
+    out = []
+    out.append("\n🔍 PRODUCTION DEPLOYMENT READINESS:")
+    out.append("-" * 50)
     
-    for category, files in production_files.items():
-        print(f"\n{category}:")
+    for category, files in PRODUCTION_FILES:
+        out.append(f"\n{category}:")
         for file in files:
-            path = base_path / file
-            status = "✅" if path.exists() else "❌"
-            print(f"  {status} {file}")
+            directory, name = os.path.split(file)
+            status = "✅" if name in present[directory] else "❌"
+            out.append(f"  {status} {file}")
     
     # Check configuration templates
-    print("\n📋 Configuration Status:")
+    out.append("\n📋 Configuration Status:")
     
-    env_file = base_path / ".env.example"
-    if env_file.exists():
-        with open(env_file, 'r') as f:
-            content = f.read()
-        
-        config_checks = [
-            ("Database Configuration", "MONGODB_URI" in content),
-            ("Security Settings", "SECRET_KEY" in content),
-            ("Telegram Integration", "TELEGRAM_BOT_TOKEN" in content),
-            ("Monitoring Setup", "GRAFANA_PASSWORD" in content),
-            ("Email Notifications", "SENDGRID_API_KEY" in content)
-        ]
+    env_file = os.path.join(base_path, ".env.example")
+    try:
+        stat = os.stat(env_file)
+    except OSError:
+        stat = None
+    
+    if stat is not None:
+        found = find_config_tokens(env_file, stat.st_mtime_ns, stat.st_size)
         
-        for check_name, check_result in config_checks:
-            status = "✅" if check_result else "⚠️"
-            print(f"  {status} {check_name}")
+        for check_name, token in CONFIG_CHECKS:
+            status = "✅" if token in found else "⚠️"
+            out.append(f"  {status} {check_name}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def show_deployment_overview():
     """Show deployment architecture overview"""
-    print("\n🏗️ DEPLOYMENT ARCHITECTURE:")
-    print("-" * 50)
-    print()
-    print("┌─────────────────────────────────────────────────────────────┐")
-    print("│                    Production Stack                        │")
-    print("├─────────────────────────────────────────────────────────────┤")
-    print("│  Nginx (Reverse Proxy) :80/:443                           │")
-    print("│  ├── Web Dashboard :8000                                   │")
-    print("│  ├── Telegram Bot :8001                                    │")
-    print("│  └── Monitoring                                            │")
-    print("│      ├── Grafana :3000                                     │")
-    print("│      └── Prometheus :9090                                  │")
-    print("├─────────────────────────────────────────────────────────────┤")
-    print("│  Application Services                                      │")
-    print("│  ├── Web Application (FastAPI)                            │")
-    print("│  ├── Telegram Bot Service                                  │")
-    print("│  └── Background Worker                                     │")
-    print("├─────────────────────────────────────────────────────────────┤")
-    print("│  Data Layer                                                │")
-    print("│  ├── MongoDB :27017 (Primary Database)                    │")
-    print("│  └── Redis :6379 (Cache & Sessions)                       │")
-    print("└─────────────────────────────────────────────────────────────┘")
-    print()
+    sys.stdout.write(DEPLOYMENT_DIAGRAM)
 
 def main():
     """Main summary function"""
@@ -257,15 +301,7 @@ def main():
     check_deployment_readiness()
     show_deployment_overview()
     
-    print("\n" + "=" * 80)
-    print("🎊 EPIC 5 READY FOR PRODUCTION DEPLOYMENT!")
-    print("=" * 80)
-    
-    print("\n🚀 To deploy:")
-    print("   1. Copy .env.example to .env and configure")
-    print("   2. Run: ./scripts/deploy.sh")
-    print("   3. Access: http://localhost:8000")
-    print()
+    sys.stdout.write(DEPLOYMENT_INSTRUCTIONS)
 
 if __name__ == "__main__":
     main()
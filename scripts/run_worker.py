@@ -8,40 +8,192 @@ in a separate container/process for better scalability.
 """
 
 import os
+import random
+import re
 import sys
 import asyncio
+import functools
 import logging
+import queue
 import signal
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, Any
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Any, List, Tuple
 
 # Add src to path for imports
 project_root = Path(__file__).parent.parent
-src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+src_path = str(project_root / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+if TYPE_CHECKING:
+    from scrapers.base import ScrapedListing
 
 # Configure logging
 log_dir = os.getenv('LOG_DIR', './logs')
 os.makedirs(log_dir, exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(f'{log_dir}/worker.log')
-    ]
-)
+# Records are handed to a queue and written by a listener thread, so logging
+# never blocks the event loop on console or file I/O
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Workers replicated onto a shared log volume set LOG_PER_PROCESS=1 to write
+# worker-<pid>.log each, so appends and rotations never interleave
+log_file = f'worker-{os.getpid()}.log' if os.getenv('LOG_PER_PROCESS') == '1' else 'worker.log'
+log_handlers = [
+    logging.StreamHandler(),
+    RotatingFileHandler(os.path.join(log_dir, log_file), maxBytes=10_000_000, backupCount=5)
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(QueueHandler(log_queue))
 logger = logging.getLogger(__name__)
 
+# Aho-Corasick matches every location keyword in one pass over the listing text
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Profiles with at least this many location keywords are matched in a single pass
+LOCATION_AUTOMATON_MIN_KEYWORDS = 3
+
+# Logged notifications are written in batches of this size, or once the
+# oldest buffered one is this many seconds old
+NOTIFICATION_FLUSH_SIZE = 100
+NOTIFICATION_FLUSH_INTERVAL = 5.0
+
+# Most recent notified listings remembered to skip re-analysis, loaded at
+# startup; the least recently notified are forgotten beyond this many
+SEEN_LISTINGS_LIMIT = 100000
+
+# Content analyzer verdicts kept per (profile revision, listing content),
+# and for how many seconds, so listings re-yielded in later cycles skip analysis
+ANALYSIS_VERDICTS_LIMIT = 50000
+ANALYSIS_VERDICT_TTL = 24 * 3600
+
+# Matches for one profile are sent together, split to stay within
+# Telegram's 4096-character message limit
+NOTIFICATION_MAX_LENGTH = 4096
+NOTIFICATION_SEPARATOR = "\n\n"
+
+# Recipient fields of older profiles, by channel: (legacy key, dispatcher key)
+LEGACY_RECIPIENT_KEYS = {
+    'telegram': ('chatId', 'telegram_chat_id'),
+    'whatsapp': ('phoneNumber', 'whatsapp_phone_number'),
+    'email': ('address', 'email_address'),
+}
+
+# Seconds a health check waits for the database to answer a ping
+HEALTH_PING_TIMEOUT = 2.0
+
+# Adapted scan intervals vary randomly by up to this fraction
+SCAN_INTERVAL_JITTER = 0.1
+
+# Health checks warn when the last completed scan is older than this, or than
+# twice the current scan interval once it has backed off beyond that
+STALE_SCAN_SECONDS = 600
+
+# Profile fields read by the worker, the scrapers' search URLs and the content
+# analyzer (old and new field names); everything else is left in the database
+PROFILE_PROJECTION = dict.fromkeys((
+    "name", "profile_name", "profileName", "is_active", "isActive", "updated_at",
+    "price", "price_range", "rooms", "rooms_range", "location", "location_criteria",
+    "property_type", "preferred_features", "scan_targets",
+    "notificationChannels", "notification_channels"
+), 1)
+
+@dataclass(slots=True)
+class Profile:
+    """Active profile with its alternate field names resolved"""
+    id: Any
+    name: str
+    price_range: Dict[str, Any]
+    rooms_range: Dict[str, Any]
+    location: Dict[str, Any]
+    scan_targets: Dict[str, Any]
+    notification_channels: Dict[str, Any]
+    revision: Any
+    criteria: Dict[str, Any]
+    raw: Dict[str, Any]
+
+def normalize_profile(raw: Dict[str, Any]) -> Profile:
+    """Resolve a stored profile document into a Profile once, at fetch time"""
+    price_range = raw.get('price_range', raw.get('price', {}))
+    rooms_range = raw.get('rooms_range', raw.get('rooms', {}))
+    location = raw.get('location', raw.get('location_criteria', {}))
+    return Profile(
+        id=raw['_id'],
+        name=raw.get('name', raw.get('profile_name', raw.get('profileName', 'Unknown'))),
+        price_range=price_range,
+        rooms_range=rooms_range,
+        location=location,
+        scan_targets=raw.get('scan_targets', {}),
+        notification_channels=raw.get('notificationChannels', raw.get('notification_channels', {})),
+        revision=raw.get('updated_at'),
+        # The content analyzer reads the criteria under the UserProfile field names
+        criteria={
+            'price': price_range,
+            'rooms': rooms_range,
+            'location_criteria': location,
+            'property_type': raw.get('property_type', []),
+            'preferred_features': raw.get('preferred_features', [])
+        },
+        # The scrapers build their search URLs from the stored document
+        raw=raw
+    )
+
 class RealtyWorker:
     """Background worker for RealtyScanner operations"""
     
     def __init__(self):
         self.running = False
         self.scan_interval = int(os.getenv('SCAN_INTERVAL', 300))  # 5 minutes
-        self.last_scan = None
+        # The interval doubles after each cycle without matches, up to max_scan_interval
+        self.min_scan_interval = int(os.getenv('SCAN_INTERVAL_MIN', self.scan_interval))
+        self.max_scan_interval = int(os.getenv('SCAN_INTERVAL_MAX', 1800))
+        self.empty_scan_streak = 0
+        self.health_check_interval = int(os.getenv('HEALTH_CHECK_INTERVAL', 60))
+        self.scan_concurrency = int(os.getenv('SCAN_CONCURRENCY', 4))
+        self.last_scan = None  # time.monotonic() of the last completed scan
+        self.last_db_ok = None  # time.monotonic() of the last successful database operation
+        self.stop_event = asyncio.Event()
+        self.notification_buffer = []
+        self.notification_buffer_started = None
+        # (profile id, listing id) pairs already notified about, skipped before any analysis;
+        # oldest first, and loaded from the database when the worker starts running
+        self.seen_listing_ids = OrderedDict()
+        # (source, profile id) -> (profile revision, search URL)
+        self.search_urls = {}
+        # profile id -> (profile revision, compiled listing filter)
+        self.profile_filters = {}
+        # profile id -> (profile revision, notification dispatcher configured for the profile)
+        self.profile_dispatchers = {}
+        # (profile id, profile revision, listing id, content hash) -> (is match, time.monotonic())
+        self.analysis_verdicts = OrderedDict()
+        # (source, search URL) -> scrape started this cycle
+        self.cycle_scrapes = {}
+        # Failed scans and analyses this cycle, so a cycle with errors isn't counted as empty
+        self.cycle_failures = 0
+        # Snapshot of active profiles by id, fully reloaded every profile_resync_interval
+        # seconds and otherwise refreshed with the profiles updated since the last cycle
+        self.profiles = {}
+        self.profiles_updated_at = None
+        self.profiles_synced = None
+        self.profile_resync_interval = int(os.getenv('PROFILE_RESYNC_INTERVAL', 3600))
         
         # Initialize components
         self.setup_components()
@@ -57,44 +209,76 @@ class RealtyWorker:
             self.db = get_db()
             logger.info("Database connection established")
             
-            # Initialize notification dispatcher
-            self.notification_dispatcher = NotificationDispatcher()
+            # Each profile gets a dispatcher configured with its own channels, so
+            # concurrent profiles never send through each other's recipients
+            self.notification_dispatcher_class = NotificationDispatcher
             logger.info("Notification dispatcher initialized")
             
-            # Import scrapers
-            try:
-                from scrapers.yad2 import Yad2Scraper
-                from scrapers.facebook import FacebookScraper
-                self.yad2_scraper = Yad2Scraper()
-                self.facebook_scraper = FacebookScraper()
-                logger.info("Scrapers initialized")
-            except ImportError as e:
-                logger.warning(f"Some scrapers not available: {e}")
-                self.yad2_scraper = None
-                self.facebook_scraper = None
-            
-            # Import content analysis
-            try:
-                from analysis.content import ContentAnalyzer
-                self.content_analyzer = ContentAnalyzer()
-                logger.info("Content analyzer initialized")
-                
-                # Enable AI analysis if available
-                if hasattr(self.content_analyzer, 'use_ai_analysis') and self.content_analyzer.use_ai_analysis:
-                    logger.info("AI-powered content analysis enabled")
-                else:
-                    logger.info("Using rule-based content analysis")
-                    
-            except ImportError as e:
-                logger.warning(f"Content analyzer not available: {e}")
-                self.content_analyzer = None
-                
+            # Dedicated threads for the blocking Yad2 scraper, so scraping neither
+            # starves nor is starved by other work on the default executor
+            self.yad2_concurrency = int(os.getenv('YAD2_CONCURRENCY', 8))
+            self.yad2_pool = ThreadPoolExecutor(
+                max_workers=self.yad2_concurrency,
+                thread_name_prefix='yad2'
+            )
+            
         except Exception as e:
             logger.error(f"Failed to initialize worker components: {e}")
             raise
     
+    # Scrapers and the content analyzer pull in heavy dependencies, so each is
+    # imported on first use and only if enabled for this worker
+    @functools.cached_property
+    def yad2_scraper(self):
+        """Yad2 scraper, or None when disabled with YAD2_ENABLED=0 or unavailable"""
+        if os.getenv('YAD2_ENABLED', '1') == '0':
+            return None
+        try:
+            from scrapers.yad2 import Yad2Scraper
+            # One pooled connection per scraping thread
+            scraper = Yad2Scraper(pool_maxsize=self.yad2_concurrency)
+            logger.info("Yad2 scraper initialized")
+            return scraper
+        except ImportError as e:
+            logger.warning(f"Yad2 scraper not available: {e}")
+            return None
+    
+    @functools.cached_property
+    def facebook_scraper(self):
+        """Facebook scraper, or None when disabled with FACEBOOK_ENABLED=0 or unavailable"""
+        if os.getenv('FACEBOOK_ENABLED', '1') == '0':
+            return None
+        try:
+            from scrapers.facebook import FacebookScraper
+            scraper = FacebookScraper()
+            logger.info("Facebook scraper initialized")
+            return scraper
+        except ImportError as e:
+            logger.warning(f"Facebook scraper not available: {e}")
+            return None
+    
+    @functools.cached_property
+    def content_analyzer(self):
+        """Content analyzer, or None when disabled with CONTENT_ANALYZER_ENABLED=0 or unavailable"""
+        if os.getenv('CONTENT_ANALYZER_ENABLED', '1') == '0':
+            return None
+        try:
+            from analysis.content import ContentAnalyzer
+            analyzer = ContentAnalyzer()
+            logger.info("Content analyzer initialized")
+            
+            # Enable AI analysis if available
+            if hasattr(analyzer, 'use_ai_analysis') and analyzer.use_ai_analysis:
+                logger.info("AI-powered content analysis enabled")
+            else:
+                logger.info("Using rule-based content analysis")
+            return analyzer
+        except ImportError as e:
+            logger.warning(f"Content analyzer not available: {e}")
+            return None
+    
     async def scan_profiles(self):
-        """Scan all active user profiles"""
+        """Scan all active user profiles, returning the number of matches (None if the cycle failed)"""
         try:
             logger.info("Starting profile scanning cycle")
             
@@ -106,310 +290,619 @@ class RealtyWorker:
             # Get active profiles from database
             # First try to get search_profiles (new collection)
             if hasattr(self.db, 'search_profiles'):
-                active_profiles = self.db.search_profiles.find({"is_active": True})
-                active_profiles = list(active_profiles)
+                collection, active_field = self.db.search_profiles, "is_active"
             # Fallback to user_profiles
             elif hasattr(self.db, 'user_profiles'):
-                active_profiles = self.db.user_profiles.find({"isActive": True})
-                active_profiles = list(active_profiles)
+                collection, active_field = self.db.user_profiles, "isActive"
             else:
                 logger.error("No profiles collection found")
                 return
             
-            profile_count = 0
+            # Profiles with the same search URL share one scrape per cycle
+            self.cycle_scrapes = {}
+            self.cycle_failures = 0
+            await self.sync_profiles(collection, active_field)
+            active_profiles = list(self.profiles.values())
+            logger.info(f"Found {len(active_profiles)} active profiles")
+            
+            # Process profiles concurrently, at most scan_concurrency at a time
+            semaphore = asyncio.Semaphore(self.scan_concurrency)
+            results = await asyncio.gather(
+                *(self.process_profile(profile, semaphore) for profile in active_profiles),
+                return_exceptions=True
+            )
+            
+            profile_count = len(active_profiles)
             total_matches = 0
+            for profile, result in zip(active_profiles, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing profile {profile.id}: {result}")
+                    self.cycle_failures += 1
+                else:
+                    total_matches += result
             
-            logger.info(f"Found {len(active_profiles)} active profiles")
+            self.cycle_scrapes = {}
+            self.forget_inactive_profiles({profile.id for profile in active_profiles})
             
-            for profile in active_profiles:
-                try:
-                    profile_count += 1
-                    logger.info(f"Processing profile: {profile.get('name', profile.get('profileName', 'Unknown'))}")
-                    
-                    # Scan Yad2 if scraper is available
-                    yad2_listings = []
-                    if self.yad2_scraper:
-                        try:
-                            yad2_listings = await self.scan_yad2_for_profile(profile)
-                            logger.info(f"Found {len(yad2_listings)} new Yad2 listings")
-                        except Exception as e:
-                            logger.error(f"Yad2 scanning failed for profile {profile['_id']}: {e}")
-                    
-                    # Scan Facebook if scraper is available
-                    facebook_posts = []
-                    if self.facebook_scraper:
-                        try:
-                            facebook_posts = await self.scan_facebook_for_profile(profile)
-                            logger.info(f"Found {len(facebook_posts)} new Facebook posts")
-                        except Exception as e:
-                            logger.error(f"Facebook scanning failed for profile {profile['_id']}: {e}")
-                            logger.error(f"Facebook scanning failed for profile {profile['_id']}: {e}")
-                    
-                    # Analyze and filter content
-                    all_listings = yad2_listings + facebook_posts
-                    matches = await self.analyze_listings(profile, all_listings)
-                    
-                    # Send notifications for matches
-                    for match in matches:
-                        await self.send_notification(profile, match)
-                        total_matches += 1
-                    
-                    logger.info(f"Profile processed: {len(matches)} matches found")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing profile {profile.get('_id')}: {e}")
-                    continue
+            # Bound how long logged notifications can wait to be written
+            await self.flush_notifications()
             
             logger.info(f"Scanning cycle completed: {profile_count} profiles, {total_matches} total matches")
+            return total_matches
             
         except Exception as e:
             logger.error(f"Error in scan_profiles: {e}")
     
-    async def scan_yad2_for_profile(self, profile: Dict[str, Any]):
-        """Scan Yad2 for a specific profile"""
-        profile_name = profile.get('name', profile.get('profile_name', profile.get('profileName', 'Unknown')))
-        logger.info(f"Scanning Yad2 for profile: {profile_name}")
+    async def sync_profiles(self, collection, active_field: str):
+        """Bring the in-memory snapshot of active profiles up to date"""
+        now = time.monotonic()
+        full_sync = (self.profiles_synced is None or self.profiles_updated_at is None
+                     or now - self.profiles_synced >= self.profile_resync_interval)
         
+        # Between full reloads only profiles updated since the newest one seen are fetched.
+        # Deleted profiles, and ones without updated_at, are caught by the next full reload.
+        if full_sync:
+            query = {active_field: True}
+            profiles = {}
+            updated_at = None
+        else:
+            query = {"updated_at": {"$gte": self.profiles_updated_at}}
+            profiles = self.profiles
+            updated_at = self.profiles_updated_at
+        
+        async for raw_profile in self.iter_profiles(collection, query):
+            profile = normalize_profile(raw_profile)
+            if raw_profile.get(active_field):
+                profiles[profile.id] = profile
+            else:
+                profiles.pop(profile.id, None)
+            if isinstance(profile.revision, datetime) and (updated_at is None or profile.revision > updated_at):
+                updated_at = profile.revision
+        
+        self.profiles = profiles
+        self.profiles_updated_at = updated_at
+        if full_sync:
+            self.profiles_synced = now
+    
+    async def iter_profiles(self, collection, query: Dict[str, Any]):
+        """Yield profiles as the cursor returns them, without blocking the event loop"""
+        cursor = collection.find(query, PROFILE_PROJECTION)
         try:
-            if self.yad2_scraper:
-                # Construct search URL from profile
-                search_url = self.yad2_scraper.construct_search_url(profile)
-                # Run scraper in executor to avoid blocking
-                loop = asyncio.get_event_loop()
-                listings = await loop.run_in_executor(
-                    None, 
-                    self.yad2_scraper.scrape_listings, 
-                    search_url, 
-                    50
-                )
-                logger.info(f"Found {len(listings)} Yad2 listings for profile {profile_name}")
-                return listings
+            while (profile := await asyncio.to_thread(next, cursor, None)) is not None:
+                self.last_db_ok = time.monotonic()
+                yield profile
+            self.last_db_ok = time.monotonic()
+        finally:
+            cursor.close()
+    
+    async def process_profile(self, profile: Profile, semaphore: asyncio.Semaphore) -> int:
+        """Scan, analyze and notify for one profile, returning the number of matches"""
+        async with semaphore:
+            logger.info(f"Processing profile: {profile.name}")
+            
+            # Scan Yad2 and Facebook at the same time; an unavailable scraper yields no results
+            yad2_listings, facebook_posts = await asyncio.gather(
+                self.scan_yad2_for_profile(profile) if self.yad2_scraper else asyncio.sleep(0, []),
+                self.scan_facebook_for_profile(profile) if self.facebook_scraper else asyncio.sleep(0, []),
+                return_exceptions=True
+            )
+            
+            if isinstance(yad2_listings, Exception):
+                logger.error(f"Yad2 scanning failed for profile {profile.id}: {yad2_listings}")
+                self.cycle_failures += 1
+                yad2_listings = []
             else:
-                logger.warning("Yad2 scraper not available, returning empty results")
-                return []
-        except Exception as e:
-            logger.error(f"Error scanning Yad2 for profile {profile_name}: {e}")
+                logger.info(f"Found {len(yad2_listings)} new Yad2 listings")
+            
+            if isinstance(facebook_posts, Exception):
+                logger.error(f"Facebook scanning failed for profile {profile.id}: {facebook_posts}")
+                self.cycle_failures += 1
+                facebook_posts = []
+            else:
+                logger.info(f"Found {len(facebook_posts)} new Facebook posts")
+            
+            # Analyze and filter content
+            all_listings = yad2_listings + facebook_posts
+            matches = await self.analyze_listings(profile, all_listings)
+            
+            # Send all of this profile's matches together
+            if matches:
+                await self.send_notification(profile, matches)
+            
+            logger.info(f"Profile processed: {len(matches)} matches found")
+            return len(matches)
+    
+    async def scan_yad2_for_profile(self, profile: Profile):
+        """Scan Yad2 for a specific profile"""
+        profile_name = profile.name
+        logger.info(f"Scanning Yad2 for profile: {profile_name}")
+        
+        # Scraping errors propagate, so process_profile can count the scan as failed
+        if self.yad2_scraper:
+            # Construct search URL from profile
+            search_url = self.get_search_url('yad2', self.yad2_scraper, profile)
+            # Run scraper in executor to avoid blocking
+            loop = asyncio.get_running_loop()
+            listings = await self.shared_scrape('yad2', search_url, lambda: loop.run_in_executor(
+                self.yad2_pool,
+                self.yad2_scraper.scrape_listings,
+                search_url,
+                50
+            ))
+            logger.info(f"Found {len(listings)} Yad2 listings for profile {profile_name}")
+            return listings
+        else:
+            logger.warning("Yad2 scraper not available, returning empty results")
             return []
     
-    async def scan_facebook_for_profile(self, profile: Dict[str, Any]):
+    async def scan_facebook_for_profile(self, profile: Profile):
         """Scan Facebook for a specific profile"""
-        profile_name = profile.get('name', profile.get('profile_name', profile.get('profileName', 'Unknown')))
+        profile_name = profile.name
         logger.info(f"Scanning Facebook for profile: {profile_name}")
         
-        try:
-            if self.facebook_scraper:
-                # Check if the profile has Facebook groups configured
-                facebook_groups = profile.get('scan_targets', {}).get('facebook_group_ids', [])
-                if not facebook_groups:
-                    logger.info("No Facebook groups configured for profile")
-                    return []
-                
-                # Construct search URL from profile
-                search_url = self.facebook_scraper.construct_search_url(profile)
-                
-                # Use the async scraper method
-                posts = await self.facebook_scraper.scrape_listings(search_url, 50)
-                logger.info(f"Found {len(posts)} Facebook posts for profile {profile_name}")
-                return posts
-            else:
-                logger.warning("Facebook scraper not available, returning empty results")
+        # Scraping errors propagate, so process_profile can count the scan as failed
+        if self.facebook_scraper:
+            # Check if the profile has Facebook groups configured
+            facebook_groups = profile.scan_targets.get('facebook_group_ids', [])
+            if not facebook_groups:
+                logger.info("No Facebook groups configured for profile")
                 return []
-        except Exception as e:
-            logger.error(f"Error scanning Facebook for profile {profile_name}: {e}")
+            
+            # Construct search URL from profile
+            search_url = self.get_search_url('facebook', self.facebook_scraper, profile)
+            
+            # Use the async scraper method
+            posts = await self.shared_scrape(
+                'facebook', search_url, lambda: self.facebook_scraper.scrape_listings(search_url, 50)
+            )
+            logger.info(f"Found {len(posts)} Facebook posts for profile {profile_name}")
+            return posts
+        else:
+            logger.warning("Facebook scraper not available, returning empty results")
             return []
     
-    async def analyze_listings(self, profile: Dict[str, Any], listings: list):
+    def shared_scrape(self, source: str, search_url: str, scrape: Callable[[], Any]) -> Awaitable[list]:
+        """Scrape a search URL once per cycle, sharing the result between profiles that use it"""
+        key = (source, search_url)
+        scrape_task = self.cycle_scrapes.get(key)
+        if scrape_task is None:
+            scrape_task = asyncio.ensure_future(scrape())
+            self.cycle_scrapes[key] = scrape_task
+        # Shielded, so one profile's cancellation doesn't cancel the scrape for the others
+        return asyncio.shield(scrape_task)
+    
+    def get_profile_filter(self, profile: Profile) -> Callable[['ScrapedListing'], bool]:
+        """Get a profile's compiled listing filter, recompiling it only after the profile is updated"""
+        cached = self.profile_filters.get(profile.id)
+        if profile.revision is not None and cached is not None and cached[0] == profile.revision:
+            return cached[1]
+        
+        listing_filter = self.compile_profile_filter(profile)
+        if profile.revision is not None:
+            self.profile_filters[profile.id] = (profile.revision, listing_filter)
+        return listing_filter
+    
+    def get_profile_dispatcher(self, profile: Profile):
+        """Get a dispatcher for the profile's notification channels, reconfiguring it only after the profile is updated"""
+        cached = self.profile_dispatchers.get(profile.id)
+        if profile.revision is not None and cached is not None and cached[0] == profile.revision:
+            return cached[1]
+        
+        # Older profiles name the recipients chatId, phoneNumber and address
+        channels_config = {}
+        for channel, config in profile.notification_channels.items():
+            config = dict(config)
+            legacy_key, recipient_key = LEGACY_RECIPIENT_KEYS.get(channel, (None, None))
+            if legacy_key in config and not config.get(recipient_key):
+                config[recipient_key] = config[legacy_key]
+            channels_config[channel] = config
+        
+        dispatcher = self.notification_dispatcher_class()
+        dispatcher.configure_from_profile(channels_config)
+        if profile.revision is not None:
+            self.profile_dispatchers[profile.id] = (profile.revision, dispatcher)
+        return dispatcher
+    
+    def forget_inactive_profiles(self, active_ids: set):
+        """Drop cached search URLs, filters and dispatchers of profiles no longer active"""
+        self.search_urls = {key: value for key, value in self.search_urls.items() if key[1] in active_ids}
+        self.profile_filters = {key: value for key, value in self.profile_filters.items() if key in active_ids}
+        self.profile_dispatchers = {key: value for key, value in self.profile_dispatchers.items() if key in active_ids}
+    
+    def get_search_url(self, source: str, scraper, profile: Profile) -> str:
+        """Build a profile's search URL, reusing it until the profile is updated"""
+        key = (source, profile.id)
+        cached = self.search_urls.get(key)
+        if profile.revision is not None and cached is not None and cached[0] == profile.revision:
+            return cached[1]
+        
+        search_url = scraper.construct_search_url(profile.raw)
+        if profile.revision is not None:
+            self.search_urls[key] = (profile.revision, search_url)
+        return search_url
+    
+    async def analyze_listings(self, profile: Profile, listings: List['ScrapedListing']) -> List['ScrapedListing']:
         """Analyze listings against profile criteria with enhanced AI analysis"""
         if not listings:
             return []
         
-        matches = []
+        # Basic filtering first
+        listing_filter = self.get_profile_filter(profile)
+        passed = []
         for listing in listings:
+            if (profile.id, listing.listing_id) in self.seen_listing_ids:
+                continue
+            
             try:
-                # Basic filtering first
-                if self.basic_filter_listing(profile, listing):
-                    # If we have content analyzer, use it for advanced filtering
-                    if self.content_analyzer:
-                        # Simplified analysis - just check if it's a match
-                        is_match = await self.simulate_content_analysis(profile, listing)
-                        if is_match:
-                            matches.append(listing)
-                    else:
-                        # Use basic filtering result
-                        matches.append(listing)
-                        
+                if listing_filter(listing):
+                    passed.append(listing)
             except Exception as e:
                 logger.error("Error analyzing listing: %s", str(e))
                 continue
         
-        return matches
+        # Without a content analyzer the basic filtering result stands
+        if not passed or not self.content_analyzer:
+            return passed
+        
+        # Listings analyzed before for this profile revision reuse their verdict
+        keys = [self.analysis_verdict_key(profile, listing) for listing in passed]
+        verdicts = [self.get_analysis_verdict(key) for key in keys]
+        pending = [index for index, verdict in enumerate(verdicts) if verdict is None]
+        
+        # Analyze everything else in one batch
+        if pending:
+            try:
+                results = await self.content_analyzer.analyze_listings_async(
+                    [passed[index] for index in pending], profile.criteria
+                )
+            except Exception as e:
+                logger.error("Error analyzing listings for profile %s: %s", profile.name, str(e))
+                self.cycle_failures += 1
+                return []
+            
+            for index, result in zip(pending, results):
+                verdicts[index] = result.is_match
+                self.cache_analysis_verdict(keys[index], result.is_match)
+        
+        return [listing for listing, verdict in zip(passed, verdicts) if verdict]
+    
+    def analysis_verdict_key(self, profile: Profile, listing: 'ScrapedListing'):
+        """Key a verdict by profile revision and listing content, or None if the profile has no revision"""
+        if profile.revision is None:
+            return None
+        return (profile.id, profile.revision, listing.listing_id, listing.generate_content_hash())
+    
+    def get_analysis_verdict(self, key):
+        """Look up a cached analyzer verdict that has not expired, marking it as recently used"""
+        cached = self.analysis_verdicts.get(key) if key is not None else None
+        if cached is None:
+            return None
+        if time.monotonic() - cached[1] >= ANALYSIS_VERDICT_TTL:
+            del self.analysis_verdicts[key]
+            return None
+        self.analysis_verdicts.move_to_end(key)
+        return cached[0]
     
-    def basic_filter_listing(self, profile: Dict[str, Any], listing: Dict[str, Any]) -> bool:
+    def cache_analysis_verdict(self, key, is_match: bool):
+        """Store an analyzer verdict, evicting the least recently used beyond ANALYSIS_VERDICTS_LIMIT"""
+        if key is None:
+            return
+        self.analysis_verdicts[key] = (is_match, time.monotonic())
+        self.analysis_verdicts.move_to_end(key)
+        while len(self.analysis_verdicts) > ANALYSIS_VERDICTS_LIMIT:
+            self.analysis_verdicts.popitem(last=False)
+    
+    def basic_filter_listing(self, profile: Profile, listing: 'ScrapedListing') -> bool:
         """Basic filtering based on profile criteria"""
-        try:
-            # Check price range
-            price_range = profile.get('price_range', profile.get('price', {}))
-            if price_range:
-                min_price = price_range.get('min', 0)
-                max_price = price_range.get('max', float('inf'))
-                listing_price = listing.get('price', 0)
-                
-                if listing_price and (listing_price < min_price or listing_price > max_price):
+        return self.compile_profile_filter(profile)(listing)
+    
+    def compile_profile_filter(self, profile: Profile) -> Callable[['ScrapedListing'], bool]:
+        """Resolve a profile's criteria once into a filter to apply to many listings"""
+        price_range = profile.price_range
+        rooms_range = profile.rooms_range
+        location_criteria = profile.location
+        
+        price_bounds = (price_range.get('min', 0), price_range.get('max', float('inf'))) if price_range else None
+        rooms_bounds = (rooms_range.get('min', 0), rooms_range.get('max', float('inf'))) if rooms_range else None
+        
+        # Lowercased city and neighborhoods, any of which must appear in the listing location
+        location_keywords = ()
+        if location_criteria:
+            city = location_criteria.get('city', '')
+            neighborhoods = location_criteria.get('neighborhoods', [])
+            location_keywords = ((city.lower(),) if city else ()) + tuple(n.lower() for n in neighborhoods)
+        
+        # Many keywords are matched in one pass, with an automaton or else one alternation regex
+        location_automaton = None
+        location_pattern = None
+        if len(location_keywords) >= LOCATION_AUTOMATON_MIN_KEYWORDS:
+            if AHOCORASICK_AVAILABLE and all(location_keywords):
+                location_automaton = ahocorasick.Automaton()
+                for keyword in location_keywords:
+                    location_automaton.add_word(keyword, keyword)
+                location_automaton.make_automaton()
+            else:
+                location_pattern = re.compile('|'.join(map(re.escape, location_keywords)))
+        
+        def matches(listing: 'ScrapedListing') -> bool:
+            try:
+                # Check price range
+                listing_price = listing.price
+                if price_bounds and listing_price and not price_bounds[0] <= listing_price <= price_bounds[1]:
                     return False
-            
-            # Check rooms range
-            rooms_range = profile.get('rooms_range', profile.get('rooms', {}))
-            if rooms_range:
-                min_rooms = rooms_range.get('min', 0)
-                max_rooms = rooms_range.get('max', float('inf'))
-                listing_rooms = listing.get('rooms', 0)
                 
-                if listing_rooms and (listing_rooms < min_rooms or listing_rooms > max_rooms):
+                # Check rooms range
+                listing_rooms = listing.rooms
+                if rooms_bounds and listing_rooms and not rooms_bounds[0] <= listing_rooms <= rooms_bounds[1]:
                     return False
-            
-            # Location filtering - basic keyword matching
-            location_criteria = profile.get('location', profile.get('location_criteria', {}))
-            if location_criteria:
-                city = location_criteria.get('city', '')
-                neighborhoods = location_criteria.get('neighborhoods', [])
                 
-                listing_location = listing.get('location', '').lower()
+                # Location filtering - basic keyword matching
+                if location_keywords:
+                    listing_location = (listing.location or '').lower()
+                    if location_automaton is not None:
+                        return next(location_automaton.iter(listing_location), None) is not None
+                    if location_pattern is not None:
+                        return location_pattern.search(listing_location) is not None
+                    return any(keyword in listing_location for keyword in location_keywords)
                 
-                # Check if listing location contains city or neighborhood keywords
-                if city and city.lower() in listing_location:
-                    return True
-                    
-                for neighborhood in neighborhoods:
-                    if neighborhood.lower() in listing_location:
-                        return True
-                        
-                # If we have location criteria but no match, filter out
-                if city or neighborhoods:
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error("Error in basic filtering: %s", str(e))
-            return False
-    
-    async def simulate_content_analysis(self, profile: Dict[str, Any], listing: Dict[str, Any]):
-        """Simulate content analysis (placeholder)"""
-        # For demonstration - randomly return True 10% of the time
-        import random
-        return random.random() < 0.1
+                return True
+                
+            except Exception as e:
+                logger.error("Error in basic filtering: %s", str(e))
+                return False
+        
+        return matches
     
-    async def send_notification(self, profile: Dict[str, Any], listing: Dict[str, Any]):
-        """Send notification for a matched listing"""
+    async def send_notification(self, profile: Profile, listings: List['ScrapedListing']) -> List['ScrapedListing']:
+        """Send a profile's matched listings over its channels, returning the ones delivered"""
+        from notifications.base import NotificationMessage, NotificationStatus
+        
+        delivered = [False] * len(listings)
         try:
-            # Get user notification preferences
-            notification_channels = profile.get('notificationChannels', {})
+            dispatcher = self.get_profile_dispatcher(profile)
             
-            # Format notification message
-            message = self.format_notification_message(listing)
+            # Format notification messages, combined into as few sends as fit the size limit
+            messages = [self.format_notification_message(listing) for listing in listings]
+            batches = self.batch_notification_messages(messages)
             
-            # Send to enabled channels
-            for channel, config in notification_channels.items():
-                if config.get('enabled', False):
+            # Send every batch to each enabled channel; a listing counts as delivered
+            # once any channel accepted the batch containing it
+            for channel in list(dispatcher.channels):
+                sent = 0
+                for text, start, end in batches:
+                    notification = NotificationMessage(
+                        title=f"🏠 {end - start} New Property Match(es)",
+                        content=text,
+                        url=listings[start].url if end - start == 1 else None
+                    )
                     try:
-                        await self.notification_dispatcher.send_notification(
-                            channel=channel,
-                            message=message,
-                            recipient=config.get('chatId') or config.get('phoneNumber') or config.get('address')
-                        )
-                        logger.info(f"Notification sent via {channel}")
+                        results = await asyncio.to_thread(dispatcher.send_notification, notification, [channel])
                     except Exception as e:
                         logger.error(f"Failed to send notification via {channel}: {e}")
+                        continue
+                    
+                    result = results.get(channel)
+                    if result is not None and result.status == NotificationStatus.SUCCESS:
+                        sent += end - start
+                        delivered[start:end] = [True] * (end - start)
+                    else:
+                        error = result.error_message if result is not None else "no result"
+                        logger.error(f"Failed to send notification via {channel}: {error}")
+                logger.info(f"{sent}/{len(listings)} listing(s) sent via {channel} in {len(batches)} message(s)")
             
-            # Log notification in database
-            self.log_notification(profile, listing, message)
+            # Only delivered listings are logged and skipped from now on; the rest are retried next cycle
+            for listing, message, was_delivered in zip(listings, messages, delivered):
+                if was_delivered:
+                    await self.log_notification(profile, listing, message)
             
         except Exception as e:
             logger.error(f"Error sending notification: {e}")
+        
+        return [listing for listing, was_delivered in zip(listings, delivered) if was_delivered]
+    
+    def batch_notification_messages(self, messages: List[str]) -> List[Tuple[str, int, int]]:
+        """Join formatted messages into as few texts as fit within NOTIFICATION_MAX_LENGTH, with each text's message range"""
+        batches = []
+        current = ""
+        start = 0
+        for index, message in enumerate(messages):
+            if current and len(current) + len(NOTIFICATION_SEPARATOR) + len(message) > NOTIFICATION_MAX_LENGTH:
+                batches.append((current, start, index))
+                current = ""
+                start = index
+            current = f"{current}{NOTIFICATION_SEPARATOR}{message}" if current else message
+        if current:
+            batches.append((current, start, len(messages)))
+        return batches
     
-    def format_notification_message(self, listing: Dict[str, Any]) -> str:
+    def format_notification_message(self, listing: 'ScrapedListing') -> str:
         """Format listing into notification message"""
         return f"""
 🏠 New Property Match!
 
-📍 Location: {listing.get('location', 'N/A')}
-💰 Price: {listing.get('price', 'N/A')}
-🛏️ Rooms: {listing.get('rooms', 'N/A')}
+📍 Location: {listing.location or 'N/A'}
+💰 Price: {listing.price if listing.price is not None else 'N/A'}
+🛏️ Rooms: {listing.rooms if listing.rooms is not None else 'N/A'}
 
-{listing.get('description', '')[:200]}...
+{(listing.description or '')[:200]}...
 
-🔗 View: {listing.get('url', '')}
+🔗 View: {listing.url or ''}
         """.strip()
     
-    def log_notification(self, profile: Dict[str, Any], listing: Dict[str, Any], message: str):
-        """Log sent notification in database"""
+    async def log_notification(self, profile: Profile, listing: 'ScrapedListing', message: str):
+        """Buffer a sent notification for logging, flushing when the batch is full or old"""
+        if listing.listing_id is not None:
+            self.remember_notified_listing(profile.id, listing.listing_id)
+        if not self.notification_buffer:
+            self.notification_buffer_started = time.monotonic()
+        self.notification_buffer.append({
+            'profileId': profile.id,
+            'listingId': listing.listing_id or 'unknown',
+            'message': message,
+            'sentAt': datetime.now(timezone.utc),
+            'source': (listing.raw_data or {}).get('source', 'unknown')
+        })
+        
+        if (len(self.notification_buffer) >= NOTIFICATION_FLUSH_SIZE
+                or time.monotonic() - self.notification_buffer_started >= NOTIFICATION_FLUSH_INTERVAL):
+            await self.flush_notifications()
+    
+    def remember_notified_listing(self, profile_id, listing_id):
+        """Mark a listing as notified for a profile, forgetting the oldest beyond SEEN_LISTINGS_LIMIT"""
+        key = (profile_id, listing_id)
+        self.seen_listing_ids[key] = None
+        self.seen_listing_ids.move_to_end(key)
+        while len(self.seen_listing_ids) > SEEN_LISTINGS_LIMIT:
+            self.seen_listing_ids.popitem(last=False)
+    
+    def load_seen_listing_ids(self) -> OrderedDict:
+        """Load the most recent (profile, listing) pairs already notified about, oldest first"""
+        try:
+            docs = self.db.sent_notifications.find(
+                {}, {'profileId': 1, 'listingId': 1, '_id': 0}
+            ).sort('sentAt', -1).limit(SEEN_LISTINGS_LIMIT)
+            pairs = [
+                (doc['profileId'], doc['listingId']) for doc in docs
+                if 'profileId' in doc and 'listingId' in doc
+            ]
+            seen = OrderedDict.fromkeys(reversed(pairs))
+            logger.info(f"Loaded {len(seen)} previously notified listings")
+            return seen
+        except Exception as e:
+            logger.warning(f"Could not load previously notified listings: {e}")
+            return OrderedDict()
+    
+    async def flush_notifications(self):
+        """Write all buffered notification logs in one batch"""
+        if not self.notification_buffer:
+            return
+        
+        # Swap the buffer out first so notifications logged meanwhile start a new batch
+        docs, self.notification_buffer = self.notification_buffer, []
         try:
-            notifications_collection = self.db.sent_notifications
-            notification_doc = {
-                'profileId': profile['_id'],
-                'listingId': listing.get('id', 'unknown'),
-                'message': message,
-                'sentAt': datetime.utcnow(),
-                'source': listing.get('source', 'unknown')
-            }
-            notifications_collection.insert_one(notification_doc)
+            await asyncio.to_thread(self.db.sent_notifications.insert_many, docs, ordered=False)
+            self.last_db_ok = time.monotonic()
         except Exception as e:
-            logger.error(f"Failed to log notification: {e}")
+            logger.error(f"Failed to log {len(docs)} notifications: {e}")
     
     async def health_check(self):
         """Perform health check"""
         try:
-            # Check database connection
-            if hasattr(self.db, 'client'):
-                self.db.client.admin.command('ping')
-            else:
-                logger.warning("Database client not available for health check")
+            # Check database connection, unless a recent operation already showed it working
+            db_recently_ok = (self.last_db_ok is not None
+                              and time.monotonic() - self.last_db_ok < self.health_check_interval)
+            if not db_recently_ok:
+                if hasattr(self.db, 'client'):
+                    await asyncio.wait_for(
+                        asyncio.to_thread(self.db.client.admin.command, 'ping'),
+                        timeout=HEALTH_PING_TIMEOUT
+                    )
+                    self.last_db_ok = time.monotonic()
+                else:
+                    logger.warning("Database client not available for health check")
             
             # Check if we're scanning regularly
-            if self.last_scan:
-                time_since_scan = datetime.utcnow() - self.last_scan
-                if time_since_scan > timedelta(minutes=10):
-                    logger.warning(f"No scan for {time_since_scan}")
+            if self.last_scan is not None:
+                time_since_scan = time.monotonic() - self.last_scan
+                if time_since_scan > max(STALE_SCAN_SECONDS, 2 * self.scan_interval):
+                    logger.warning(f"No scan for {time_since_scan:.0f}s")
             
             logger.info("Health check passed")
             return True
             
+        except asyncio.TimeoutError:
+            logger.error(f"Health check failed: database ping timed out after {HEALTH_PING_TIMEOUT}s")
+            return False
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             return False
     
+    async def health_loop(self):
+        """Run health checks on their own schedule, independent of scan duration"""
+        while self.running:
+            await self.health_check()
+            await asyncio.sleep(self.health_check_interval)
+    
     async def run(self):
         """Main worker loop"""
         logger.info("RealtyScanner Worker starting...")
         self.running = True
         
+        # The startup load can be large, so it runs in a thread instead of blocking the loop
+        self.seen_listing_ids = await asyncio.to_thread(self.load_seen_listing_ids)
+        
+        health_task = asyncio.create_task(self.health_loop())
+        scan_task = asyncio.create_task(self.scan_forever())
+        stop_task = asyncio.create_task(self.stop_event.wait())
+        
+        # A stop request cancels the scan right away instead of waiting for the next cycle
+        try:
+            await asyncio.wait({scan_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+            if scan_task.done():
+                scan_task.result()
+        finally:
+            for task in (scan_task, stop_task, health_task):
+                task.cancel()
+            await asyncio.gather(scan_task, return_exceptions=True)
+            await self.flush_notifications()
+    
+    async def scan_forever(self):
+        """Run scanning cycles until the worker stops"""
+        loop = asyncio.get_running_loop()
+        
+        # Scans start on a fixed grid of deadlines, so scan duration doesn't shift the schedule
+        next_deadline = loop.time()
         while self.running:
+            await asyncio.sleep(max(0, next_deadline - loop.time()))
+            
+            # Run scanning cycle
+            start_time = loop.time()
             try:
-                # Perform health check
-                await self.health_check()
-                
-                # Run scanning cycle
-                start_time = datetime.utcnow()
-                await self.scan_profiles()
-                self.last_scan = datetime.utcnow()
-                
-                # Calculate sleep time
-                elapsed = (datetime.utcnow() - start_time).total_seconds()
-                sleep_time = max(0, self.scan_interval - elapsed)
-                
-                logger.info(f"Scan completed in {elapsed:.2f}s, sleeping for {sleep_time:.2f}s")
-                
-                # Sleep until next scan
-                await asyncio.sleep(sleep_time)
-                
+                total_matches = await self.scan_profiles()
+                self.last_scan = time.monotonic()
+                if total_matches is not None:
+                    self.adapt_scan_interval(total_matches, self.cycle_failures)
             except Exception as e:
                 logger.error(f"Error in worker loop: {e}")
-                await asyncio.sleep(60)  # Sleep 1 minute on error
+            elapsed = loop.time() - start_time
+            
+            # Skip the slots a long scan overran instead of running them back to back
+            next_deadline += self.scan_interval
+            skipped = 0
+            while next_deadline <= loop.time():
+                next_deadline += self.scan_interval
+                skipped += 1
+            if skipped:
+                logger.warning(f"Scan overran the {self.scan_interval:.0f}s interval, skipped {skipped} cycle(s)")
+            
+            logger.info(f"Scan completed in {elapsed:.2f}s, next scan in {next_deadline - loop.time():.2f}s")
+    
+    def adapt_scan_interval(self, total_matches: int, failures: int = 0):
+        """Scan less often while cycles find nothing, and return to the minimum interval on a match"""
+        if total_matches:
+            self.empty_scan_streak = 0
+            interval = self.min_scan_interval
+        elif failures:
+            # A cycle with failed scans says nothing about new listings, so keep the current pace
+            return
+        else:
+            self.empty_scan_streak += 1
+            interval = min(self.max_scan_interval, self.min_scan_interval * 2 ** self.empty_scan_streak)
+        
+        # Jitter keeps replicated workers from scanning in lockstep
+        self.scan_interval = interval * random.uniform(1 - SCAN_INTERVAL_JITTER, 1 + SCAN_INTERVAL_JITTER)
     
     def stop(self):
         """Stop the worker"""
         logger.info("Stopping RealtyScanner Worker...")
         self.running = False
+        self.stop_event.set()
+        self.yad2_pool.shutdown(wait=False, cancel_futures=True)
+        
+        # Close the Yad2 keep-alive connections, if the scraper was ever created
+        yad2_scraper = self.__dict__.get('yad2_scraper')
+        if yad2_scraper is not None:
+            yad2_scraper.session.close()
 
 # Global worker instance
 worker = None
@@ -424,13 +917,25 @@ async def main():
     """Main function"""
     global worker
     
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Let tasks that finish without blocking skip a trip through the scheduler
+    # (asyncio.eager_task_factory is available from Python 3.12)
+    eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
     
     try:
         # Create and run worker
         worker = RealtyWorker()
+        
+        # Set up signal handlers on the loop, so a stop request wakes it immediately
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, worker.stop)
+            except NotImplementedError:
+                # Windows event loops don't support add_signal_handler
+                signal.signal(sig, signal_handler)
+        
         await worker.run()
         
     except KeyboardInterrupt:
@@ -445,6 +950,17 @@ if __name__ == "__main__":
     # Ensure log directory exists
     os.makedirs('./logs', exist_ok=True)
     
+    # Use the libuv-based event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run the worker
-    exit_code = asyncio.run(main())
+    try:
+        exit_code = asyncio.run(main())
+    finally:
+        # Write out any records still queued
+        log_listener.stop()
     sys.exit(exit_code)
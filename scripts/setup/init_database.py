@@ -13,24 +13,29 @@ Run with: python scripts/init_database.py
 
 import sys
 import os
-from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add the src directory to the path
+SRC_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
-from db import (
-    DatabaseManager, 
-    UserProfile, 
-    LocationCriteria, 
-    PriceRange, 
-    RoomRange, 
-    ScanTargets, 
-    NotificationChannels, 
-    NotificationChannelConfig
-)
+# The db package pulls in pymongo and the Pydantic models, so it is only
+# imported by the functions that talk to the database
+if TYPE_CHECKING:
+    from db import DatabaseManager
 
-def create_sample_profile(db: DatabaseManager) -> str:
+def create_sample_profile(db: "DatabaseManager") -> str:
     """Create a sample user profile for testing"""
+    from db import (
+        UserProfile,
+        LocationCriteria,
+        PriceRange,
+        RoomRange,
+        ScanTargets,
+        NotificationChannels,
+        NotificationChannelConfig
+    )
     
     sample_profile = UserProfile(
         profile_name="Studio in Central Tel Aviv - Test Profile",
@@ -63,7 +68,8 @@ def create_sample_profile(db: DatabaseManager) -> str:
         )
     )
     
-    profile_id = db.create_user_profile(sample_profile)
+    # Upsert by name so re-running the script doesn't pile up sample profiles
+    profile_id = db.upsert_user_profile(sample_profile)
     return profile_id
 
 def main():
@@ -71,6 +77,7 @@ def main():
     print("=" * 60)
     
     # Initialize database manager
+    from db import DatabaseManager
     db = DatabaseManager()
     
     # Test 1: MongoDB Connection
@@ -122,8 +129,8 @@ def main():
         active_profiles = db.get_active_user_profiles()
         print(f"✅ Found {len(active_profiles)} active profiles")
         
-        # Test updating profile
-        update_success = db.update_user_profile(profile_id, {"profile_name": "Updated Test Profile"})
+        # Test updating profile (keeping its name, which the sample upsert is keyed on)
+        update_success = db.update_user_profile(profile_id, {"is_active": True})
         if update_success:
             print("✅ Profile update successful")
         else:
@@ -138,9 +145,9 @@ def main():
     try:
         # Check indexes for each collection
         for collection_name in ["user_profiles", "scanned_listings", "sent_notifications"]:
-            collection = db.db[collection_name]
-            indexes = list(collection.list_indexes())
-            print(f"✅ {collection_name}: {len(indexes)} indexes created")
+            # Count from the raw command reply instead of building index documents
+            reply = db.db.command('listIndexes', collection_name)
+            print(f"✅ {collection_name}: {len(reply['cursor']['firstBatch'])} indexes created")
     except Exception as e:
         print(f"❌ Index verification failed: {e}")
         return False
@@ -7,9 +7,6 @@ import sys
 import os
 from pathlib import Path
 
-# Add the src directory to the path so we can import modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 def test_frontend_files():
     """Test that all required frontend files exist"""
     print("🔍 Testing frontend files...")
@@ -3,12 +3,18 @@ AI Agents Module for RealtyScanner
 Manages integration with multiple AI providers for enhanced property analysis
 """
 
-from .agent_manager import AIAgentManager
 from .models import AIProvider, AIResponse, PropertyAnalysis, AnalysisRequest, AgentConfig
-from .providers import (
-    BaseAIProvider, OpenAIProvider, GoogleProvider, 
-    AnthropicProvider, DeepSeekProvider
-)
+
+def __getattr__(name):
+    # The manager and provider classes are resolved lazily, so importing the
+    # models alone does not load httpx or any provider SDK
+    if name == 'AIAgentManager':
+        from .agent_manager import AIAgentManager
+        return AIAgentManager
+    if name in ('BaseAIProvider', 'OpenAIProvider', 'GoogleProvider', 'AnthropicProvider', 'DeepSeekProvider'):
+        from . import providers
+        return getattr(providers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'AIAgentManager',
@@ -4,11 +4,17 @@ Central manager for all AI providers and property analysis
 """
 
 import asyncio
+import importlib
 import logging
 import os
-from typing import Dict, List, Optional, Any
+import weakref
+from dataclasses import astuple, dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from statistics import fmean, pstdev
+
+import httpx
 from dotenv import load_dotenv
 
 # Load environment variables with override
@@ -18,26 +24,163 @@ from .models import (
     AIProvider, AgentConfig, AnalysisRequest, PropertyAnalysis, 
     AIResponse, AgentPerformance
 )
-from .providers.openai_provider import OpenAIProvider
-from .providers.google_provider import GoogleProvider
-from .providers.anthropic_provider import AnthropicProvider
-from .providers.deepseek_provider import DeepSeekProvider
+from .cache import SemanticCache
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Provider implementations are imported on first use so SDKs for
+# unconfigured providers are never loaded
+PROVIDER_CLASSES = {
+    AIProvider.OPENAI: ('.providers.openai_provider', 'OpenAIProvider'),
+    AIProvider.GOOGLE: ('.providers.google_provider', 'GoogleProvider'),
+    AIProvider.ANTHROPIC: ('.providers.anthropic_provider', 'AnthropicProvider'),
+    AIProvider.DEEPSEEK: ('.providers.deepseek_provider', 'DeepSeekProvider'),
+}
+
+# Connection pool shared by all HTTP-based providers, so repeated requests
+# reuse keep-alive connections instead of paying a new TLS handshake
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0
+)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Connection attempts retried by the transport before a request fails
+HTTP_CONNECT_RETRIES = 2
+
+@dataclass
+class SharedClients:
+    """HTTP pool and provider clients shared by the managers on one event loop"""
+    http_client: httpx.AsyncClient
+    providers: Dict[Tuple, Any] = field(default_factory=dict)
+    managers: "weakref.WeakSet" = field(default_factory=weakref.WeakSet)
+
+# The HTTP pool and provider clients are shared by the manager instances running
+# on the same event loop, so re-creating a manager (tests, retries) reuses warm
+# connections; connections are bound to the loop that opened them, so each loop
+# gets its own
+_shared_clients: Dict[Optional[asyncio.AbstractEventLoop], SharedClients] = {}
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+def get_shared_clients(manager: Optional["AIAgentManager"] = None) -> SharedClients:
+    """Get the running event loop's shared clients, creating them on first use"""
+    # Clients of closed loops can never be used again
+    for loop in [loop for loop in _shared_clients if loop is not None and loop.is_closed()]:
+        del _shared_clients[loop]
+    
+    loop = _running_loop()
+    shared = _shared_clients.get(loop)
+    if shared is None or shared.http_client.is_closed:
+        # With HTTP/2, concurrent requests to the same host share one connection
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=HTTP_POOL_LIMITS,
+            retries=HTTP_CONNECT_RETRIES
+        )
+        # Providers built on a previous pool are not carried over
+        shared = SharedClients(
+            http_client=httpx.AsyncClient(transport=transport, timeout=HTTP_TIMEOUT),
+            managers=shared.managers if shared is not None else weakref.WeakSet()
+        )
+        _shared_clients[loop] = shared
+    if manager is not None:
+        shared.managers.add(manager)
+    return shared
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Get the running event loop's shared HTTP client, creating it on first use"""
+    return get_shared_clients().http_client
+
+async def close_shared_clients():
+    """Close the running event loop's shared HTTP client and providers, for every manager"""
+    shared = _shared_clients.pop(_running_loop(), None)
+    if shared is None:
+        return
+    for provider in shared.providers.values():
+        if hasattr(provider, 'close'):
+            await provider.close()
+    await shared.http_client.aclose()
+
+async def release_shared_clients(manager: "AIAgentManager"):
+    """Stop a manager using the running loop's shared clients, closing them once no manager does"""
+    shared = _shared_clients.get(_running_loop())
+    if shared is None:
+        return
+    shared.managers.discard(manager)
+    if not shared.managers:
+        await close_shared_clients()
+
+# Default in-flight request limits, sized to each provider's typical rate limits;
+# override with <PROVIDER>_MAX_CONCURRENCY
+PROVIDER_MAX_CONCURRENCY = {
+    AIProvider.OPENAI: 32,
+    AIProvider.GOOGLE: 8,
+    AIProvider.ANTHROPIC: 8,
+    AIProvider.DEEPSEEK: 4,
+}
+
+# Parsed fields compared across providers when scoring their agreement
+CONSENSUS_NUMERIC_FIELDS = (
+    ("property_details", "rooms"),
+    ("property_details", "size_sqm"),
+    ("financial", "price"),
+)
+CONSENSUS_CATEGORICAL_FIELDS = (
+    ("location", "city"),
+    ("location", "neighborhood"),
+)
+
+# Stop waiting for slower providers once this many agree with high confidence
+EARLY_CONSENSUS_MIN_RESPONSES = 2
+EARLY_CONSENSUS_THRESHOLD = 0.9
+
+def _to_number(value: Any) -> Optional[float]:
+    """Parse a provider-reported number, which may be a string like '2,500,000'"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.replace(",", "").strip())
+        except ValueError:
+            return None
+    return None
+
 class AIAgentManager:
     """Central manager for all AI agents"""
     
     def __init__(self):
-        self.providers: Dict[AIProvider, Any] = {}
+        self.providers: Dict[AIProvider, Any] = {}  # Resolved lazily by get_provider
+        self.provider_configs: Dict[AIProvider, AgentConfig] = {}
         self.performance_metrics: Dict[AIProvider, AgentPerformance] = {}
         self.enabled_providers: List[AIProvider] = []
         
+        # Analyses of near-identical listing texts are reused instead of re-queried
+        self.analysis_cache = SemanticCache(path=os.getenv("AI_ANALYSIS_CACHE_PATH"))
+        
         # Initialize providers
         self._initialize_providers()
+        
+        # Per-provider caps on in-flight requests, so fan-out stays within rate limits
+        self._request_semaphores: Dict[AIProvider, asyncio.Semaphore] = {
+            provider: asyncio.Semaphore(config.max_concurrency)
+            for provider, config in self.provider_configs.items()
+        }
     
     def _initialize_providers(self):
-        """Initialize all available AI providers"""
+        """Configure all AI providers that have API keys"""
         try:
             # OpenAI
             openai_key = os.getenv("OPENAI_API_KEY")
@@ -49,15 +192,16 @@ class AIAgentManager:
                     temperature=float(os.getenv("AI_AGENT_TEMPERATURE", "0.7")),
                     max_tokens=int(os.getenv("AI_AGENT_MAX_TOKENS", "1000")),
                     timeout=int(os.getenv("AI_AGENT_TIMEOUT", "30")),
-                    max_retries=int(os.getenv("AI_AGENT_MAX_RETRIES", "3"))
+                    max_retries=int(os.getenv("AI_AGENT_MAX_RETRIES", "3")),
+                    max_concurrency=self._max_concurrency(AIProvider.OPENAI)
                 )
-                self.providers[AIProvider.OPENAI] = OpenAIProvider(config)
+                self.provider_configs[AIProvider.OPENAI] = config
                 self.performance_metrics[AIProvider.OPENAI] = AgentPerformance(
                     provider=AIProvider.OPENAI,
                     model=config.model
                 )
                 self.enabled_providers.append(AIProvider.OPENAI)
-                logger.info("OpenAI provider initialized")
+                logger.info("OpenAI provider configured")
             
             # Google
             google_key = os.getenv("GOOGLE_API_KEY")
@@ -69,15 +213,16 @@ class AIAgentManager:
                     temperature=float(os.getenv("AI_AGENT_TEMPERATURE", "0.7")),
                     max_tokens=int(os.getenv("AI_AGENT_MAX_TOKENS", "1000")),
                     timeout=int(os.getenv("AI_AGENT_TIMEOUT", "30")),
-                    max_retries=int(os.getenv("AI_AGENT_MAX_RETRIES", "3"))
+                    max_retries=int(os.getenv("AI_AGENT_MAX_RETRIES", "3")),
+                    max_concurrency=self._max_concurrency(AIProvider.GOOGLE)
                 )
-                self.providers[AIProvider.GOOGLE] = GoogleProvider(config)
+                self.provider_configs[AIProvider.GOOGLE] = config
                 self.performance_metrics[AIProvider.GOOGLE] = AgentPerformance(
                     provider=AIProvider.GOOGLE,
                     model=config.model
                 )
                 self.enabled_providers.append(AIProvider.GOOGLE)
-                logger.info("Google provider initialized")
+                logger.info("Google provider configured")
             
             # Anthropic
             anthropic_key = os.getenv("ANTHROPIC_API_KEY")
@@ -89,15 +234,16 @@ class AIAgentManager:
                     temperature=float(os.getenv("AI_AGENT_TEMPERATURE", "0.7")),
                     max_tokens=int(os.getenv("AI_AGENT_MAX_TOKENS", "1000")),
                     timeout=int(os.getenv("AI_AGENT_TIMEOUT", "30")),
-                    max_retries=int(os.getenv("AI_AGENT_MAX_RETRIES", "3"))
+                    max_retries=int(os.getenv("AI_AGENT_MAX_RETRIES", "3")),
+                    max_concurrency=self._max_concurrency(AIProvider.ANTHROPIC)
                 )
-                self.providers[AIProvider.ANTHROPIC] = AnthropicProvider(config)
+                self.provider_configs[AIProvider.ANTHROPIC] = config
                 self.performance_metrics[AIProvider.ANTHROPIC] = AgentPerformance(
                     provider=AIProvider.ANTHROPIC,
                     model=config.model
                 )
                 self.enabled_providers.append(AIProvider.ANTHROPIC)
-                logger.info("Anthropic provider initialized")
+                logger.info("Anthropic provider configured")
             
             # DeepSeek
             deepseek_key = os.getenv("DEEPSEEK_API_KEY")
@@ -111,35 +257,70 @@ class AIAgentManager:
                         temperature=float(os.getenv("AI_AGENT_TEMPERATURE", "0.7")),
                         max_tokens=int(os.getenv("AI_AGENT_MAX_TOKENS", "1000")),
                         timeout=int(os.getenv("AI_AGENT_TIMEOUT", "30")),
-                        max_retries=int(os.getenv("AI_AGENT_MAX_RETRIES", "3"))
+                        max_retries=int(os.getenv("AI_AGENT_MAX_RETRIES", "3")),
+                        max_concurrency=self._max_concurrency(AIProvider.DEEPSEEK)
                     )
-                    self.providers[AIProvider.DEEPSEEK] = DeepSeekProvider(config)
+                    self.provider_configs[AIProvider.DEEPSEEK] = config
                     self.performance_metrics[AIProvider.DEEPSEEK] = AgentPerformance(
                         provider=AIProvider.DEEPSEEK,
                         model=config.model
                     )
                     self.enabled_providers.append(AIProvider.DEEPSEEK)
-                    logger.info("DeepSeek provider initialized")
+                    logger.info("DeepSeek provider configured")
                 except (ValueError, TypeError, ConnectionError) as e:
                     logger.error("Failed to initialize DeepSeek provider: %s", str(e))
             else:
                 logger.debug("DeepSeek not initialized - key validation failed")
             
-            logger.info("AI Agent Manager initialized with %d providers: %s", 
+            logger.info("AI Agent Manager configured with %d providers: %s", 
                        len(self.enabled_providers), 
                        [p.value for p in self.enabled_providers])
             
         except (ValueError, TypeError, ConnectionError) as e:
             logger.error("Error initializing AI providers: %s", str(e))
     
+    def _max_concurrency(self, provider: AIProvider) -> int:
+        """In-flight request limit for a provider, from env or defaults"""
+        env_name = f"{provider.name}_MAX_CONCURRENCY"
+        return int(os.getenv(env_name, str(PROVIDER_MAX_CONCURRENCY[provider])))
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP connection pool shared by the providers"""
+        return get_shared_clients(self).http_client
+    
+    def get_provider(self, provider: AIProvider) -> Optional[Any]:
+        """Get provider instance, creating its client on first use"""
+        config = self.provider_configs.get(provider)
+        if config is None:
+            return None
+        
+        shared = get_shared_clients(self)
+        key = astuple(config)
+        provider_impl = shared.providers.get(key)
+        if provider_impl is None:
+            module_name, class_name = PROVIDER_CLASSES[provider]
+            try:
+                module = importlib.import_module(module_name, __package__)
+                provider_impl = getattr(module, class_name)(config, http_client=shared.http_client)
+                logger.info("%s provider initialized", provider.value)
+            except Exception as e:
+                logger.error("Failed to initialize %s provider: %s", provider.value, str(e))
+                return None
+            shared.providers[key] = provider_impl
+        
+        self.providers[provider] = provider_impl
+        return provider_impl
+    
     async def analyze_property_single(self, request: AnalysisRequest, provider: AIProvider) -> PropertyAnalysis:
         """Analyze property with a single AI provider"""
-        if provider not in self.providers:
+        provider_impl = self.get_provider(provider)
+        if provider_impl is None:
             raise ValueError(f"Provider {provider} is not available")
         
         try:
             # Get AI response
-            ai_response = await self.providers[provider].analyze_property(request)
+            ai_response = await self._analyze_with_provider(provider_impl, request)
             
             # Update performance metrics
             success = ai_response.confidence > 0.0
@@ -153,66 +334,160 @@ class AIAgentManager:
             
         except Exception as e:
             logger.error(f"Error analyzing property with {provider.value}: {e}")
-            # Create failed response
-            failed_response = AIResponse(
-                provider=provider,
-                content=f"Error: {str(e)}",
-                confidence=0.0,
-                processing_time=0.0,
-                tokens_used=0,
-                model_used="unknown",
-                timestamp=datetime.utcnow(),
-                metadata={"error": str(e)}
-            )
-            return self._create_property_analysis(request, [failed_response])
+            return self._create_property_analysis(request, [self._error_response(provider, e)])
     
-    async def analyze_property_multi(self, request: AnalysisRequest, providers: Optional[List[AIProvider]] = None) -> PropertyAnalysis:
-        """Analyze property with multiple AI providers and create consensus"""
+    async def analyze_property_multi(self, request: AnalysisRequest, providers: Optional[List[AIProvider]] = None,
+                                     early_exit: bool = True) -> PropertyAnalysis:
+        """Analyze property with multiple AI providers and create consensus
+        
+        With early_exit, remaining providers are cancelled as soon as the
+        responses received so far reach a stable high-confidence consensus.
+        """
+        use_cache = providers is None
         if providers is None:
             providers = self.enabled_providers
         
         if not providers:
             raise ValueError("No AI providers available")
         
+        if use_cache:
+            cached = self.analysis_cache.get(request)
+            if cached is not None:
+                logger.info(f"Using cached analysis for property {request.property_id}")
+                return cached
+        
+        async def run(slot: int, provider: AIProvider, provider_impl: Any):
+            try:
+                return slot, provider, await self._analyze_with_provider(provider_impl, request)
+            except Exception as e:
+                return slot, provider, e
+        
         # Run analysis with all providers concurrently
         tasks = []
         for provider in providers:
-            if provider in self.providers:
-                task = self.providers[provider].analyze_property(request)
-                tasks.append(task)
+            provider_impl = self.get_provider(provider)
+            if provider_impl is not None:
+                tasks.append(asyncio.create_task(run(len(tasks), provider, provider_impl)))
         
-        # Wait for all responses
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        # One slot per provider, filled as responses arrive so results keep provider order
+        slots: List[Optional[AIResponse]] = [None] * len(tasks)
+        received = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                slot, provider, response = await next_done
+                if isinstance(response, Exception):
+                    logger.error(f"Provider {provider.value} failed: {response}")
+                    slots[slot] = self._error_response(provider, response)
+                else:
+                    slots[slot] = response
+                    # Update performance metrics
+                    success = response.confidence > 0.0
+                    self.performance_metrics[provider].update_metrics(response, success)
+                received += 1
+                
+                if (early_exit and received < len(tasks)
+                        and self._consensus_reached([r for r in slots if r is not None])):
+                    logger.info(f"Consensus reached after {received} of {len(tasks)} providers")
+                    break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         
-        # Filter successful responses
-        valid_responses = []
-        for i, response in enumerate(responses):
-            if isinstance(response, Exception):
-                logger.error(f"Provider {providers[i].value} failed: {response}")
-                # Create error response
-                error_response = AIResponse(
-                    provider=providers[i],
-                    content=f"Error: {str(response)}",
-                    confidence=0.0,
-                    processing_time=0.0,
-                    tokens_used=0,
-                    model_used="unknown",
-                    timestamp=datetime.utcnow(),
-                    metadata={"error": str(response)}
-                )
-                valid_responses.append(error_response)
-            else:
-                valid_responses.append(response)
-                # Update performance metrics
-                success = response.confidence > 0.0
-                self.performance_metrics[providers[i]].update_metrics(response, success)
+        valid_responses = slots if received == len(slots) else [r for r in slots if r is not None]
         
         # Create consensus analysis
         analysis = self._create_property_analysis(request, valid_responses)
         
+        # Only cache analyses where at least one provider succeeded
+        if use_cache and analysis.consensus_score:
+            self.analysis_cache.put(request, analysis)
+        
         logger.info(f"Multi-provider analysis completed with {len(valid_responses)} responses")
         return analysis
     
+    async def analyze_properties_batch(self, requests: List[AnalysisRequest],
+                                       providers: Optional[List[AIProvider]] = None) -> List[PropertyAnalysis]:
+        """Analyze many properties concurrently, returning analyses in request order
+        
+        Provider calls from all properties share each provider's concurrency
+        limit, so large batches stay within provider rate limits.
+        """
+        if not requests:
+            return []
+        
+        results = await asyncio.gather(
+            *(self.analyze_property_multi(request, providers) for request in requests),
+            return_exceptions=True
+        )
+        
+        analyses = []
+        for request, result in zip(requests, results):
+            if isinstance(result, Exception):
+                logger.error(f"Batch analysis failed for property {request.property_id}: {result}")
+                result = self._create_property_analysis(request, [])
+            analyses.append(result)
+        
+        logger.info(f"Batch analysis completed for {len(analyses)} properties")
+        return analyses
+    
+    async def _analyze_with_provider(self, provider_impl: Any, request: AnalysisRequest) -> AIResponse:
+        """Run one provider request under that provider's concurrency limit"""
+        async with self._request_semaphores[provider_impl.provider_type]:
+            return await provider_impl.analyze_property(request)
+    
+    def _error_response(self, provider: AIProvider, error: BaseException) -> AIResponse:
+        """Create a zero-confidence response recording a provider failure"""
+        return AIResponse(
+            provider=provider,
+            content=f"Error: {str(error)}",
+            confidence=0.0,
+            processing_time=0.0,
+            tokens_used=0,
+            model_used="unknown",
+            timestamp=datetime.utcnow(),
+            metadata={"error": str(error)}
+        )
+    
+    def _calculate_consensus(self, responses: List[AIResponse]) -> float:
+        """Average confidence of the successful responses, scaled by how much they agree"""
+        valid_responses = [r for r in responses if r.confidence > 0.0]
+        if not valid_responses:
+            return 0.0
+        confidence = fmean(r.confidence for r in valid_responses)
+        return confidence * self._field_agreement(valid_responses)
+    
+    def _field_agreement(self, responses: List[AIResponse]) -> float:
+        """Agreement (0-1) between providers on the key extracted fields"""
+        parsed = [r.parsed_data for r in responses if r.parsed_data]
+        if len(parsed) < 2:
+            return 1.0
+        
+        scores = []
+        for section, field in CONSENSUS_NUMERIC_FIELDS:
+            values = [_to_number(data.get(section, {}).get(field)) for data in parsed
+                      if isinstance(data.get(section), dict)]
+            values = [v for v in values if v is not None]
+            if len(values) >= 2:
+                # Relative spread: identical values score 1, wide disagreement tends to 0
+                scores.append(1.0 - min(1.0, pstdev(values) / (abs(fmean(values)) + 1)))
+        
+        for section, field in CONSENSUS_CATEGORICAL_FIELDS:
+            values = [data.get(section, {}).get(field) for data in parsed
+                      if isinstance(data.get(section), dict)]
+            values = [str(v).strip() for v in values if v]
+            if len(values) >= 2:
+                scores.append(Counter(values).most_common(1)[0][1] / len(values))
+        
+        return fmean(scores) if scores else 1.0
+    
+    def _consensus_reached(self, responses: List[AIResponse]) -> bool:
+        """Check whether enough confident responses are in to stop early"""
+        successful = sum(1 for r in responses if r.confidence > 0.0)
+        return (successful >= EARLY_CONSENSUS_MIN_RESPONSES
+                and self._calculate_consensus(responses) >= EARLY_CONSENSUS_THRESHOLD)
+    
     def _create_property_analysis(self, request: AnalysisRequest, responses: List[AIResponse]) -> PropertyAnalysis:
         """Create property analysis from AI responses"""
         analysis = PropertyAnalysis(
@@ -230,7 +505,7 @@ class AIAgentManager:
             return analysis
         
         # Calculate consensus score
-        analysis.consensus_score = sum(r.confidence for r in valid_responses) / len(valid_responses)
+        analysis.consensus_score = self._calculate_consensus(valid_responses)
         
         # Try to parse and merge data from successful responses
         try:
@@ -296,19 +571,27 @@ class AIAgentManager:
     
     async def test_providers(self) -> Dict[AIProvider, bool]:
         """Test all providers connectivity"""
-        results = {}
-        
-        for provider_type, provider in self.providers.items():
-            try:
-                if hasattr(provider, 'test_connection'):
-                    results[provider_type] = await provider.test_connection()
-                else:
-                    results[provider_type] = True
-            except Exception as e:
-                logger.error(f"Error testing {provider_type.value}: {e}")
-                results[provider_type] = False
-        
-        return results
+        return await self.probe_providers()
+    
+    async def probe_providers(self) -> Dict[AIProvider, bool]:
+        """Test all providers connectivity concurrently"""
+        statuses = await asyncio.gather(
+            *(self._test_provider(p) for p in self.enabled_providers)
+        )
+        return dict(zip(self.enabled_providers, statuses))
+    
+    async def _test_provider(self, provider_type: AIProvider) -> bool:
+        """Test a single provider's connectivity"""
+        try:
+            provider = self.get_provider(provider_type)
+            if provider is None:
+                return False
+            if hasattr(provider, 'test_connection'):
+                return await provider.test_connection()
+            return True
+        except Exception as e:
+            logger.error(f"Error testing {provider_type.value}: {e}")
+            return False
     
     def get_performance_metrics(self) -> Dict[AIProvider, AgentPerformance]:
         """Get performance metrics for all providers"""
@@ -318,15 +601,19 @@ class AIAgentManager:
         """Get information about all providers"""
         return {
             "enabled_providers": [p.value for p in self.enabled_providers],
-            "total_providers": len(self.providers),
+            "total_providers": len(self.provider_configs),
             "provider_details": {
-                provider.value: self.providers[provider].get_provider_info()
+                provider.value: self.get_provider(provider).get_provider_info()
                 for provider in self.enabled_providers
+                if self.get_provider(provider) is not None
             }
         }
     
     async def close(self):
-        """Close all providers"""
-        for provider in self.providers.values():
-            if hasattr(provider, 'close'):
-                await provider.close()
+        """Release the shared providers and HTTP pool, closing them if no other manager uses them"""
+        self.providers.clear()
+        await release_shared_clients(self)
+        
+        # Cached analyses are written once here, not on every insert
+        if self.analysis_cache.path:
+            await self.analysis_cache.save_async()
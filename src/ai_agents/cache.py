@@ -0,0 +1,199 @@
+"""
+Semantic Analysis Cache
+Reuses property analyses for listing texts that are near-duplicates of ones already analyzed
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter, OrderedDict
+from dataclasses import asdict, replace
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .models import AIProvider, AIResponse, AnalysisRequest, PropertyAnalysis
+
+logger = logging.getLogger(__name__)
+
+# Texts at or above this cosine similarity are treated as the same listing
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+# Maximum number of analyses kept before the least recently used is evicted
+DEFAULT_MAX_ENTRIES = 1024
+
+# Length of the character n-grams used to embed listing text
+NGRAM_SIZE = 3
+
+_NON_WORD_PATTERN = re.compile(r'[^\w]+')
+
+# Numbers in listing text (prices, rooms, sizes, floors), with thousands separators
+_NUMBER_PATTERN = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+def embed_text(text: str) -> Dict[str, float]:
+    """Embed text as an L2-normalized bag of character n-grams"""
+    normalized = _NON_WORD_PATTERN.sub(' ', text.lower()).strip()
+    grams = Counter(normalized[i:i + NGRAM_SIZE] for i in range(len(normalized) - NGRAM_SIZE + 1))
+    norm = math.sqrt(sum(count * count for count in grams.values()))
+    if not norm:
+        return {}
+    return {gram: count / norm for gram, count in grams.items()}
+
+def cosine_similarity(a: Dict[str, float], b: Dict[str, float]) -> float:
+    """Cosine similarity of two normalized sparse embeddings"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(gram, 0.0) for gram, weight in a.items())
+
+def extract_numbers(text: str) -> Tuple[str, ...]:
+    """The numbers in a text, separators removed, as a sorted tuple"""
+    return tuple(sorted(match.replace(',', '') for match in _NUMBER_PATTERN.findall(text)))
+
+def analysis_to_dict(analysis: PropertyAnalysis) -> Dict[str, Any]:
+    """Convert an analysis to JSON-compatible data"""
+    data = asdict(analysis)
+    data['analysis_timestamp'] = analysis.analysis_timestamp.isoformat() if analysis.analysis_timestamp else None
+    for response in data['ai_responses']:
+        response['provider'] = AIProvider(response['provider']).value
+        response['timestamp'] = response['timestamp'].isoformat()
+    return data
+
+def analysis_from_dict(data: Dict[str, Any]) -> PropertyAnalysis:
+    """Rebuild an analysis from data written by analysis_to_dict()"""
+    data = dict(data)
+    if data.get('analysis_timestamp'):
+        data['analysis_timestamp'] = datetime.fromisoformat(data['analysis_timestamp'])
+    data['ai_responses'] = [
+        AIResponse(**{**response,
+                      'provider': AIProvider(response['provider']),
+                      'timestamp': datetime.fromisoformat(response['timestamp'])})
+        for response in data.get('ai_responses') or []
+    ]
+    return PropertyAnalysis(**data)
+
+class SemanticCache:
+    """LRU cache of property analyses keyed by listing text similarity
+
+    Identical texts hit by digest. Near-duplicate texts hit only when they
+    contain the same numbers, so listings differing in price, rooms or size
+    never share an analysis; candidates are looked up by those numbers
+    instead of comparing against every entry.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, path: Optional[str] = None):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.path = path
+        # text digest -> (text, numbers, embedding, analysis)
+        self._entries: "OrderedDict[str, Tuple[str, Tuple[str, ...], Dict[str, float], PropertyAnalysis]]" = OrderedDict()
+        # numbers -> digests of the entries whose text contains exactly those numbers
+        self._by_numbers: Dict[Tuple[str, ...], Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get(self, request: AnalysisRequest) -> Optional[PropertyAnalysis]:
+        """Return a cached analysis for this request's text, or None"""
+        digest = self._digest(request.raw_text)
+        match = digest if digest in self._entries else None
+
+        if match is None:
+            candidates = self._by_numbers.get(extract_numbers(request.raw_text))
+            if candidates:
+                embedding = embed_text(request.raw_text)
+                best_score = 0.0
+                for key in candidates:
+                    score = cosine_similarity(embedding, self._entries[key][2])
+                    if score > best_score:
+                        match, best_score = key, score
+                if best_score < self.threshold:
+                    match = None
+
+        if match is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(match)
+        analysis = self._entries[match][3]
+        return replace(analysis, property_id=request.property_id, original_text=request.raw_text)
+
+    def put(self, request: AnalysisRequest, analysis: PropertyAnalysis):
+        """Store the analysis for this request's text"""
+        self._insert(request.raw_text, analysis)
+
+    def _insert(self, text: str, analysis: PropertyAnalysis):
+        digest = self._digest(text)
+        numbers = extract_numbers(text)
+        if digest in self._entries:
+            self._forget(digest)
+        self._entries[digest] = (text, numbers, embed_text(text), analysis)
+        self._by_numbers.setdefault(numbers, set()).add(digest)
+        while len(self._entries) > self.max_entries:
+            self._forget(next(iter(self._entries)))
+
+    def _forget(self, digest: str):
+        numbers = self._entries.pop(digest)[1]
+        bucket = self._by_numbers[numbers]
+        bucket.discard(digest)
+        if not bucket:
+            del self._by_numbers[numbers]
+
+    def clear(self):
+        """Drop all cached analyses"""
+        self._entries.clear()
+        self._by_numbers.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _records(self) -> List[Dict[str, Any]]:
+        """Snapshot the entries as JSON-compatible records, least recently used first"""
+        return [
+            {'text': text, 'analysis': analysis_to_dict(analysis)}
+            for text, _, _, analysis in self._entries.values()
+        ]
+
+    @staticmethod
+    def _write(path: str, records: List[Dict[str, Any]]):
+        try:
+            # Written to a temporary file first, so an interrupted save leaves the old cache intact
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(records, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Failed to save analysis cache to {path}: {e}")
+
+    def save(self, path: Optional[str] = None):
+        """Persist the cache to disk as JSON"""
+        self._write(path or self.path, self._records())
+
+    async def save_async(self, path: Optional[str] = None):
+        """Persist the cache to disk, writing the file in a worker thread"""
+        # The snapshot is taken on the event loop, so entries can't change while it's written
+        records = self._records()
+        await asyncio.to_thread(self._write, path or self.path, records)
+
+    def load(self, path: str):
+        """Load a cache previously written by save()"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+            for record in records:
+                self._insert(record['text'], analysis_from_dict(record['analysis']))
+            logger.info(f"Loaded {len(self._entries)} cached analyses from {path}")
+        except Exception as e:
+            logger.error(f"Failed to load analysis cache from {path}: {e}")
@@ -112,6 +112,7 @@ class AgentConfig:
     max_tokens: int = 1000
     timeout: int = 30
     max_retries: int = 3
+    max_concurrency: int = 8  # Requests allowed in flight at once
     
     def __post_init__(self):
         """Validate configuration"""
@@ -123,6 +124,8 @@ class AgentConfig:
             raise ValueError("Timeout must be positive")
         if self.max_retries < 0:
             raise ValueError("Max retries cannot be negative")
+        if self.max_concurrency <= 0:
+            raise ValueError("Max concurrency must be positive")
 
 @dataclass
 class AgentPerformance:
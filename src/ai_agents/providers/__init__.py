@@ -1,13 +1,27 @@
 """
 AI Providers Module
 Implementations for different AI providers
+
+Provider classes are imported on first access so that only the SDKs
+that are actually used get loaded.
 """
 
+import importlib
+
 from .base_provider import BaseAIProvider
-from .openai_provider import OpenAIProvider
-from .google_provider import GoogleProvider
-from .anthropic_provider import AnthropicProvider
-from .deepseek_provider import DeepSeekProvider
+
+_PROVIDER_MODULES = {
+    'OpenAIProvider': '.openai_provider',
+    'GoogleProvider': '.google_provider',
+    'AnthropicProvider': '.anthropic_provider',
+    'DeepSeekProvider': '.deepseek_provider',
+}
+
+def __getattr__(name):
+    if name in _PROVIDER_MODULES:
+        module = importlib.import_module(_PROVIDER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'BaseAIProvider',
@@ -9,6 +9,8 @@ import time
 import logging
 from datetime import datetime
 
+import httpx
+
 from ..models import AIResponse, AgentConfig, AIProvider, AnalysisRequest
 
 logger = logging.getLogger(__name__)
@@ -16,7 +18,7 @@ logger = logging.getLogger(__name__)
 class BaseAIProvider(ABC):
     """Base class for all AI providers"""
     
-    def __init__(self, config: AgentConfig):
+    def __init__(self, config: AgentConfig, http_client: Optional[httpx.AsyncClient] = None):
         self.config = config
         self.provider_type = config.provider
         self.model = config.model
@@ -26,6 +28,9 @@ class BaseAIProvider(ABC):
         self.timeout = config.timeout
         self.max_retries = config.max_retries
         
+        # Shared connection pool supplied by the manager, if any
+        self.http_client = http_client
+        
         # Initialize client
         self.client = None
         self._initialize_client()
@@ -25,7 +25,9 @@ class DeepSeekProvider(BaseAIProvider):
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
             }
-            self.client = httpx.AsyncClient(timeout=self.timeout)
+            # Reuse the shared pool when given one; otherwise own a private client
+            self._owns_client = self.http_client is None
+            self.client = self.http_client or httpx.AsyncClient(timeout=self.timeout)
             logger.info(f"DeepSeek client initialized with model: {self.model}")
         except Exception as e:
             logger.error(f"Failed to initialize DeepSeek client: {e}")
@@ -54,7 +56,8 @@ class DeepSeekProvider(BaseAIProvider):
             response = await self.client.post(
                 self.api_url,
                 headers=self.headers,
-                json=payload
+                json=payload,
+                timeout=self.timeout
             )
             
             if response.status_code != 200:
@@ -107,7 +110,8 @@ class DeepSeekProvider(BaseAIProvider):
             response = await self.client.post(
                 self.api_url,
                 headers=self.headers,
-                json=payload
+                json=payload,
+                timeout=self.timeout
             )
             
             return response.status_code == 200
@@ -117,5 +121,5 @@ class DeepSeekProvider(BaseAIProvider):
     
     async def close(self):
         """Close HTTP client"""
-        if self.client:
+        if self.client and self._owns_client:
             await self.client.aclose()
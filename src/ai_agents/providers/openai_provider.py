@@ -19,10 +19,19 @@ class OpenAIProvider(BaseAIProvider):
     def _initialize_client(self):
         """Initialize OpenAI client"""
         try:
-            self.client = openai.AsyncOpenAI(
-                api_key=self.api_key,
-                timeout=self.timeout
-            )
+            try:
+                self.client = openai.AsyncOpenAI(
+                    api_key=self.api_key,
+                    timeout=self.timeout,
+                    http_client=self.http_client
+                )
+            except TypeError as e:
+                # SDK builds on a different HTTP library; let it manage its own pool
+                logger.debug(f"Shared HTTP client not supported, using SDK default: {e}")
+                self.client = openai.AsyncOpenAI(
+                    api_key=self.api_key,
+                    timeout=self.timeout
+                )
             logger.info(f"OpenAI client initialized with model: {self.model}")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
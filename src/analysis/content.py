@@ -11,13 +11,16 @@ This module provides:
 """
 
 import re
-import hashlib
+import json
+import asyncio
+import functools
 import logging
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Set, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
 
-from scrapers.base import ScrapedListing
+from scrapers.base import ScrapedListing, hash_content
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,32 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes profile criteria for cache keys several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Aho-Corasick finds every profile location named in a listing in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Precompiled patterns used by text normalization
+WHITESPACE_PATTERN = re.compile(r'\s+')
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s\u0590-\u05ff]')
+
+# Price, room count and size as written in listings ("5,500 ₪", "3 חדרים", "80 מ"ר"),
+# matched together so a text is scanned once for all three
+NUMERIC_FIELDS_PATTERN = re.compile(
+    r'(?P<price>\d{1,3}(?:,\d{3})+|\d+)\s*(?:₪|ש["״]?ח|שקל(?:ים)?)'
+    r'|(?P<rooms>\d+(?:\.\d+)?)\s*חדרים'
+    r'|(?P<size>\d+)\s*מ["״\']?ר'
+)
+
 class MatchConfidence(str, Enum):
     """Confidence levels for property matches"""
     HIGH = "high"
@@ -59,14 +88,38 @@ class MatchResult:
             self.location_matches = []
         if self.keyword_matches is None:
             self.keyword_matches = []
+    
+    def copy(self) -> 'MatchResult':
+        """Copy the result with its own lists, so changes to it don't reach the original"""
+        return replace(
+            self,
+            reasons=list(self.reasons),
+            location_matches=list(self.location_matches),
+            keyword_matches=list(self.keyword_matches)
+        )
 
 class ContentAnalyzer:
     """Content analysis and filtering engine"""
     
+    # Maximum number of listings analyzed by AI providers at the same time
+    MAX_CONCURRENT_AI_ANALYSES = 5
+    
+    # Maximum number of cached analysis results (per analysis type)
+    ANALYSIS_CACHE_SIZE = 4096
+    
+    # Profiles with at least this many location terms are matched with an automaton
+    LOCATION_AUTOMATON_MIN_TERMS = 3
+    
     def __init__(self):
         """Initialize the content analyzer"""
         self.logger = logging.getLogger(f"{__name__}.ContentAnalyzer")
         
+        # LRU caches of results keyed by listing content + profile criteria,
+        # so re-yielded listings are not analyzed again
+        self._analysis_cache: "OrderedDict[Tuple, MatchResult]" = OrderedDict()
+        self._ai_analysis_cache: "OrderedDict[Tuple, MatchResult]" = OrderedDict()
+        self._normalized_text_cache: "OrderedDict[str, str]" = OrderedDict()
+        
         # Initialize AI Agent Manager
         if AI_AGENTS_AVAILABLE:
             self.ai_manager = AIAgentManager()
@@ -92,6 +145,13 @@ class ContentAnalyzer:
             'מיזוג': ['מזגן', 'ac', 'air conditioning'],
         }
         
+        # (alias, canonical) pairs in application order, lowercased once
+        self._normalization_pairs = [
+            (alias.lower(), canonical)
+            for canonical, aliases in self.text_normalizations.items()
+            for alias in aliases
+        ]
+        
         # Common location aliases
         self.location_aliases = {
             'תל אביב': ['תל אביב - יפו', 'tel aviv', 'tlv'],
@@ -106,6 +166,12 @@ class ContentAnalyzer:
             'יפו העתיקה': ['old jaffa', 'jaffa'],
         }
         
+        # Location name -> lowercased name and aliases, filled on first use
+        self._location_terms: Dict[str, Tuple[str, ...]] = {}
+        
+        # LRU cache of Aho-Corasick automata keyed by a profile's location names
+        self._location_automata: "OrderedDict[Tuple[str, ...], Any]" = OrderedDict()
+        
         # Initialize Tavily for enhanced analysis
         try:
             from search.tavily import get_tavily_searcher
@@ -128,6 +194,18 @@ class ContentAnalyzer:
         Returns:
             MatchResult with analysis details
         """
+        cache_key = self._analysis_cache_key(listing, profile_criteria)
+        # Callers get copies, so one caller changing a result can't alter later hits
+        cached = self._get_cached_result(self._analysis_cache, cache_key)
+        if cached is not None:
+            return cached.copy()
+        
+        result = self._analyze_listing_rules(listing, profile_criteria)
+        self._cache_result(self._analysis_cache, cache_key, result.copy())
+        return result
+    
+    def _analyze_listing_rules(self, listing: ScrapedListing, profile_criteria: Dict[str, Any]) -> MatchResult:
+        """Run rule-based analysis of a listing (uncached)"""
         reasons = []
         location_matches = []
         keyword_matches = []
@@ -191,6 +269,37 @@ class ContentAnalyzer:
         
         return result
     
+    def _analysis_cache_key(self, listing: ScrapedListing, profile_criteria: Dict[str, Any]) -> Tuple:
+        """Build cache key from the listing content and the profile criteria"""
+        if ORJSON_AVAILABLE:
+            profile_key = orjson.dumps(
+                profile_criteria, default=str,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            profile_key = json.dumps(profile_criteria, sort_keys=True, ensure_ascii=False, default=str)
+        return (listing.title, listing.description, listing.location,
+                listing.price, listing.rooms, profile_key)
+    
+    def _get_cached_result(self, cache: OrderedDict, key: Tuple) -> Optional[MatchResult]:
+        """Look up a cached result, marking it as recently used"""
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+        return result
+    
+    def _cache_result(self, cache: OrderedDict, key: Tuple, result: MatchResult):
+        """Store a result, evicting the least recently used entry when full"""
+        cache[key] = result
+        if len(cache) > self.ANALYSIS_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def clear_analysis_cache(self):
+        """Drop all cached analysis results"""
+        self._analysis_cache.clear()
+        self._ai_analysis_cache.clear()
+        self._normalized_text_cache.clear()
+    
     def normalize_text(self, text: str) -> str:
         """
         Normalize and clean text for analysis
@@ -204,22 +313,46 @@ class ContentAnalyzer:
         if not text:
             return ""
         
+        # The same listing text is normalized once per profile it is checked against
+        cached = self._get_cached_result(self._normalized_text_cache, text)
+        if cached is not None:
+            return cached
+        
         # Convert to lowercase
         normalized = text.lower().strip()
         
         # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized)
+        normalized = WHITESPACE_PATTERN.sub(' ', normalized)
         
         # Remove common punctuation but keep Hebrew characters
-        normalized = re.sub(r'[^\w\s\u0590-\u05ff]', ' ', normalized)
+        normalized = PUNCTUATION_PATTERN.sub(' ', normalized)
         
         # Apply text normalizations
-        for canonical, aliases in self.text_normalizations.items():
-            for alias in aliases:
-                normalized = normalized.replace(alias.lower(), canonical)
+        for alias, canonical in self._normalization_pairs:
+            normalized = normalized.replace(alias, canonical)
         
+        self._cache_result(self._normalized_text_cache, text, normalized)
         return normalized
     
+    def extract_numeric_fields(self, text: str) -> Dict[str, Optional[float]]:
+        """
+        Extract price, rooms and size from free text in a single pass
+        
+        Args:
+            text: Listing text
+            
+        Returns:
+            Dict with 'price', 'rooms' and 'size' (first occurrence of each, or None)
+        """
+        fields: Dict[str, Optional[float]] = {'price': None, 'rooms': None, 'size': None}
+        for match in NUMERIC_FIELDS_PATTERN.finditer(text or ""):
+            name = match.lastgroup
+            if fields[name] is None:
+                fields[name] = float(match.group(name).replace(',', ''))
+                if all(value is not None for value in fields.values()):
+                    break
+        return fields
+    
     def _check_price_match(self, listing_price: Optional[int], price_criteria: Dict[str, Any], reasons: List[str]) -> bool:
         """Check if listing price matches criteria"""
         if not listing_price or not price_criteria:
@@ -257,23 +390,31 @@ class ContentAnalyzer:
         matches = []
         score = 0.0
         
-        # Check city match
         city = location_criteria.get('city', '')
-        if city and self._text_contains_location(normalized_text, city):
+        neighborhoods = dict.fromkeys(location_criteria.get('neighborhoods', []))
+        streets = dict.fromkeys(location_criteria.get('streets', []))
+        
+        # Find all named locations in one pass when there are enough of them
+        found = self._find_locations(normalized_text, ((city,) if city else ()) + tuple(neighborhoods) + tuple(streets))
+        if found is None:
+            contains = functools.partial(self._text_contains_location, normalized_text)
+        else:
+            contains = found.__contains__
+        
+        # Check city match
+        if city and contains(city):
             matches.append(f"City: {city}")
             score += 20.0
         
-        # Check neighborhood matches
-        neighborhoods = location_criteria.get('neighborhoods', [])
+        # Check neighborhood matches (each distinct name scores once)
         for neighborhood in neighborhoods:
-            if self._text_contains_location(normalized_text, neighborhood):
+            if contains(neighborhood):
                 matches.append(f"Neighborhood: {neighborhood}")
                 score += 15.0
         
-        # Check street matches
-        streets = location_criteria.get('streets', [])
+        # Check street matches (each distinct name scores once)
         for street in streets:
-            if self._text_contains_location(normalized_text, street):
+            if contains(street):
                 matches.append(f"Street: {street}")
                 score += 10.0
         
@@ -286,19 +427,51 @@ class ContentAnalyzer:
     
     def _text_contains_location(self, text: str, location: str) -> bool:
         """Check if text contains location (with aliases)"""
-        location_lower = location.lower()
-        
-        # Direct match
-        if location_lower in text:
-            return True
-        
-        # Check aliases
-        aliases = self.location_aliases.get(location, [])
-        for alias in aliases:
-            if alias.lower() in text:
-                return True
+        return any(term in text for term in self._get_location_terms(location))
+    
+    def _get_location_terms(self, location: str) -> Tuple[str, ...]:
+        """Get the lowercased name and aliases of a location"""
+        terms = self._location_terms.get(location)
+        if terms is None:
+            aliases = self.location_aliases.get(location, [])
+            terms = (location.lower(), *(alias.lower() for alias in aliases))
+            self._location_terms[location] = terms
+        return terms
+    
+    def _find_locations(self, text: str, locations: Tuple[str, ...]) -> Optional[Set[str]]:
+        """
+        Find which of the given locations the text names, scanning it once
         
-        return False
+        Returns None when an automaton doesn't apply (pyahocorasick missing, too few
+        terms, or an empty term), in which case callers check each location directly.
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = self._get_cached_result(self._location_automata, locations)
+        if automaton is None:
+            # Several locations can share a term, so each term maps to all its owners
+            owners: Dict[str, Set[str]] = {}
+            for location in locations:
+                for term in self._get_location_terms(location):
+                    owners.setdefault(term, set()).add(location)
+            
+            if len(owners) < self.LOCATION_AUTOMATON_MIN_TERMS or '' in owners:
+                automaton = False
+            else:
+                automaton = ahocorasick.Automaton()
+                for term, term_owners in owners.items():
+                    automaton.add_word(term, frozenset(term_owners))
+                automaton.make_automaton()
+            self._cache_result(self._location_automata, locations, automaton)
+        
+        if automaton is False:
+            return None
+        
+        found: Set[str] = set()
+        for _, term_owners in automaton.iter(text):
+            found |= term_owners
+        return found
     
     def _check_property_type_match(self, normalized_text: str, property_types: List[str], reasons: List[str]) -> Tuple[float, List[str]]:
         """Check property type matching"""
@@ -376,8 +549,7 @@ class ContentAnalyzer:
             normalized_desc = self.normalize_text(listing.description)[:100]
             hash_parts.append(normalized_desc)
         
-        content_string = "|".join(hash_parts)
-        return hashlib.sha256(content_string.encode('utf-8')).hexdigest()
+        return hash_content(hash_parts)
     
     def rank_matches(self, match_results: List[Tuple[ScrapedListing, MatchResult]]) -> List[Tuple[ScrapedListing, MatchResult]]:
         """
@@ -562,13 +734,18 @@ class ContentAnalyzer:
         if not self.use_ai_analysis:
             return self.analyze_listing(listing, profile_criteria)
         
+        cache_key = self._analysis_cache_key(listing, profile_criteria)
+        cached = self._get_cached_result(self._ai_analysis_cache, cache_key)
+        if cached is not None:
+            return cached.copy()
+        
         try:
             # Create analysis request
             request = AnalysisRequest(
-                property_id=listing.id,
+                property_id=listing.listing_id,
                 raw_text=f"{listing.title}\n{listing.description}\n{listing.location}",
                 source_url=listing.url,
-                source_platform=listing.source.value,
+                source_platform=listing.raw_data.get('source'),
                 priority=1
             )
             
@@ -579,12 +756,33 @@ class ContentAnalyzer:
             rule_based_result = self.analyze_listing(listing, profile_criteria)
             
             # Create enhanced match result
-            return self._combine_ai_and_rule_results(analysis, rule_based_result, profile_criteria)
+            result = self._combine_ai_and_rule_results(analysis, rule_based_result, profile_criteria)
+            self._cache_result(self._ai_analysis_cache, cache_key, result.copy())
+            return result
             
         except Exception as e:
             self.logger.error(f"AI analysis failed, falling back to rule-based: {e}")
             return self.analyze_listing(listing, profile_criteria)
     
+    async def analyze_listings_async(self, listings: List[ScrapedListing], profile_criteria: Dict[str, Any]) -> List[MatchResult]:
+        """
+        Analyze a batch of listings concurrently with AI-powered analysis
+        
+        Args:
+            listings: Scraped listings to analyze
+            profile_criteria: User profile search criteria
+            
+        Returns:
+            MatchResult for each listing, in the same order as the input
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_AI_ANALYSES)
+        
+        async def analyze_one(listing: ScrapedListing) -> MatchResult:
+            async with semaphore:
+                return await self.analyze_listing_with_ai(listing, profile_criteria)
+        
+        return await asyncio.gather(*(analyze_one(listing) for listing in listings))
+    
     def _combine_ai_and_rule_results(self, ai_analysis, rule_result: MatchResult, profile_criteria: Dict[str, Any]) -> MatchResult:
         """Combine AI analysis with rule-based results"""
         try:
@@ -11,12 +11,13 @@ This module provides:
 import os
 import logging
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from typing import Iterator, List, Optional, Dict, Any, Set, Union
 from enum import Enum
 
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument
 from pymongo.database import Database
 from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
 from pydantic import BaseModel, Field
 from bson import ObjectId
 from dotenv import load_dotenv
@@ -28,6 +29,9 @@ load_dotenv(override=True)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# MongoDB's error code for an insert that violates a unique index
+DUPLICATE_KEY_ERROR = 11000
+
 class PyObjectId(ObjectId):
     """Custom ObjectId type for Pydantic models"""
     
@@ -129,7 +133,8 @@ class ScannedListing(BaseModel):
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
     listing_id: str  # Platform-specific ID
     source: ListingSource
-    content_hash: str  # SHA256 hash of core content
+    content_hash: str  # Hash of core content
+    content_hash_version: int = 1  # 1: SHA-256, 2: xxh3-64 (see scrapers.base.CONTENT_HASH_VERSION)
     first_seen: datetime = Field(default_factory=datetime.utcnow)
     url: str
     raw_data: Dict[str, Any] = {}  # Store original scraped data
@@ -222,6 +227,10 @@ class DatabaseManager:
             self.user_profiles.create_index("profile_name")
             self.user_profiles.create_index("is_active")
             
+            # Search profiles indexes (the worker loads active profiles and polls for updated ones)
+            self.search_profiles.create_index([("is_active", 1), ("updated_at", 1)])
+            self.search_profiles.create_index("updated_at")
+            
             # Scanned listings indexes
             self.scanned_listings.create_index([("listing_id", 1), ("source", 1)], unique=True)
             self.scanned_listings.create_index("content_hash")
@@ -257,6 +266,24 @@ class DatabaseManager:
             logger.error(f"Failed to create user profile: {e}")
             return None
     
+    def upsert_user_profile(self, profile: UserProfile) -> Optional[str]:
+        """Create a user profile, or update the existing one with the same name"""
+        try:
+            profile.updated_at = datetime.utcnow()
+            fields = profile.dict(by_alias=True, exclude={"id", "created_at"})
+            doc = self.user_profiles.find_one_and_update(
+                {"profile_name": profile.profile_name},
+                {"$set": fields, "$setOnInsert": {"created_at": profile.created_at}},
+                projection={"_id": 1},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            logger.info(f"Upserted user profile: {profile.profile_name}")
+            return str(doc["_id"])
+        except Exception as e:
+            logger.error(f"Failed to upsert user profile: {e}")
+            return None
+    
     def get_user_profile(self, profile_id: str) -> Optional[UserProfile]:
         """Get user profile by ID"""
         try:
@@ -270,12 +297,15 @@ class DatabaseManager:
     
     def get_active_user_profiles(self) -> List[UserProfile]:
         """Get all active user profiles"""
+        return list(self.iter_active_user_profiles())
+    
+    def iter_active_user_profiles(self, limit: int = 0) -> Iterator[UserProfile]:
+        """Yield active user profiles one at a time, at most limit of them (0 for all)"""
         try:
-            docs = self.user_profiles.find({"is_active": True})
-            return [UserProfile(**doc) for doc in docs]
+            for doc in self.user_profiles.find({"is_active": True}).limit(limit):
+                yield UserProfile(**doc)
         except Exception as e:
             logger.error(f"Failed to get active user profiles: {e}")
-            return []
     
     def update_user_profile(self, profile_id: str, updates: Dict[str, Any]) -> bool:
         """Update user profile"""
@@ -304,6 +334,20 @@ class DatabaseManager:
             logger.error(f"Failed to check if listing {listing_id} seen: {e}")
             return False
     
+    def get_scanned_listings(self, listing_ids: List[str], source: Optional[ListingSource] = None) -> Set[str]:
+        """Return the subset of listing IDs that have been seen before (single query)"""
+        if not listing_ids:
+            return set()
+        try:
+            query: Dict[str, Any] = {"listing_id": {"$in": list(listing_ids)}}
+            if source is not None:
+                query["source"] = source.value
+            docs = self.scanned_listings.find(query, {"listing_id": 1, "_id": 0})
+            return {doc["listing_id"] for doc in docs}
+        except Exception as e:
+            logger.error(f"Failed to check scanned listings: {e}")
+            return set()
+    
     def add_scanned_listing(self, listing: ScannedListing) -> Optional[str]:
         """Add new scanned listing"""
         try:
@@ -313,6 +357,26 @@ class DatabaseManager:
             logger.error(f"Failed to add scanned listing {listing.listing_id}: {e}")
             return None
     
+    def add_scanned_listings(self, listings: List[ScannedListing]) -> int:
+        """Add multiple scanned listings in one batch, skipping duplicates"""
+        if not listings:
+            return 0
+        try:
+            result = self.scanned_listings.insert_many(
+                [listing.dict(by_alias=True, exclude={"id"}) for listing in listings],
+                ordered=False
+            )
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Duplicate key errors are expected for listings seen concurrently; any other error is logged
+            errors = [error for error in e.details.get("writeErrors", []) if error.get("code") != DUPLICATE_KEY_ERROR]
+            if errors:
+                logger.error(f"Failed to add some scanned listings: {errors}")
+            return e.details.get("nInserted", 0)
+        except Exception as e:
+            logger.error(f"Failed to add scanned listings: {e}")
+            return 0
+    
     # Notification CRUD Operations
     
     def log_sent_notification(self, notification: SentNotification) -> Optional[str]:
@@ -324,6 +388,23 @@ class DatabaseManager:
             logger.error(f"Failed to log notification: {e}")
             return None
     
+    def log_sent_notifications(self, notifications: List[SentNotification]) -> int:
+        """Log multiple sent notifications in one batch"""
+        if not notifications:
+            return 0
+        try:
+            result = self.sent_notifications.insert_many(
+                [notification.dict(by_alias=True, exclude={"id"}) for notification in notifications],
+                ordered=False
+            )
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            logger.error(f"Failed to log some notifications: {e.details.get('writeErrors')}")
+            return e.details.get("nInserted", 0)
+        except Exception as e:
+            logger.error(f"Failed to log notifications: {e}")
+            return 0
+    
     def get_recent_notifications(self, limit: int = 50) -> List[SentNotification]:
         """Get recent notifications"""
         try:
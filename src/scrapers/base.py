@@ -12,6 +12,23 @@ from urllib.parse import urljoin, urlparse
 
 logger = logging.getLogger(__name__)
 
+# xxh3 hashes many times faster than SHA-256; content hashes only detect duplicates
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Content hash scheme stored with scanned listings: 1 is SHA-256, 2 is xxh3-64
+CONTENT_HASH_VERSION = 2 if XXHASH_AVAILABLE else 1
+
+def hash_content(content_parts: List[str]) -> str:
+    """Hash the identifying parts of a listing with the current content hash scheme"""
+    content = "|".join(content_parts).encode('utf-8')
+    if XXHASH_AVAILABLE:
+        return format(xxhash.xxh3_64_intdigest(content), '016x')
+    return hashlib.sha256(content).hexdigest()
+
 @dataclass
 class ScrapedListing:
     """Raw scraped listing data"""
@@ -35,7 +52,7 @@ class ScrapedListing:
             self.raw_data = {}
     
     def generate_content_hash(self) -> str:
-        """Generate SHA256 hash of core content for duplicate detection"""
+        """Generate hash of core content for duplicate detection"""
         # Use key fields that are unlikely to change for the same property
         content_parts = [
             str(self.price or 0),
@@ -43,8 +60,7 @@ class ScrapedListing:
             self.location.strip().lower(),
             self.title.strip().lower()[:100],  # First 100 chars of title
         ]
-        content_string = "|".join(content_parts)
-        return hashlib.sha256(content_string.encode('utf-8')).hexdigest()
+        return hash_content(content_parts)
 
 class BaseScraper(ABC):
     """Abstract base class for property listing scrapers"""
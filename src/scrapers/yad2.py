@@ -8,12 +8,13 @@ using requests and BeautifulSoup for HTML parsing.
 import logging
 import time
 import random
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from urllib.parse import urlencode, urlparse, parse_qs
 import re
 import os
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup, Tag
 
 from .base import BaseScraper, ScrapedListing
@@ -26,10 +27,16 @@ class Yad2Scraper(BaseScraper):
     BASE_URL = "https://www.yad2.co.il"
     SEARCH_BASE = "https://www.yad2.co.il/realestate/rent"
     
-    def __init__(self):
+    def __init__(self, pool_maxsize: int = 10):
         super().__init__("Yad2")
         self.session = requests.Session()
         
+        # Keep up to pool_maxsize connections alive, so concurrent scrapes from
+        # several threads reuse them instead of reconnecting
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Set realistic headers to avoid blocking
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -134,7 +141,20 @@ class Yad2Scraper(BaseScraper):
         Returns:
             List of scraped listings
         """
-        listings = []
+        return list(self.iter_listings(search_url, max_listings))
+    
+    def iter_listings(self, search_url: str, max_listings: int = 50) -> Iterator[ScrapedListing]:
+        """
+        Yield property listings from Yad2 search results as each one is parsed
+        
+        Args:
+            search_url: Yad2 search URL to scrape
+            max_listings: Maximum number of listings to yield
+            
+        Yields:
+            Scraped listings, in page order
+        """
+        count = 0
         
         try:
             self.logger.info("Scraping Yad2 listings from: %s", search_url)
@@ -153,11 +173,11 @@ class Yad2Scraper(BaseScraper):
                 firecrawl_api_key = os.getenv("FIRECRAWL_API_KEY")
                 if firecrawl_api_key:
                     self.logger.info("Attempting to bypass protection with Firecrawl...")
-                    return self._scrape_with_firecrawl_fallback(search_url, max_listings)
+                    yield from self._scrape_with_firecrawl_fallback(search_url, max_listings)
                 else:
                     self.logger.error("No Firecrawl API key available - cannot bypass protection")
                     self.logger.info("To enable advanced scraping, run: python setup_advanced_scraping.py")
-                    return listings
+                return
             
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -170,8 +190,9 @@ class Yad2Scraper(BaseScraper):
                 try:
                     listing = self.parse_listing_details(container)
                     if listing and self.validate_listing(listing):
-                        listings.append(listing)
                         self.logger.debug("Parsed listing %d: %s", i+1, listing.listing_id)
+                        count += 1
+                        yield listing
                     else:
                         self.logger.debug("Skipped invalid listing %d", i+1)
                         
@@ -179,14 +200,12 @@ class Yad2Scraper(BaseScraper):
                     self.logger.warning("Error parsing listing %d: %s", i+1, str(e))
                     continue
             
-            self.logger.info("Successfully scraped %d valid listings", len(listings))
+            self.logger.info("Successfully scraped %d valid listings", count)
             
         except requests.RequestException as e:
             self.logger.error("HTTP error scraping Yad2: %s", str(e))
         except Exception as e:
             self.logger.error("Unexpected error scraping Yad2: %s", str(e))
-        
-        return listings
     
     def _detect_shieldsquare_protection(self, html_content: str) -> bool:
         """Detect if page is showing ShieldSquare protection"""
@@ -3,11 +3,18 @@ Command and message handlers for the Telegram bot
 """
 
 import logging
+import os
+import sys
 from typing import Dict, Any
 from datetime import datetime
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
+# Handlers import the db module from the src directory; add it once at import
+SRC_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRC_PATH not in sys.path:
+    sys.path.append(SRC_PATH)
+
 logger = logging.getLogger(__name__)
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -417,9 +424,6 @@ Your profile is now active and you'll receive notifications for matching propert
         )
         
         # Save to database
-        import sys
-        import os
-        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         from db import get_db
         
         try:
@@ -466,9 +470,6 @@ async def handle_view_profiles(update: Update, context: ContextTypes.DEFAULT_TYP
     
     # TODO: Get real profiles from database
     # For now, show mock data
-    import sys
-    import os
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db import get_db
     
     try:
@@ -692,9 +693,6 @@ async def finalize_facebook_setup(update: Update, context: ContextTypes.DEFAULT_
     logger.info(f"Finalizing Facebook setup for chat {chat_id}")
     
     from .bot import get_bot
-    import sys
-    import os
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db import get_db
     
     bot = get_bot()
@@ -790,9 +788,6 @@ async def finalize_facebook_setup_callback(query, context: ContextTypes.DEFAULT_
     logger.info(f"Finalizing Facebook setup via callback for chat {chat_id}")
     
     from .bot import get_bot
-    import sys
-    import os
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db import get_db
     
     bot = get_bot()
@@ -20,7 +20,9 @@ import logging
 from pathlib import Path
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+SRC_PATH = str(Path(__file__).resolve().parent.parent)
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 from telegram_bot.bot import RealtyBot, init_bot
 from telegram_bot import setup_handlers
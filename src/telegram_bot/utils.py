@@ -8,6 +8,24 @@ from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
 logger = logging.getLogger(__name__)
 
+# Emoji and label shown for each match confidence; anything else counts as low
+CONFIDENCE_DISPLAY = {
+    'high': ('🔥', 'HIGH CONFIDENCE'),
+    'medium': ('⭐', 'MEDIUM CONFIDENCE'),
+}
+LOW_CONFIDENCE_DISPLAY = ('👍', 'LOW CONFIDENCE')
+
+# Telegram HTML layout of a property match notification
+PROPERTY_MESSAGE_TEMPLATE = """{emoji} <b>New Property Match!</b>
+
+🏠 <b>{title}</b>
+💰 <b>Price:</b> {price_text}
+🛏️ <b>Rooms:</b> {rooms_text}
+📍 <b>Location:</b> {location}
+🎯 <b>Match Score:</b> {score:.1f}/100 ({confidence_text})
+
+{description}{reasons_text}"""
+
 def format_property_message(property_data: Dict[str, Any]) -> str:
     """
     Format a property listing for Telegram message
@@ -29,15 +47,7 @@ def format_property_message(property_data: Dict[str, Any]) -> str:
     score = property_data.get('match_score', 0)
     
     # Choose emoji based on confidence
-    if confidence == 'high':
-        emoji = '🔥'
-        confidence_text = 'HIGH CONFIDENCE'
-    elif confidence == 'medium':
-        emoji = '⭐'
-        confidence_text = 'MEDIUM CONFIDENCE'
-    else:
-        emoji = '👍'
-        confidence_text = 'LOW CONFIDENCE'
+    emoji, confidence_text = CONFIDENCE_DISPLAY.get(confidence, LOW_CONFIDENCE_DISPLAY)
     
     # Format price
     price_text = f"{price:,} ILS/month" if price else "Price not specified"
@@ -57,19 +67,17 @@ def format_property_message(property_data: Dict[str, Any]) -> str:
                       "\n".join(f"• {reason}" for reason in reasons)
     
     # Build the message
-    message = f"""
-{emoji} <b>New Property Match!</b>
-
-🏠 <b>{title}</b>
-💰 <b>Price:</b> {price_text}
-🛏️ <b>Rooms:</b> {rooms_text}
-📍 <b>Location:</b> {location}
-🎯 <b>Match Score:</b> {score:.1f}/100 ({confidence_text})
-
-{description}{reasons_text}
-""".strip()
-    
-    return message
+    return PROPERTY_MESSAGE_TEMPLATE.format(
+        emoji=emoji,
+        title=title,
+        price_text=price_text,
+        rooms_text=rooms_text,
+        location=location,
+        score=score,
+        confidence_text=confidence_text,
+        description=description,
+        reasons_text=reasons_text
+    ).rstrip()
 
 def format_notification_summary(notifications: list) -> str:
     """
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Tests for the HTTP clients shared between AI agent managers
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai_agents.agent_manager import AIAgentManager
+
+def test_closing_one_manager_keeps_shared_pool_open():
+    """The shared pool stays open until the last manager using it closes"""
+    async def run():
+        first, second = AIAgentManager(), AIAgentManager()
+        client = first.http_client
+        assert second.http_client is client
+
+        await first.close()
+        assert not client.is_closed
+
+        await second.close()
+        assert client.is_closed
+
+    asyncio.run(run())
+
+def test_each_event_loop_gets_its_own_pool():
+    """A new event loop never reuses connections opened on a previous one"""
+    async def get_client():
+        return AIAgentManager().http_client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert second is not first
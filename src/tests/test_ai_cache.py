@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for the semantic analysis cache
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai_agents.cache import SemanticCache
+from ai_agents.models import AIProvider, AIResponse, AnalysisRequest, PropertyAnalysis
+
+LISTING_TEXT = "דירת 3 חדרים בדיזנגוף 45 תל אביב, 6,500 ₪ לחודש, מרפסת ומעלית, קומה 2"
+
+def create_analysis(text: str) -> PropertyAnalysis:
+    """Create an analysis as the agent manager would produce it"""
+    response = AIResponse(
+        provider=AIProvider.OPENAI, content="{}", confidence=0.9, processing_time=1.0,
+        tokens_used=10, model_used="test", timestamp=datetime.utcnow(), metadata={}
+    )
+    return PropertyAnalysis(property_id="p1", original_text=text, rooms=3, price=6500,
+                            consensus_score=0.9, ai_responses=[response])
+
+def test_near_duplicate_text_hits():
+    """A re-posted listing with a small wording change reuses the analysis"""
+    cache = SemanticCache()
+    cache.put(AnalysisRequest("p1", LISTING_TEXT), create_analysis(LISTING_TEXT))
+
+    cached = cache.get(AnalysisRequest("p2", LISTING_TEXT + "!"))
+
+    assert cached is not None
+    assert cached.property_id == "p2"
+    assert cached.price == 6500
+
+def test_different_numbers_miss():
+    """Listings differing only in price or rooms never share an analysis"""
+    cache = SemanticCache()
+    cache.put(AnalysisRequest("p1", LISTING_TEXT), create_analysis(LISTING_TEXT))
+
+    assert cache.get(AnalysisRequest("p2", LISTING_TEXT.replace("6,500", "7,200"))) is None
+    assert cache.get(AnalysisRequest("p3", LISTING_TEXT.replace("3 חדרים", "4 חדרים"))) is None
+
+def test_eviction_keeps_index_consistent():
+    """Evicted entries are no longer found, by digest or by similarity"""
+    cache = SemanticCache(max_entries=2)
+    texts = [f"listing number {i} in tel aviv" for i in range(3)]
+    for i, text in enumerate(texts):
+        cache.put(AnalysisRequest(str(i), text), create_analysis(text))
+
+    assert len(cache) == 2
+    assert cache.get(AnalysisRequest("0", texts[0])) is None
+    assert cache.get(AnalysisRequest("2", texts[2])) is not None
+
+def test_save_and_load_json(tmp_path):
+    """A saved cache is plain JSON and loads back the same analyses"""
+    path = tmp_path / "analysis_cache.json"
+    cache = SemanticCache(path=str(path))
+    cache.put(AnalysisRequest("p1", LISTING_TEXT), create_analysis(LISTING_TEXT))
+    assert not path.exists()
+
+    cache.save()
+    loaded = SemanticCache(path=str(path))
+    cached = loaded.get(AnalysisRequest("p2", LISTING_TEXT))
+
+    assert path.read_text(encoding="utf-8").startswith("[")
+    assert cached.price == 6500
+    assert cached.ai_responses[0].provider == AIProvider.OPENAI
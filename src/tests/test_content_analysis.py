@@ -239,6 +239,95 @@ def test_duplicate_detection():
     
     return True
 
+async def test_batch_analysis():
+    """Test batched analysis keeps input order and matches single analysis"""
+    print("\n📦 Testing Batch Analysis")
+    print("=" * 40)
+    
+    analyzer = ContentAnalyzer()
+    analyzer.use_ai_analysis = False  # Rule-based only, no network calls
+    profile = create_test_profile()
+    listings = create_test_listings()
+    
+    results = await analyzer.analyze_listings_async(listings, profile)
+    
+    assert len(results) == len(listings)
+    for listing, result in zip(listings, results):
+        expected = analyzer.analyze_listing(listing, profile)
+        assert result.is_match == expected.is_match
+        assert result.score == expected.score
+    
+    print(f"✅ Batch analyzed {len(results)} listings")
+    return True
+
+def test_analysis_cache():
+    """Test repeated analysis of the same listing is served from cache"""
+    print("\n🗄️ Testing Analysis Cache")
+    print("=" * 40)
+    
+    analyzer = ContentAnalyzer()
+    profile = create_test_profile()
+    listing = create_test_listings()[0]
+    
+    first = analyzer.analyze_listing(listing, profile)
+    second = analyzer.analyze_listing(listing, profile)
+    assert second == first
+    assert second is not first
+    
+    # Changing a returned result must not change later cache hits
+    second.reasons.append("changed by caller")
+    second.keyword_matches.clear()
+    assert analyzer.analyze_listing(listing, profile) == first
+    
+    # Different criteria must not reuse the cached result
+    other_profile = dict(profile, price={'min': 100, 'max': 200})
+    third = analyzer.analyze_listing(listing, other_profile)
+    assert not third.price_match
+    
+    analyzer.clear_analysis_cache()
+    assert len(analyzer._analysis_cache) == 0
+    assert analyzer.analyze_listing(listing, profile) == first
+    
+    print("✅ Cached results reused for identical listing and profile")
+    return True
+
+def test_numeric_extraction():
+    """Test price, rooms and size are extracted from listing text"""
+    print("\n🔢 Testing Numeric Field Extraction")
+    print("=" * 40)
+    
+    analyzer = ContentAnalyzer()
+    
+    fields = analyzer.extract_numeric_fields('דירת 3 חדרים, 80 מ"ר, קומה 2. מחיר: 2,500,000 שקל')
+    assert fields == {'price': 2500000.0, 'rooms': 3.0, 'size': 80.0}
+    
+    fields = analyzer.extract_numeric_fields("2.5 חדרים ב-5500 ₪ לחודש")
+    assert fields == {'price': 5500.0, 'rooms': 2.5, 'size': None}
+    
+    # The first amount of each kind is taken, and unrelated numbers are ignored
+    fields = analyzer.extract_numeric_fields("קומה 4, 3.5 חדרים, 7,200 ₪, ארנונה 450 ₪, 95 מ'ר")
+    assert fields == {'price': 7200.0, 'rooms': 3.5, 'size': 95.0}
+    
+    assert analyzer.extract_numeric_fields("") == {'price': None, 'rooms': None, 'size': None}
+    assert analyzer.extract_numeric_fields("דירה יפה בתל אביב") == {'price': None, 'rooms': None, 'size': None}
+    
+    # Rule-based matching uses the scraped price and rooms only; amounts in the
+    # text (arnona, deposit) are not mistaken for the rent
+    listing = ScrapedListing(
+        listing_id="text_only_1",
+        title="דירת 3 חדרים בתל אביב",
+        description="ארנונה 9,000 ש\"ח לשנה",
+        location="תל אביב"
+    )
+    result = analyzer.analyze_listing(listing, create_test_profile())
+    assert result.price_match
+    assert result.rooms_match
+    assert "Price not specified" in result.reasons
+    assert "Room count not specified" in result.reasons
+    
+    print("✅ Numeric fields extracted in a single pass")
+    return True
+
 def test_edge_cases():
     """Test edge cases and error handling"""
     print("\n⚠️ Testing Edge Cases")
@@ -19,7 +19,9 @@ import logging
 from pathlib import Path
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+SRC_PATH = str(Path(__file__).resolve().parent.parent)
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
 # Configure logging
 logging.basicConfig(
@@ -68,6 +70,25 @@ def run_server(host: str = "127.0.0.1", port: int = 8000, reload: bool = False):
         logger.error(f"❌ Failed to start server: {e}")
         return False
 
+def create_server(host: str = "127.0.0.1", port: int = 8000):
+    """Create a uvicorn server for the dashboard that runs in the caller's event loop"""
+    import uvicorn
+    from web import get_app
+    
+    config = uvicorn.Config(
+        get_app(),
+        host=host,
+        port=port,
+        loop="asyncio",
+        log_level="info"
+    )
+    return uvicorn.Server(config)
+
+async def serve(host: str = "127.0.0.1", port: int = 8000):
+    """Serve the dashboard in-process until the server is stopped"""
+    logger.info(f"🌐 Serving RealtyScanner Web Dashboard at http://{host}:{port}")
+    await create_server(host, port).serve()
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="RealtyScanner Web Dashboard Server")
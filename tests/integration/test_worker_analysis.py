@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Integration test for the background worker's listing analysis
+
+Runs RealtyWorker.analyze_listings end to end with scraped listings,
+a normalized profile and the rule-based content analyzer, sends matches
+through the notification dispatcher, and checks how scan results drive
+the scan interval.
+"""
+
+import importlib.util
+import logging
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from scrapers.base import ScrapedListing
+from analysis import ContentAnalyzer
+from notifications.base import NotificationResult, NotificationStatus
+from notifications.channels import TelegramChannel
+from notifications.dispatcher import NotificationDispatcher
+
+WORKER_SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "run_worker.py"
+
+@pytest.fixture
+def run_worker(tmp_path, monkeypatch):
+    """Load the worker script without starting it, logging to a temporary directory"""
+    monkeypatch.setenv('LOG_DIR', str(tmp_path))
+    spec = importlib.util.spec_from_file_location("run_worker", WORKER_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    module.log_listener.stop()
+
+def create_worker(run_worker, content_analyzer):
+    """Create a worker with in-memory state instead of database-backed components"""
+    worker = run_worker.RealtyWorker.__new__(run_worker.RealtyWorker)
+    worker.seen_listing_ids = OrderedDict()
+    worker.profile_filters = {}
+    worker.analysis_verdicts = OrderedDict()
+    worker.profile_dispatchers = {}
+    worker.notification_dispatcher_class = NotificationDispatcher
+    worker.notification_buffer = []
+    worker.notification_buffer_started = None
+    worker.__dict__['content_analyzer'] = content_analyzer
+    return worker
+
+def create_profile(run_worker):
+    """Create a profile the way it is stored in the database"""
+    return run_worker.normalize_profile({
+        '_id': 'profile_1',
+        'name': 'Dizengoff 2 rooms',
+        'price_range': {'min': 4000, 'max': 6500},
+        'rooms_range': {'min': 2, 'max': 3},
+        'location': {'city': 'תל אביב - יפו', 'neighborhoods': ['דיזנגוף']},
+        'notificationChannels': {'telegram': {'enabled': True, 'chatId': '123456'}},
+        'updated_at': 1
+    })
+
+@pytest.fixture
+def telegram_sends(monkeypatch):
+    """Record Telegram sends instead of calling the bot, answering with the queued statuses"""
+    sends = []
+    statuses = []
+    def send(self, message, recipient):
+        sends.append((message, recipient))
+        status = statuses.pop(0) if statuses else NotificationStatus.SUCCESS
+        return NotificationResult(status=status)
+    monkeypatch.setattr(TelegramChannel, 'send', send)
+    return sends, statuses
+
+def create_test_listings():
+    """Create one listing matching the profile and two that miss it"""
+    return [
+        ScrapedListing(
+            listing_id="match",
+            title="דירת 2 חדרים בדיזנגוף - מרוהטת ומשופצת",
+            price=5800,
+            rooms=2.0,
+            location="דיזנגוף 45, תל אביב - יפו",
+            description="דירה יפה ומרוהטת במרכז דיזנגוף. מיזוג אוויר, מרפסת.",
+            raw_data={'source': 'Yad2'}
+        ),
+        ScrapedListing(
+            listing_id="too_expensive",
+            title="דירת 3 חדרים בדיזנגוף",
+            price=9500,
+            rooms=3.0,
+            location="דיזנגוף 100, תל אביב - יפו",
+            raw_data={'source': 'Yad2'}
+        ),
+        ScrapedListing(
+            listing_id="elsewhere",
+            title="דירת 2 חדרים בחיפה",
+            price=4500,
+            rooms=2.0,
+            location="הדר, חיפה",
+            raw_data={'source': 'Yad2'}
+        ),
+    ]
+
+def test_profile_criteria_use_analyzer_field_names(run_worker):
+    """The analyzer criteria carry the profile's ranges under the names it reads"""
+    profile = create_profile(run_worker)
+
+    assert profile.criteria['price'] == {'min': 4000, 'max': 6500}
+    assert profile.criteria['rooms'] == {'min': 2, 'max': 3}
+    assert profile.criteria['location_criteria']['city'] == 'תל אביב - יפו'
+
+async def test_analyze_listings_end_to_end(run_worker):
+    """Listings pass the basic filter and the content analyzer, and only real matches remain"""
+    analyzer = ContentAnalyzer()
+    analyzer.use_ai_analysis = False
+    worker = create_worker(run_worker, analyzer)
+    profile = create_profile(run_worker)
+
+    matches = await worker.analyze_listings(profile, create_test_listings())
+
+    assert [listing.listing_id for listing in matches] == ["match"]
+
+async def test_analyze_listings_skips_notified_listings(run_worker):
+    """A listing already notified about for the profile is not matched again"""
+    analyzer = ContentAnalyzer()
+    analyzer.use_ai_analysis = False
+    worker = create_worker(run_worker, analyzer)
+    profile = create_profile(run_worker)
+    worker.remember_notified_listing(profile.id, "match")
+
+    matches = await worker.analyze_listings(profile, create_test_listings())
+
+    assert matches == []
+
+async def test_analyze_listings_reuses_verdicts(run_worker):
+    """Listings seen before for the same profile revision are not analyzed again"""
+    analyzer = ContentAnalyzer()
+    analyzer.use_ai_analysis = False
+    worker = create_worker(run_worker, analyzer)
+    profile = create_profile(run_worker)
+    await worker.analyze_listings(profile, create_test_listings())
+
+    async def fail_analysis(listings, profile_criteria):
+        raise AssertionError("cached listings were analyzed again")
+    analyzer.analyze_listings_async = fail_analysis
+    matches = await worker.analyze_listings(profile, create_test_listings())
+
+    assert [listing.listing_id for listing in matches] == ["match"]
+
+def test_notified_listings_are_bounded(run_worker, monkeypatch):
+    """Beyond the limit, the least recently notified listings are forgotten"""
+    monkeypatch.setattr(run_worker, 'SEEN_LISTINGS_LIMIT', 2)
+    worker = create_worker(run_worker, None)
+
+    for listing_id in ("a", "b", "c"):
+        worker.remember_notified_listing("profile_1", listing_id)
+
+    assert list(worker.seen_listing_ids) == [("profile_1", "b"), ("profile_1", "c")]
+
+async def test_send_notification_through_dispatcher(run_worker, telegram_sends):
+    """Matches are combined into one message and sent through the profile's channels"""
+    sends, _ = telegram_sends
+    worker = create_worker(run_worker, None)
+    profile = create_profile(run_worker)
+    listings = create_test_listings()[:2]
+
+    delivered = await worker.send_notification(profile, listings)
+
+    assert delivered == listings
+    assert len(sends) == 1
+    message, recipient = sends[0]
+    assert recipient == '123456'
+    assert "דיזנגוף 45" in message.content and "דיזנגוף 100" in message.content
+
+async def test_failed_notifications_are_retried(run_worker, telegram_sends):
+    """Listings no channel delivered are neither remembered nor logged, so they are sent again"""
+    sends, statuses = telegram_sends
+    worker = create_worker(run_worker, None)
+    profile = create_profile(run_worker)
+    listing = create_test_listings()[0]
+
+    statuses.append(NotificationStatus.FAILED)
+    assert await worker.send_notification(profile, [listing]) == []
+    assert (profile.id, listing.listing_id) not in worker.seen_listing_ids
+    assert worker.notification_buffer == []
+
+    assert await worker.send_notification(profile, [listing]) == [listing]
+    assert (profile.id, listing.listing_id) in worker.seen_listing_ids
+    assert [doc['listingId'] for doc in worker.notification_buffer] == [listing.listing_id]
+    assert len(sends) == 2
+
+def test_format_notification_message(run_worker):
+    """Notification text is built from the scraped listing's fields"""
+    worker = create_worker(run_worker, None)
+
+    message = worker.format_notification_message(create_test_listings()[0])
+
+    assert "דיזנגוף 45" in message
+    assert "5800" in message
+    assert "2.0" in message
+
+def test_failed_cycles_do_not_back_off(run_worker):
+    """Only cycles whose scans all succeeded without matches lengthen the scan interval"""
+    worker = create_worker(run_worker, None)
+    worker.min_scan_interval = 300
+    worker.max_scan_interval = 1800
+    worker.scan_interval = 300
+    worker.empty_scan_streak = 0
+
+    worker.adapt_scan_interval(0, failures=1)
+    assert worker.empty_scan_streak == 0
+    assert worker.scan_interval == 300
+
+    worker.adapt_scan_interval(0)
+    assert worker.empty_scan_streak == 1
+    assert worker.scan_interval > 300
+
+    worker.adapt_scan_interval(2, failures=1)
+    assert worker.empty_scan_streak == 0
+    assert worker.scan_interval < 600
+
+async def test_idle_backoff_is_not_reported_as_stale(run_worker, caplog):
+    """A scan interval backed off past STALE_SCAN_SECONDS doesn't make health checks warn"""
+    worker = create_worker(run_worker, None)
+    worker.health_check_interval = 60
+    worker.last_db_ok = time.monotonic()
+    worker.scan_interval = 1800
+    worker.last_scan = time.monotonic() - 1000
+
+    with caplog.at_level(logging.WARNING):
+        assert await worker.health_check()
+    assert "No scan for" not in caplog.text
+
+    worker.last_scan = time.monotonic() - 4000
+    with caplog.at_level(logging.WARNING):
+        await worker.health_check()
+    assert "No scan for" in caplog.text